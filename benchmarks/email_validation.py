@@ -0,0 +1,62 @@
+"""
+Measures the time taken to validate a list of email addresses, comparing the precompiled
+pattern and the validate_addresses batch with the character scans the validator used before.
+
+    python -m benchmarks.email_validation [count]
+"""
+import sys
+import timeit
+
+from socketlabs.injectionapi.core.stringextension import StringExtension
+
+
+def scan_is_valid_email_address(email_address: str):
+    """
+    is_valid_email_address as it was before: split on '@', then scan the string once per invalid character
+    """
+    if email_address is None:
+        return False
+    if len(email_address) > 320:
+        return False
+    parts = email_address.split('@')
+    if len(parts) != 2:
+        return False
+    if len(parts[0].strip()) < 1:
+        return False
+    if len(parts[1].strip()) < 1:
+        return False
+    badChars = list(StringExtension.find_character_in_string(email_address, ","))
+    badChars.extend(list(StringExtension.find_character_in_string(email_address, ' ')))
+    badChars.extend(list(StringExtension.find_character_in_string(email_address, ';')))
+    return len(badChars) == 0
+
+
+def measure(validate, addresses: list):
+    """
+    Get the best time of a few runs of validating the addresses
+    :param validate: the function validating the list of addresses
+    :type validate: function
+    :param addresses: the email addresses
+    :type addresses: list
+    :return the seconds taken
+    :rtype float
+    """
+    return min(timeit.repeat(lambda: validate(addresses), number=1, repeat=5))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    addresses = ["recipient{0}@example{1}.com".format(i, i % 100) for i in range(count)]
+    before = measure(lambda a: [scan_is_valid_email_address(e) for e in a], addresses)
+    single = measure(lambda a: [StringExtension.is_valid_email_address(e) for e in a], addresses)
+    batch = measure(StringExtension.validate_addresses, addresses)
+
+    print("addresses:                {0}".format(count))
+    print("character scans:          {0:.1f} ms".format(before * 1000))
+    print("is_valid_email_address:   {0:.1f} ms".format(single * 1000))
+    print("validate_addresses:       {0:.1f} ms".format(batch * 1000))
+    print("speedup:                  {0:.1f}x".format(before / batch))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+import pytest
+
+from socketlabs.injectionapi.core.injectionresponseparser import InjectionResponseParser
+
+from builders import build_response
+
+
+@pytest.mark.parametrize("rejected", [0, 1, 50])
+def bench_parse(benchmark, rejected):
+    response = build_response(rejected)
+
+    benchmark(InjectionResponseParser.parse, response, 200)
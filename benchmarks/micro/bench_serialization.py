@@ -0,0 +1,60 @@
+import pytest
+
+from socketlabs.injectionapi.core.injectionrequestfactory import InjectionRequestFactory
+from socketlabs.injectionapi.core.injectionrequestserializer import InjectionRequestSerializer
+
+from builders import ATTACHMENTS, MERGE_FIELDS, RECIPIENTS, build_basic_message, build_bulk_message
+
+
+@pytest.mark.parametrize("attachments", ATTACHMENTS)
+@pytest.mark.parametrize("recipients", RECIPIENTS)
+def bench_generate_request_basic(benchmark, recipients, attachments):
+    message = build_basic_message(recipients, attachments)
+    factory = InjectionRequestFactory(1, "api-key")
+
+    benchmark(factory.generate_request, message)
+
+
+@pytest.mark.parametrize("merge_fields", MERGE_FIELDS)
+@pytest.mark.parametrize("recipients", RECIPIENTS)
+def bench_generate_request_bulk(benchmark, recipients, merge_fields):
+    message = build_bulk_message(recipients, merge_fields)
+    factory = InjectionRequestFactory(1, "api-key")
+
+    benchmark(factory.generate_request, message)
+
+
+@pytest.mark.parametrize("attachments", ATTACHMENTS)
+@pytest.mark.parametrize("recipients", RECIPIENTS)
+def bench_message_json_to_json(benchmark, recipients, attachments):
+    message_json = InjectionRequestFactory(1, "api-key").generate_request(
+        build_basic_message(recipients, attachments)).messages[0]
+
+    benchmark(message_json.to_json)
+
+
+@pytest.mark.parametrize("merge_fields", MERGE_FIELDS)
+@pytest.mark.parametrize("recipients", RECIPIENTS)
+def bench_merge_data_json_to_json(benchmark, recipients, merge_fields):
+    merge_data_json = InjectionRequestFactory(1, "api-key").generate_request(
+        build_bulk_message(recipients, merge_fields)).messages[0].merge_data
+
+    benchmark(merge_data_json.to_json)
+
+
+@pytest.mark.parametrize("attachments", ATTACHMENTS)
+@pytest.mark.parametrize("recipients", RECIPIENTS)
+def bench_serialize_basic(benchmark, recipients, attachments):
+    message = build_basic_message(recipients, attachments)
+    serializer = InjectionRequestSerializer(1, "api-key")
+
+    benchmark(lambda: serializer.serialize(message).to_bytes())
+
+
+@pytest.mark.parametrize("merge_fields", MERGE_FIELDS)
+@pytest.mark.parametrize("recipients", RECIPIENTS)
+def bench_serialize_bulk(benchmark, recipients, merge_fields):
+    message = build_bulk_message(recipients, merge_fields)
+    serializer = InjectionRequestSerializer(1, "api-key")
+
+    benchmark(lambda: serializer.serialize(message).to_bytes())
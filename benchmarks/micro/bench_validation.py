@@ -0,0 +1,35 @@
+import pytest
+
+from socketlabs.injectionapi.core.sendvalidator import SendValidator
+from socketlabs.injectionapi.core.stringextension import StringExtension
+
+from builders import ATTACHMENTS, MERGE_FIELDS, RECIPIENTS, build_basic_message, build_bulk_message
+
+
+@pytest.mark.parametrize("attachments", ATTACHMENTS)
+@pytest.mark.parametrize("recipients", RECIPIENTS)
+def bench_validate_message_basic(benchmark, recipients, attachments):
+    message = build_basic_message(recipients, attachments)
+
+    benchmark(SendValidator.validate_message, message)
+
+
+@pytest.mark.parametrize("merge_fields", MERGE_FIELDS)
+@pytest.mark.parametrize("recipients", RECIPIENTS)
+def bench_validate_message_bulk(benchmark, recipients, merge_fields):
+    message = build_bulk_message(recipients, merge_fields)
+
+    benchmark(SendValidator.validate_message, message)
+
+
+@pytest.mark.parametrize("email_address", ["recipient@example.com", "recipient" * 30 + "@example.com",
+                                           "not an email address"], ids=["short", "long", "invalid"])
+def bench_is_valid_email_address(benchmark, email_address):
+    benchmark(StringExtension.is_valid_email_address, email_address)
+
+
+@pytest.mark.parametrize("count", [50, 1000])
+def bench_validate_addresses(benchmark, count):
+    addresses = ["recipient{0}@example.com".format(index) for index in range(count)]
+
+    benchmark(StringExtension.validate_addresses, addresses)
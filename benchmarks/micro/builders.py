@@ -0,0 +1,63 @@
+"""
+Messages and responses of the sizes the micro-benchmarks are parametrized over
+"""
+import json
+
+from socketlabs.injectionapi.message.attachment import Attachment
+from socketlabs.injectionapi.message.basicmessage import BasicMessage
+from socketlabs.injectionapi.message.bulkmessage import BulkMessage
+from socketlabs.injectionapi.message.emailaddress import EmailAddress
+
+RECIPIENTS = [1, 50]
+ATTACHMENTS = [0, 1, 10]
+MERGE_FIELDS = [0, 10, 100]
+
+ATTACHMENT_CONTENT = bytes(range(256)) * 128
+
+
+def build_basic_message(recipients: int, attachments: int):
+    message = BasicMessage()
+    message.subject = "Micro-benchmark"
+    message.html_body = "<html><body><h1>Micro-benchmark</h1><p>{0}</p></body></html>".format("x" * 1024)
+    message.plain_text_body = "Micro-benchmark " + "x" * 1024
+    message.from_email_address = EmailAddress("from@example.com", "Benchmark")
+    message.reply_to_email_address = EmailAddress("reply@example.com")
+    for index in range(recipients):
+        message.add_to_email_address("recipient{0}@example.com".format(index), "Recipient {0}".format(index))
+    for index in range(attachments):
+        message.add_attachment(Attachment("file{0}.bin".format(index), "application/octet-stream",
+                                          content=ATTACHMENT_CONTENT))
+    message.add_custom_header("X-Benchmark", "micro")
+    message.add_metadata("benchmark", "micro")
+    return message
+
+
+def build_bulk_message(recipients: int, merge_fields: int):
+    message = BulkMessage()
+    message.subject = "Micro-benchmark"
+    message.html_body = "<html><body><p>%%Field0%%</p></body></html>"
+    message.from_email_address = EmailAddress("from@example.com", "Benchmark")
+    message.add_global_merge_data("Campaign", "Micro-benchmark")
+    for index in range(recipients):
+        merge_data = {"Field{0}".format(field): "Value {0}.{1}".format(index, field) for field in range(merge_fields)}
+        message.add_to_recipient("recipient{0}@example.com".format(index), "Recipient {0}".format(index), merge_data)
+    return message
+
+
+def build_response(rejected: int):
+    """
+    Build an Injection API response body, with the address results of rejected recipients
+    """
+    if rejected == 0:
+        return json.dumps({"ErrorCode": "Success", "MessageResults": [], "TransactionReceipt": "receipt"})
+    return json.dumps({
+        "ErrorCode": "Warning",
+        "TransactionReceipt": "receipt",
+        "MessageResults": [{
+            "Index": 0,
+            "ErrorCode": "InvalidAddress",
+            "AddressResults": [{"EmailAddress": "recipient{0}@example.com".format(index),
+                                "Accepted": False,
+                                "ErrorCode": "InvalidAddress"} for index in range(rejected)]
+        }]
+    })
@@ -0,0 +1,149 @@
+"""
+Local stand-in for the Injection API used by the benchmarks. Every POST is answered with a
+successful injection response, in the shape read by InjectionResponseParser, after an optional
+delay simulating the latency of the API. Only the number of requests and bytes received are
+recorded, so the server's memory stays flat however many messages are sent.
+
+Run it on its own to load test from another process or machine:
+
+    python -m benchmarks.mock_injection_server [--port 8080] [--delay 0.01] [--certfile cert.pem --keyfile key.pem]
+
+With a certificate the server speaks HTTPS. The client verifies the certificate, so a
+self-signed one must be trusted, e.g. by pointing SSL_CERT_FILE at it.
+"""
+import argparse
+import json
+import ssl
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+
+class BenchmarkInjectionServer(ThreadingMixIn, HTTPServer):
+    """
+    Threaded HTTP or HTTPS server answering every request with a successful injection response
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, delay: float = 0,
+                 certfile: str = None, keyfile: str = None):
+        """
+        Initializes a new instance of the BenchmarkInjectionServer class
+        :param host: the address to listen on
+        :type host: str
+        :param port: the port to listen on; 0 picks a free port
+        :type port: int
+        :param delay: the seconds to wait before answering each request
+        :type delay: float
+        :param certfile: the PEM certificate to serve HTTPS with
+        :type certfile: str
+        :param keyfile: the PEM private key of the certificate
+        :type keyfile: str
+        """
+        self.delay = delay
+        self.request_count = 0
+        self.bytes_received = 0
+        self.payload = json.dumps({
+            "ErrorCode": "Success",
+            "MessageResults": [],
+            "TransactionReceipt": "benchmark"
+        }).encode("utf-8")
+        self._lock = threading.Lock()
+        super().__init__((host, port), BenchmarkRequestHandler)
+        self.scheme = "http"
+        if certfile is not None:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certfile, keyfile)
+            self.socket = context.wrap_socket(self.socket, server_side=True)
+            self.scheme = "https"
+
+    @property
+    def endpoint(self):
+        """
+        Get the Injection API endpoint of the server
+        :return the url
+        :rtype str
+        """
+        host, port = self.server_address[:2]
+        return "{0}://{1}:{2}/api/v1/email".format(self.scheme, host, port)
+
+    def record(self, size: int):
+        with self._lock:
+            self.request_count += 1
+            self.bytes_received += size
+
+    def handle_error(self, request, client_address):
+        # clients closing their connections when a benchmark ends are expected
+        pass
+
+
+class BenchmarkRequestHandler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        encoding = self.headers.get("Content-Encoding")
+        if encoding == "gzip":
+            body = zlib.decompress(body, 31)
+        elif encoding == "deflate":
+            body = zlib.decompress(body, 15)
+        self.server.record(len(body))
+
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.server.payload)))
+        self.end_headers()
+        self.wfile.write(self.server.payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port_queue, delay: float = 0, certfile: str = None, keyfile: str = None):
+    """
+    Run a server until the process is terminated, reporting its endpoint on the queue.
+    Used by the benchmark runner to keep the server's CPU and memory out of its measurements.
+    :param port_queue: the queue the endpoint is put on once the server listens
+    :type port_queue: multiprocessing.Queue
+    :param delay: the seconds to wait before answering each request
+    :type delay: float
+    :param certfile: the PEM certificate to serve HTTPS with
+    :type certfile: str
+    :param keyfile: the PEM private key of the certificate
+    :type keyfile: str
+    """
+    server = BenchmarkInjectionServer(delay=delay, certfile=certfile, keyfile=keyfile)
+    port_queue.put(server.endpoint)
+    server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Injection API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--delay", type=float, default=0, help="seconds to wait before each response")
+    parser.add_argument("--certfile", help="PEM certificate; serves HTTPS when given")
+    parser.add_argument("--keyfile", help="PEM private key of the certificate")
+    args = parser.parse_args()
+
+    server = BenchmarkInjectionServer(args.host, args.port, args.delay, args.certfile, args.keyfile)
+    print("listening on {0}".format(server.endpoint))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print("{0} requests, {1} bytes".format(server.request_count, server.bytes_received))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Measures the memory held per BulkRecipient, comparing the __slots__ based class with
+the same class backed by a per-instance __dict__, as the message classes were before.
+
+    python -m benchmarks.recipient_memory [count]
+"""
+import sys
+import tracemalloc
+
+from socketlabs.injectionapi.message.bulkrecipient import BulkRecipient
+
+
+class DictBulkRecipient(object):
+    """
+    BulkRecipient as it was before __slots__: the same attributes in a per-instance __dict__
+    """
+
+    def __init__(self, email_address: str = None, friendly_name: str = None, merge_data: dict = None):
+        self._email_address = email_address
+        self._friendly_name = friendly_name
+        if merge_data is not None:
+            self._merge_data = merge_data
+        else:
+            self._merge_data = dict()
+
+
+def measure(recipient_class, count: int):
+    """
+    Get the bytes allocated per recipient by creating count recipients of the class.
+    The email addresses and merge data are built before measuring, so only the recipient objects are counted.
+    :param recipient_class: the recipient class to create
+    :type recipient_class: type
+    :param count: the number of recipients
+    :type count: int
+    :return the bytes per recipient
+    :rtype float
+    """
+    addresses = ["recipient{0}@example.com".format(i) for i in range(count)]
+    merge_data = [{"Name": str(i)} for i in range(count)]
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    recipients = [recipient_class(addresses[i], None, merge_data[i]) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del recipients
+    return allocated / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    before = measure(DictBulkRecipient, count)
+    after = measure(BulkRecipient, count)
+
+    print("recipients:               {0}".format(count))
+    print("__dict__ per recipient:   {0:.1f} bytes".format(before))
+    print("__slots__ per recipient:  {0:.1f} bytes".format(after))
+    print("saved:                    {0:.1f}%".format(100 * (before - after) / before))
+
+
+if __name__ == "__main__":
+    main()
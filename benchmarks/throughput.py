@@ -0,0 +1,236 @@
+"""
+Measures the send throughput of the clients against a local stand-in for the Injection API:
+messages per second, p50 and p99 latency, CPU time and peak resident memory. The server runs
+in its own process, and each scenario in a fresh process, so the CPU and memory figures are
+those of the client alone.
+
+    python -m benchmarks.throughput [--scenario basic bulk attachment async] [--count 2000]
+                                    [--concurrency 8] [--delay 0] [--json results.json]
+
+Scenarios:
+    basic       BasicMessage with one recipient, sent by SocketLabsClient.send from a thread pool
+    bulk        BulkMessage with 50 recipients and merge data per send
+    attachment  BasicMessage with three 256 KB attachments
+    async       BasicMessage sent by AsyncSocketLabsClient.send from concurrent tasks
+
+Pass --endpoint to send to a server that is already running, such as
+benchmarks.mock_injection_server started with a certificate to measure HTTPS.
+"""
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from socketlabs.injectionapi import SocketLabsClient
+from socketlabs.injectionapi.asyncsocketlabsclient import AsyncSocketLabsClient
+from socketlabs.injectionapi.message.attachment import Attachment
+from socketlabs.injectionapi.message.basicmessage import BasicMessage
+from socketlabs.injectionapi.message.bulkmessage import BulkMessage
+from socketlabs.injectionapi.message.emailaddress import EmailAddress
+from socketlabs.injectionapi.sendresult import SendResult
+
+from benchmarks.mock_injection_server import serve
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+SCENARIOS = ["basic", "bulk", "attachment", "async"]
+
+
+def build_basic_message(index: int):
+    message = BasicMessage()
+    message.subject = "Benchmark message {0}".format(index)
+    message.html_body = "<html><body><h1>Benchmark</h1><p>Message {0}</p></body></html>".format(index)
+    message.plain_text_body = "Benchmark message {0}".format(index)
+    message.from_email_address = EmailAddress("from@example.com", "Benchmark")
+    message.add_to_email_address("recipient{0}@example.com".format(index), "Recipient {0}".format(index))
+    return message
+
+
+def build_bulk_message(index: int):
+    message = BulkMessage()
+    message.subject = "Benchmark campaign {0}".format(index)
+    message.html_body = "<html><body><p>Hello %%FirstName%%, your code is %%Code%%</p></body></html>"
+    message.from_email_address = EmailAddress("from@example.com", "Benchmark")
+    message.add_global_merge_data("Campaign", "Benchmark")
+    for recipient in range(50):
+        message.add_to_recipient("recipient{0}.{1}@example.com".format(index, recipient), None, {
+            "FirstName": "Recipient {0}".format(recipient),
+            "Code": "{0:08d}".format(index * 50 + recipient)
+        })
+    return message
+
+
+def build_attachment_message(index: int, content: bytes = bytes(range(256)) * 1024):
+    message = build_basic_message(index)
+    for attachment in range(3):
+        message.add_attachment(Attachment("file{0}.bin".format(attachment), "application/octet-stream",
+                                          content=content))
+    return message
+
+
+BUILDERS = {
+    "basic": build_basic_message,
+    "bulk": build_bulk_message,
+    "attachment": build_attachment_message,
+    "async": build_basic_message
+}
+
+
+def percentile(latencies: list, p: float):
+    """
+    Get the nearest-rank percentile of sorted latencies
+    :param latencies: the sorted latencies
+    :type latencies: list
+    :param p: the percentile, from 0 to 100
+    :type p: float
+    :return the latency
+    :rtype float
+    """
+    if len(latencies) == 0:
+        return 0.0
+    return latencies[max(0, math.ceil(p / 100 * len(latencies)) - 1)]
+
+
+def peak_rss_mb():
+    """
+    Get the peak resident memory of the process in MB, or None where it cannot be read
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, KB elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_sync(endpoint: str, build_message, count: int, concurrency: int):
+    client = SocketLabsClient(1, "benchmark")
+    client.endpoint = endpoint
+
+    def timed_send(index):
+        message = build_message(index)
+        started = time.perf_counter()
+        response = client.send(message)
+        return time.perf_counter() - started, response.result
+
+    client.send(build_message(0))
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        started = time.perf_counter()
+        results = list(executor.map(timed_send, range(count)))
+        elapsed = time.perf_counter() - started
+    client.close()
+    return elapsed, results
+
+
+async def run_async(endpoint: str, build_message, count: int, concurrency: int):
+    async with AsyncSocketLabsClient(1, "benchmark") as client:
+        client.endpoint = endpoint
+        in_flight = asyncio.Semaphore(concurrency)
+
+        async def timed_send(index):
+            async with in_flight:
+                message = build_message(index)
+                started = time.perf_counter()
+                response = await client.send(message)
+                return time.perf_counter() - started, response.result
+
+        await client.send(build_message(0))
+        started = time.perf_counter()
+        results = await asyncio.gather(*[timed_send(index) for index in range(count)])
+        elapsed = time.perf_counter() - started
+    return elapsed, results
+
+
+def run_scenario(scenario: str, endpoint: str, count: int, concurrency: int):
+    """
+    Send count messages of the scenario and measure the client. Each message is built just
+    before it is sent, outside the latency measurement, so only the messages in flight are held.
+    :param scenario: the scenario name
+    :type scenario: str
+    :param endpoint: the Injection API endpoint to send to
+    :type endpoint: str
+    :param count: the number of messages to send
+    :type count: int
+    :param concurrency: the number of sends in flight
+    :type concurrency: int
+    :return the measurements
+    :rtype dict
+    """
+    cpu_started = time.process_time()
+    if scenario == "async":
+        elapsed, results = asyncio.run(run_async(endpoint, BUILDERS[scenario], count, concurrency))
+    else:
+        elapsed, results = run_sync(endpoint, BUILDERS[scenario], count, concurrency)
+    cpu = time.process_time() - cpu_started
+
+    latencies = sorted(latency for latency, _ in results)
+    return {
+        "scenario": scenario,
+        "messages": count,
+        "failures": sum(1 for _, result in results if result != SendResult.Success),
+        "seconds": elapsed,
+        "messages_per_second": count / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "cpu_seconds": cpu,
+        "peak_rss_mb": peak_rss_mb()
+    }
+
+
+def scenario_process(result_queue, scenario: str, endpoint: str, count: int, concurrency: int):
+    result_queue.put(run_scenario(scenario, endpoint, count, concurrency))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Client throughput against a local Injection API stand-in")
+    parser.add_argument("--scenario", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--count", type=int, default=2000, help="messages sent per scenario")
+    parser.add_argument("--concurrency", type=int, default=8, help="sends in flight")
+    parser.add_argument("--delay", type=float, default=0, help="seconds the local server waits before responding")
+    parser.add_argument("--endpoint", help="send to this server instead of starting one")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    server = None
+    endpoint = args.endpoint
+    if endpoint is None:
+        endpoint_queue = multiprocessing.Queue()
+        server = multiprocessing.Process(target=serve, args=(endpoint_queue, args.delay), daemon=True)
+        server.start()
+        endpoint = endpoint_queue.get(timeout=30)
+
+    results = []
+    try:
+        for scenario in args.scenario:
+            result_queue = multiprocessing.Queue()
+            process = multiprocessing.Process(target=scenario_process,
+                                              args=(result_queue, scenario, endpoint, args.count, args.concurrency))
+            process.start()
+            results.append(result_queue.get())
+            process.join()
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join()
+
+    print("{0:<12}{1:>10}{2:>10}{3:>12}{4:>10}{5:>10}{6:>10}{7:>12}".format(
+        "scenario", "messages", "failures", "msgs/sec", "p50 ms", "p99 ms", "cpu s", "peak RSS MB"))
+    for result in results:
+        print("{0:<12}{1:>10}{2:>10}{3:>12.1f}{4:>10.2f}{5:>10.2f}{6:>10.2f}{7:>12}".format(
+            result["scenario"], result["messages"], result["failures"], result["messages_per_second"],
+            result["p50_ms"], result["p99_ms"], result["cpu_seconds"],
+            "n/a" if result["peak_rss_mb"] is None else "{0:.1f}".format(result["peak_rss_mb"])))
+
+    if args.json is not None:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
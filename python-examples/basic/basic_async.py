@@ -17,11 +17,11 @@ def on_success(response):
 
 def on_error(exception):
     """
-        Handle the error response from the client
-        :param exception: the Exception
-        :return: Exception
-        """
-    print(json.dumps(exception.to_json(), indent=2))
+    Handle the error response from the client
+    :param exception: the Exception
+    :return: Exception
+    """
+    print(exception)
 
 
 # build the message
@@ -45,5 +45,11 @@ api_key = os.environ.get('SOCKETLABS_INJECTION_API_KEY')
 # create the client
 client = SocketLabsClient(server_id, api_key)
 
-# send the message
-client.send_async(message, on_success, on_error)
\ No newline at end of file
+# send the message; the callbacks run when the send completes
+future = client.send_async(message, on_success, on_error)
+
+# the returned Future can also be waited on directly
+response = future.result()
+
+# wait for queued sends and close pooled connections
+client.close()
\ No newline at end of file
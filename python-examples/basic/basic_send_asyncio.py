@@ -0,0 +1,48 @@
+import asyncio
+import json
+import os
+
+from socketlabs.injectionapi import AsyncSocketLabsClient
+from socketlabs.injectionapi.message.__imports__ import \
+    BasicMessage, EmailAddress
+
+
+def build_message(recipient: str):
+    """
+    Build a basic message for the recipient
+    :param recipient: the recipient email address
+    :return: BasicMessage
+    """
+    message = BasicMessage()
+
+    message.subject = "Sending A Test Message (Basic Send With asyncio)"
+    message.html_body = "<html><body>" \
+                        "<h1>Sending A Test Message</h1>" \
+                        "<p>This is the Html Body of my message.</p>" \
+                        "</body></html>"
+    message.plain_text_body = "This is the Plain Text Body of my message."
+
+    message.from_email_address = EmailAddress("from@example.com")
+    message.add_to_email_address(recipient)
+    return message
+
+
+async def main():
+    # get credentials from environment variables
+    server_id = int(os.environ.get('SOCKETLABS_SERVER_ID'))
+    api_key = os.environ.get('SOCKETLABS_INJECTION_API_KEY')
+
+    # create the client; connections are pooled and closed when the block exits
+    async with AsyncSocketLabsClient(server_id, api_key) as client:
+
+        # send the messages concurrently
+        responses = await asyncio.gather(
+            client.send(build_message("recipient1@example.com")),
+            client.send(build_message("recipient2@example.com")),
+            client.send(build_message("recipient3@example.com")))
+
+    for response in responses:
+        print(json.dumps(response.to_json(), indent=2))
+
+
+asyncio.run(main())
@@ -27,6 +27,12 @@ attachment = Attachment(name="bus.png", mime_type="image/png", file_path="../img
 
 message.add_attachment(attachment)
 
+# Large files can be streamed: only the path and size are recorded here, and the
+# file is BASE64 encoded in chunks straight into the request when the message is sent
+streamed_attachment = Attachment(file_path="../img/bus.png", stream=True)
+
+message.add_attachment(streamed_attachment)
+
 
 # get credentials from environment variables
 server_id = int(os.environ.get('SOCKETLABS_SERVER_ID'))
@@ -0,0 +1,39 @@
+import os
+
+from socketlabs.injectionapi import SocketLabsClient
+from socketlabs.injectionapi.message.__imports__ import \
+    BasicMessage, EmailAddress
+
+
+# get credentials from environment variables
+server_id = int(os.environ.get('SOCKETLABS_SERVER_ID'))
+api_key = os.environ.get('SOCKETLABS_INJECTION_API_KEY')
+
+# build the message
+message = BasicMessage()
+
+message.subject = "Sending A Test Message (Basic Send With Metrics)"
+message.html_body = "<html><body>" \
+                    "<h1>Sending A Test Message</h1>" \
+                    "<p>This is the Html Body of my message.</p>" \
+                    "</body></html>"
+message.plain_text_body = "This is the Plain Text Body of my message."
+
+message.from_email_address = EmailAddress("from@example.com")
+message.add_to_email_address("recipient1@example.com")
+
+# create the client; its metrics are kept from the first time they are read
+client = SocketLabsClient(server_id, api_key)
+client.number_of_retries = 2
+metrics = client.metrics
+
+response = client.send(message)
+client.close()
+
+# the metrics in the Prometheus text format, e.g. to serve on a /metrics endpoint
+print(metrics.to_text())
+
+# a rising share of retries warns of throttling before sends return OverQuota
+attempts = metrics.get("socketlabs_attempts_total").get()
+retried = metrics.get("socketlabs_retries_total").get({"reason": 429})
+print("{0} of {1} attempts were throttled".format(retried, attempts))
@@ -0,0 +1,44 @@
+import os
+
+from socketlabs.injectionapi import SocketLabsClient
+from socketlabs.injectionapi.sendobserver import SendObserver
+from socketlabs.injectionapi.sendphase import SendPhase
+from socketlabs.injectionapi.message.__imports__ import \
+    BasicMessage, EmailAddress
+
+
+# an observer receives a SendEvent for every request the client sends
+class TimingObserver(SendObserver):
+
+    def on_send_complete(self, event):
+        print("{0} in {1:.1f} ms, {2} attempt(s), {3} bytes sent".format(
+            event.result.name if event.result is not None else event.exception,
+            event.duration * 1000, event.attempts, event.request_bytes))
+        for phase in SendPhase:
+            if phase in event.timings:
+                print("  {0:<10} {1:.2f} ms".format(phase.name, event.timings[phase] * 1000))
+
+
+# get credentials from environment variables
+server_id = int(os.environ.get('SOCKETLABS_SERVER_ID'))
+api_key = os.environ.get('SOCKETLABS_INJECTION_API_KEY')
+
+# build the message
+message = BasicMessage()
+
+message.subject = "Sending A Test Message (Basic Send With Observer)"
+message.html_body = "<html><body>" \
+                    "<h1>Sending A Test Message</h1>" \
+                    "<p>This is the Html Body of my message.</p>" \
+                    "</body></html>"
+message.plain_text_body = "This is the Plain Text Body of my message."
+
+message.from_email_address = EmailAddress("from@example.com")
+message.add_to_email_address("recipient1@example.com")
+
+# create the client and add the observer
+client = SocketLabsClient(server_id, api_key)
+client.add_observer(TimingObserver())
+
+response = client.send(message)
+client.close()
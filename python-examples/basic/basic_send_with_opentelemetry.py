@@ -0,0 +1,40 @@
+import os
+
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import ConsoleSpanExporter, SimpleSpanProcessor
+
+from socketlabs.injectionapi import SocketLabsClient
+from socketlabs.injectionapi.opentelemetryobserver import OpenTelemetryObserver
+from socketlabs.injectionapi.message.__imports__ import \
+    BasicMessage, EmailAddress
+
+
+# print the spans to the console; use the exporter of your tracing backend instead
+tracer_provider = TracerProvider()
+tracer_provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter()))
+trace.set_tracer_provider(tracer_provider)
+
+# get credentials from environment variables
+server_id = int(os.environ.get('SOCKETLABS_SERVER_ID'))
+api_key = os.environ.get('SOCKETLABS_INJECTION_API_KEY')
+
+# build the message
+message = BasicMessage()
+
+message.subject = "Sending A Test Message (Basic Send With OpenTelemetry)"
+message.html_body = "<html><body>" \
+                    "<h1>Sending A Test Message</h1>" \
+                    "<p>This is the Html Body of my message.</p>" \
+                    "</body></html>"
+message.plain_text_body = "This is the Plain Text Body of my message."
+
+message.from_email_address = EmailAddress("from@example.com")
+message.add_to_email_address("recipient1@example.com")
+
+# create the client and add the observer, which uses the global tracer and meter providers
+client = SocketLabsClient(server_id, api_key)
+client.add_observer(OpenTelemetryObserver())
+
+response = client.send(message)
+client.close()
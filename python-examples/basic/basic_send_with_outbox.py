@@ -0,0 +1,39 @@
+import os
+
+from socketlabs.injectionapi import SocketLabsClient
+from socketlabs.injectionapi.outbox import Outbox
+from socketlabs.injectionapi.message.__imports__ import \
+    BasicMessage, EmailAddress
+
+# get credentials from environment variables
+server_id = int(os.environ.get('SOCKETLABS_SERVER_ID'))
+api_key = os.environ.get('SOCKETLABS_INJECTION_API_KEY')
+
+# build the message
+message = BasicMessage()
+
+message.subject = "Sending A Test Message (Basic Send With Outbox)"
+message.html_body = "<html><body>" \
+                    "<h1>Sending A Test Message</h1>" \
+                    "<p>This is the Html Body of my message.</p>" \
+                    "</body></html>"
+message.plain_text_body = "This is the Plain Text Body of my message."
+
+message.from_email_address = EmailAddress("from@example.com")
+message.add_to_email_address("recipient1@example.com")
+
+# create the client and open the outbox; messages stored in it are sent by its
+# worker threads, and messages not yet sent when the process stops are sent
+# the next time the outbox is opened
+client = SocketLabsClient(server_id, api_key)
+with Outbox(client, "socketlabs-outbox.db") as outbox:
+
+    # store the message; it is on disk when enqueue returns
+    entry_id = outbox.enqueue(message)
+
+    # wait for the message to be sent
+    outbox.flush(timeout=60)
+    entry = outbox.get_entry(entry_id)
+
+print("{0}: {1} ({2})".format(entry.state.name, entry.result, entry.transaction_receipt))
+client.close()
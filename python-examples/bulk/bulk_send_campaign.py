@@ -0,0 +1,38 @@
+import json
+import os
+
+from socketlabs.injectionapi import SocketLabsClient
+from socketlabs.injectionapi.message.__imports__ import \
+    BulkMessage, BulkRecipient, EmailAddress
+
+
+# build the message
+message = BulkMessage()
+
+message.subject = "Sending A Test Message (Bulk Campaign)"
+message.html_body = "<html><body>" \
+                    "<h1>Sending A Test Message</h1>" \
+                    "<p>Hello %%Name%%, this is the Html Body of my message.</p>" \
+                    "</body></html>"
+message.plain_text_body = "Hello %%Name%%, this is the Plain Text Body of my message."
+message.from_email_address = EmailAddress("from@example.com")
+
+# a campaign is not limited to 50 recipients; the client splits
+# the recipients into requests of 50 and sends them concurrently
+for i in range(1, 501):
+    recipient = BulkRecipient("recipient{0}@example.com".format(i))
+    recipient.add_merge_data("Name", "Recipient #{0}".format(i))
+    message.add_to_recipient(recipient)
+
+
+# get credentials from environment variables
+server_id = int(os.environ.get('SOCKETLABS_SERVER_ID'))
+api_key = os.environ.get('SOCKETLABS_INJECTION_API_KEY')
+
+# create the client
+with SocketLabsClient(server_id, api_key) as client:
+
+    # send the campaign
+    response = client.send_bulk_campaign(message)
+
+print(json.dumps(response.to_json(), indent=2))
@@ -9,6 +9,10 @@ from socketlabs.injectionapi.message.__imports__ import \
 For our example we are using a mock repository class (Customer and 
 CustomerRepository) that returns hard-coded data. Normally the 
 repository class would access a database to retrieve this data.
+The customers are yielded one at a time and the recipients are built
+as the client reads them, so the data source is never held in memory.
+Rows from a CSV file or a database cursor can be mapped to recipients
+in the same way with CsvRecipientSource and CursorRecipientSource.
 """
 
 
@@ -57,12 +61,10 @@ class CustomerRepository(object):
 
     @staticmethod
     def get_customer_repo():
-        return [
-            Customer("Recipient", "One", "recipient1@example.com", "Green"),
-            Customer("Recipient", "Two", "recipient2@example.com", "Red"),
-            Customer("Recipient", "Three", "recipient3@example.com", "Blue"),
-            Customer("Recipient", "Four", "recipient4@example.com", "Orange")
-        ]
+        yield Customer("Recipient", "One", "recipient1@example.com", "Green")
+        yield Customer("Recipient", "Two", "recipient2@example.com", "Red")
+        yield Customer("Recipient", "Three", "recipient3@example.com", "Blue")
+        yield Customer("Recipient", "Four", "recipient4@example.com", "Orange")
 
 
 # build the message
@@ -81,17 +83,17 @@ message.plain_text_body = "Sending A Test Message With Merge Data From Datasourc
 
 message.from_email_address = EmailAddress("from@example.com")
 
-customers = CustomerRepository.get_customer_repo()
 
-for customer in customers:
-    recipient = BulkRecipient(customer.email_address, "{first} {last}".format(
-                                  first=customer.first_name,
-                                  last=str(customer.last_name)))
-    recipient.add_merge_data("FirstName", customer.first_name)
-    recipient.add_merge_data("LastName", customer.last_name)
-    recipient.add_merge_data("FavoriteColor", customer.favorite_color)
 
-    message.add_to_recipient(recipient)
+def get_recipients():
+    for customer in CustomerRepository.get_customer_repo():
+        recipient = BulkRecipient(customer.email_address, "{first} {last}".format(
+                                      first=customer.first_name,
+                                      last=str(customer.last_name)))
+        recipient.add_merge_data("FirstName", customer.first_name)
+        recipient.add_merge_data("LastName", customer.last_name)
+        recipient.add_merge_data("FavoriteColor", customer.favorite_color)
+        yield recipient
 
 
 # get credentials from environment variables
@@ -101,7 +103,8 @@ api_key = os.environ.get('SOCKETLABS_INJECTION_API_KEY')
 # create the client
 client = SocketLabsClient(server_id, api_key)
 
-# send the message
-response = client.send(message)
+# send the message, reading the recipients as it goes
+response = client.send_bulk_campaign(message, get_recipients())
+client.close()
 
 print(json.dumps(response.to_json(), indent=2))
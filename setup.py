@@ -17,10 +17,11 @@ setup(
     long_description_content_type="text/markdown",
     packages=find_packages(exclude=['tests', '*test_*.py', ]),
     include_package_data=True,
+    python_requires='>=3.7',
+    extras_require={
+        'opentelemetry': ['opentelemetry-api'],
+    },
     classifiers=[
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',
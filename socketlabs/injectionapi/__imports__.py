@@ -1,4 +1,18 @@
 from .addressresult import AddressResult
+from .backpressurepolicy import BackpressurePolicy
+from .circuitbreaker import CircuitBreaker, CircuitOpenException
+from .circuitstate import CircuitState
+from .clienttimeoutexception import ClientTimeoutException
+from .compressionmethod import CompressionMethod
+from .compressionsettings import CompressionSettings
+from .outbox import Outbox
+from .outboxentry import OutboxEntry
+from .outboxstate import OutboxState
+from .preparedbulkmessage import PreparedBulkMessage
 from .proxy import Proxy
+from .ratelimiter import RateLimiter
+from .sendevent import SendEvent
+from .sendobserver import SendObserver
+from .sendphase import SendPhase
 from .sendresponse import SendResponse
 from .sendresult import SendResult
\ No newline at end of file
@@ -1,3 +1,4 @@
 name = "socketlabs_injectionapi"
 
 from .socketlabsclient import SocketLabsClient
+from .asyncsocketlabsclient import AsyncSocketLabsClient
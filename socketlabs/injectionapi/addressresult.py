@@ -3,6 +3,8 @@ class AddressResult(object):
     The result of a single recipient in the Injection request.
     """
 
+    __slots__ = ("_email_address", "_accepted", "_error_code")
+
     def __init__(self, email_address: str = None, accepted: bool = None, error_code: str = None):
         """
         Initializes a new instance of the AddressResult class
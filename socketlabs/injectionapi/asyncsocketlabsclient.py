@@ -0,0 +1,489 @@
+"""
+AsyncSocketLabsClient is an asyncio wrapper for the SocketLabs Injection API
+that sends messages with coroutines instead of threads.
+"""
+import asyncio
+import time
+from datetime import timedelta
+
+from .core.asyncconnectionpool import AsyncConnectionPool
+from .core.asynchttprequest import AsyncHttpRequest
+from .core.asyncretryhandler import AsyncRetryHandler
+from .core.httpendpoint import HttpEndpoint
+from .core.injectionrequestserializer import InjectionRequestSerializer
+from .core.injectionresponseparser import InjectionResponseParser
+from .core.sendvalidator import SendValidator, get_full_recipient_count
+from .compressionsettings import CompressionSettings
+from .preparedbulkmessage import PreparedBulkMessage
+from .retrysettings import RetrySettings
+from .message.basicmessage import BasicMessage
+from .message.bulkmessage import BulkMessage
+from .metrics.metricsobserver import MetricsObserver
+from .metrics.metricsregistry import MetricsRegistry
+from .circuitbreaker import CircuitBreaker, CircuitOpenException
+from .proxy import Proxy
+from .ratelimiter import RateLimiter
+from .sendevent import SendEvent
+from .sendobserver import SendObserver, notify_send_start, notify_send_complete
+from .sendphase import SendPhase
+from .sendresponse import SendResponse
+from .sendresult import SendResult
+from .core.apikeyparser import ApiKeyParser
+from .core.apikeyparseresult import ApiKeyParseResult
+
+
+class AsyncSocketLabsClient(object):
+    """
+    AsyncSocketLabsClient is an asyncio wrapper for the SocketLabs Injection API.
+    Sends are coroutines over pooled, non-blocking connections, so many concurrent
+    sends cost coroutines rather than threads.
+
+    Compression and the reading of streamed attachment files run in the event loop's
+    default executor. Validation and serialization run on the event loop; they work on
+    the message in memory, but a message with large in-memory attachments takes a
+    correspondingly long time to serialize.
+
+    :Example:
+
+        async with AsyncSocketLabsClient(server_id, api_key) as client:
+            response = await client.send(message)
+
+    """
+
+    def __init__(self, server_id: int, api_key: str, proxy: Proxy = None):
+        """
+        Creates a new instance of the AsyncSocketLabsClient.
+        :param server_id: Your SocketLabs ServerId number.
+        :type server_id: int
+        :param api_key: Your SocketLabs Injection API key.
+        :type api_key: str
+        :param proxy: The Proxy you would like to use.
+        :type proxy: Proxy
+        """
+        self._server_id = server_id
+        self._api_key = api_key
+        self._http_proxy = proxy
+        self._request_timeout = 120
+        self._connect_timeout = None
+        self._read_timeout = None
+        self._number_of_retries = 0
+        self._send_deadline = None
+        self._http_endpoint = "https://inject.socketlabs.com/api/v1/email"
+        self._connection_pool = AsyncConnectionPool()
+        self._compression = None
+        self._rate_limiter = None
+        self._circuit_breaker = None
+        self._observers = []
+        self._metrics = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Close the keep-alive connections held by the client's connection pool.
+        """
+        self._connection_pool.close()
+
+    @property
+    def endpoint(self):
+        """
+        The SocketLabs Injection API endpoint
+        :return the Http Endpoint for the request
+        :rtype str
+        """
+        return self._http_endpoint
+
+    @endpoint.setter
+    def endpoint(self, http_endpoint: str):
+        """
+        The SocketLabs Injection API endpoint
+        :param http_endpoint: the Http Endpoint for the request
+        :type http_endpoint: str
+        """
+        self._http_endpoint = http_endpoint
+
+    @property
+    def request_timeout(self):
+        """
+        The SocketLabs Injection API timeout
+        :return the Http timeout for the HTTP request
+        :rtype int
+        """
+        return self._request_timeout
+
+    @request_timeout.setter
+    def request_timeout(self, timeout: int):
+        """
+        Set the request_timeout to use when making the HTTP request
+        :param timeout: the request_timeout to use for the HTTP request
+        :type timeout: int
+        """
+        self._request_timeout = timeout
+
+    @property
+    def connect_timeout(self):
+        """
+        The timeout in seconds for opening a connection to the Injection API, including the
+        proxy tunnel and the TLS handshake. Falls back to the request_timeout when not set.
+        :return the connect timeout, or None to use the request_timeout
+        :rtype float
+        """
+        return self._connect_timeout
+
+    @connect_timeout.setter
+    def connect_timeout(self, timeout: float):
+        """
+        Set the timeout in seconds for opening a connection to the Injection API
+        :param timeout: the connect timeout, or None to use the request_timeout
+        :type timeout: float
+        """
+        self._connect_timeout = timeout
+
+    @property
+    def read_timeout(self):
+        """
+        The timeout in seconds for sending the request and waiting on the response once
+        connected. Falls back to the request_timeout when not set.
+        :return the read timeout, or None to use the request_timeout
+        :rtype float
+        """
+        return self._read_timeout
+
+    @read_timeout.setter
+    def read_timeout(self, timeout: float):
+        """
+        Set the timeout in seconds for sending the request and waiting on the response
+        :param timeout: the read timeout, or None to use the request_timeout
+        :type timeout: float
+        """
+        self._read_timeout = timeout
+
+    @property
+    def connection_pool(self):
+        """
+        The pool of keep-alive connections used for requests to the Injection API
+        :return the connection pool
+        :rtype AsyncConnectionPool
+        """
+        return self._connection_pool
+
+    @connection_pool.setter
+    def connection_pool(self, pool: AsyncConnectionPool):
+        """
+        Set the pool of keep-alive connections used for requests to the Injection API.
+        The previous pool is closed.
+        :param pool: the connection pool
+        :type pool: AsyncConnectionPool
+        """
+        previous = self._connection_pool
+        self._connection_pool = pool
+        if previous is not None and previous is not pool:
+            previous.close()
+
+    @property
+    def compression(self):
+        """
+        The settings for compressing request bodies, or None to send them uncompressed
+        :return the compression settings
+        :rtype CompressionSettings
+        """
+        return self._compression
+
+    @compression.setter
+    def compression(self, settings: CompressionSettings):
+        """
+        Set the settings for compressing request bodies, or None to send them uncompressed
+        :param settings: the compression settings
+        :type settings: CompressionSettings
+        """
+        self._compression = settings
+
+    @property
+    def rate_limiter(self):
+        """
+        The limiter applied to the rate of messages and recipients sent, or None for no limit
+        :return the rate limiter
+        :rtype RateLimiter
+        """
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, limiter: RateLimiter):
+        """
+        Set the limiter applied to the rate of messages and recipients sent, or None for no limit.
+        Waiting for the limiter suspends the coroutine rather than blocking the event loop.
+        :param limiter: the rate limiter
+        :type limiter: RateLimiter
+        """
+        self._rate_limiter = limiter
+
+    @property
+    def circuit_breaker(self):
+        """
+        The circuit breaker guarding the Injection API endpoint, or None to always send
+        :return the circuit breaker
+        :rtype CircuitBreaker
+        """
+        return self._circuit_breaker
+
+    @circuit_breaker.setter
+    def circuit_breaker(self, breaker: CircuitBreaker):
+        """
+        Set the circuit breaker guarding the Injection API endpoint, or None to always send.
+        While the breaker is open, sends return SendResult.CircuitOpen without being attempted.
+        :param breaker: the circuit breaker
+        :type breaker: CircuitBreaker
+        """
+        self._circuit_breaker = breaker
+
+    @property
+    def observers(self):
+        """
+        Get the SendObserver objects that receive a SendEvent for every request the client sends
+        :return the list of observers
+        :rtype list
+        """
+        return list(self._observers)
+
+    def add_observer(self, observer: SendObserver):
+        """
+        Add a SendObserver, which receives a SendEvent for every request the client sends.
+        The hooks are called on the event loop, so they must not block.
+        :param observer: the observer
+        :type observer: SendObserver
+        """
+        self._observers = self._observers + [observer]
+
+    def remove_observer(self, observer: SendObserver):
+        """
+        Remove a SendObserver
+        :param observer: the observer
+        :type observer: SendObserver
+        """
+        self._observers = [o for o in self._observers if o is not observer]
+
+    @property
+    def metrics(self):
+        """
+        Get the metrics of the client: its sends by SendResult, retries, bytes and latency, the sends
+        in flight, and the usage of its connection pool. They are kept from the first time this is
+        read; to_text() of the registry exports them in the Prometheus text format.
+        :return the metrics registry
+        :rtype MetricsRegistry
+        """
+        if self._metrics is None:
+            registry = MetricsRegistry()
+            self.add_observer(MetricsObserver(registry))
+            registry.gauge("socketlabs_connection_pool_in_use", "Connections checked out of the pool",
+                           function=lambda: self._connection_pool.in_use_count)
+            registry.gauge("socketlabs_connection_pool_idle", "Idle keep-alive connections in the pool",
+                           function=lambda: self._connection_pool.idle_count)
+            registry.gauge("socketlabs_connection_pool_max_size",
+                           "Total open connections the pool allows, in use or idle",
+                           function=lambda: self._connection_pool.max_size)
+            self._metrics = registry
+        return self._metrics
+
+    @property
+    def number_of_retries(self):
+        return self._number_of_retries
+
+    @number_of_retries.setter
+    def number_of_retries(self, retries: int):
+        self._number_of_retries = retries
+
+    @property
+    def send_deadline(self):
+        """
+        The longest time in seconds a send may take across all its attempts, including the
+        waits between them. A retry that could not start before the deadline is not made,
+        and the connect and read timeouts of each attempt are cut to the time remaining.
+        :return the deadline in seconds, or None for no deadline
+        :rtype float
+        """
+        return self._send_deadline
+
+    @send_deadline.setter
+    def send_deadline(self, seconds: float):
+        """
+        Set the longest time in seconds a send may take across all its attempts, or None for no deadline
+        :param seconds: the deadline in seconds
+        :type seconds: float
+        """
+        self._send_deadline = seconds
+
+    def __build_retry_settings(self):
+        """
+        Build the RetrySettings for a send
+        :return the retry settings
+        :rtype RetrySettings
+        """
+        deadline = timedelta(seconds=self._send_deadline) if self._send_deadline is not None else None
+        return RetrySettings(self.number_of_retries, deadline)
+
+    def __build_http_request(self, authentication: str):
+        """
+        Build the AsyncHttpRequest. Will add the proxy, if set
+        :param authentication: the API key to include as a bearer token
+        :type authentication: str
+        :return the AsyncHttpRequest object to use for the request
+        :rtype AsyncHttpRequest
+        """
+        endpoint = HttpEndpoint(self.endpoint)
+        req = AsyncHttpRequest(endpoint, self.request_timeout, authentication, self._connection_pool,
+                               self._circuit_breaker)
+        req.connect_timeout = self._connect_timeout
+        req.read_timeout = self._read_timeout
+        if self._http_proxy is not None:
+            req.proxy = self._http_proxy
+        return req
+
+    async def send(self, message):
+        """
+        Sends a BasicMessage, BulkMessage or PreparedBulkMessage message and returns the response from the Injection API.
+        :param message: A BasicMessage, BulkMessage or PreparedBulkMessage object to be sent.
+        :type message: object
+        :return the SendResponse from the request
+        :rtype SendResponse
+        """
+        if not isinstance(message, (BasicMessage, BulkMessage, PreparedBulkMessage)):
+            raise Exception('Message type was not BasicMessage, BulkMessage, PreparedBulkMessage. Send Failed')
+
+        event = None
+        if self._observers:
+            event = SendEvent(message, 1, self.__count_recipients(message))
+            notify_send_start(self._observers, event)
+
+        try:
+            result = await self.__send(message, event)
+        except BaseException as e:
+            self.__complete_event(event, exception=e)
+            raise
+        return self.__complete_event(event, result)
+
+    async def __send(self, message, event: SendEvent = None):
+        """
+        Validate, serialize and send a message, adding the timings and sizes to the event
+        :param message: the BasicMessage, BulkMessage or PreparedBulkMessage to send
+        :type message: object
+        :param event: the event of the send, if any
+        :type event: SendEvent
+        :return the SendResponse from the request
+        :rtype SendResponse
+        """
+        started = time.perf_counter()
+        resp = self.__validate_message(message)
+        self.__record(event, SendPhase.Validate, started)
+        if not resp.result == SendResult.Success:
+            return resp
+
+        started = time.perf_counter()
+        api_key_parser = ApiKeyParser()
+        parse_result = api_key_parser.parse(self._api_key)
+
+        serializer = InjectionRequestSerializer(self._server_id, self._api_key)
+        http_request = self.__build_http_request("")
+
+        if parse_result == ApiKeyParseResult.Success:
+            serializer = InjectionRequestSerializer(self._server_id, "")
+            http_request = self.__build_http_request(self._api_key)
+
+        if isinstance(message, PreparedBulkMessage):
+            body = serializer.serialize_prepared(message)
+        else:
+            body = serializer.serialize(message)
+        self.__record(event, SendPhase.Serialize, started)
+
+        started = time.perf_counter()
+        if self._compression is not None and self._compression.should_compress(body):
+            body = await asyncio.get_running_loop().run_in_executor(None, self._compression.compress, body)
+        self.__record(event, SendPhase.Compress, started)
+
+        if self._rate_limiter is not None:
+            started = time.perf_counter()
+            wait = self._rate_limiter.reserve(1, self.__count_recipients(message))
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self.__record(event, SendPhase.Throttle, started)
+
+        if event is not None:
+            event.request_bytes = len(body)
+        retry_handler = AsyncRetryHandler(http_request, self.__build_retry_settings())
+        try:
+            response = await retry_handler.send(body, event)
+        except CircuitOpenException:
+            return SendResponse(SendResult.CircuitOpen)
+
+        started = time.perf_counter()
+        data = response.read()
+        result = InjectionResponseParser.parse(data.decode("utf-8"), response.status)
+        self.__record(event, SendPhase.Parse, started)
+        if event is not None:
+            event.status_code = response.status
+            event.response_bytes = len(data)
+
+        return result
+
+    def __complete_event(self, event: SendEvent, response=None, exception: BaseException = None):
+        """
+        Record the outcome of a send and pass its event to the observers' on_send_complete
+        :param event: the event of the send, if any
+        :type event: SendEvent
+        :param response: the SendResponse
+        :type response: SendResponse
+        :param exception: the exception the send raised, if any
+        :type exception: BaseException
+        :return the response
+        :rtype SendResponse
+        """
+        if event is not None:
+            event.complete(response, exception)
+            notify_send_complete(self._observers, event)
+        return response
+
+    @staticmethod
+    def __record(event: SendEvent, phase: SendPhase, started: float):
+        """
+        Add the time since started to a phase of the event, if any
+        :param event: the event of the send
+        :type event: SendEvent
+        :param phase: the phase
+        :type phase: SendPhase
+        :param started: the time.perf_counter() value the phase started at
+        :type started: float
+        """
+        if event is not None:
+            event.add_timing(phase, time.perf_counter() - started)
+
+    @staticmethod
+    def __count_recipients(message):
+        """
+        Count the recipients of a BasicMessage, BulkMessage or PreparedBulkMessage
+        :param message: the message
+        :type message: object
+        :return the number of recipients
+        :rtype int
+        """
+        if isinstance(message, (BulkMessage, PreparedBulkMessage)):
+            return len(message.to_recipient) if message.to_recipient is not None else 0
+        return get_full_recipient_count(message)
+
+    def __validate_message(self, message):
+        """
+        Validate a BasicMessage, BulkMessage or PreparedBulkMessage message
+        :param message: the message to be sent
+        :type message: object
+        :return the validation result
+        :rtype SendResponse
+        """
+        resp = SendValidator.validate_credentials(self._server_id, self._api_key)
+        if not resp.result == SendResult.Success:
+            return resp
+
+        if isinstance(message, PreparedBulkMessage):
+            return SendValidator.validate_prepared_message(message)
+        return SendValidator.validate_message(message)
@@ -0,0 +1,29 @@
+from enum import Enum
+
+
+class BackpressurePolicy(Enum):
+    """
+    Enumerated behaviour of SocketLabsClient.send_async when the send queue is full
+    """
+
+    """ Wait until a queued send completes and a slot is free """
+    Block = 0
+
+    """ Do not queue the send; the returned Future fails with a SendQueueFullException """
+    Drop = 1
+
+    """ Do not queue the send; raise a SendQueueFullException to the caller """
+    Raise = 2
+
+    def __str__(self):
+        """
+        String representation of the BackpressurePolicy Enum
+        :return the string
+        :rtype str
+        """
+        switcher = {
+            0: "Wait until a queued send completes and a slot is free",
+            1: "Do not queue the send; the returned Future fails with a SendQueueFullException",
+            2: "Do not queue the send; raise a SendQueueFullException to the caller"
+        }
+        return switcher.get(self.value, "Wait until a queued send completes and a slot is free")
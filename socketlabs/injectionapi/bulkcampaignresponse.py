@@ -0,0 +1,90 @@
+from .sendresponse import SendResponse
+from .sendresult import SendResult
+
+
+class BulkCampaignResponse(object):
+    """
+    The aggregated response of a SocketLabsClient.send_bulk_campaign request.
+    Holds the SendResponse of every chunk of recipients, in recipient order.
+    """
+
+    def __init__(self, chunk_responses: list = None):
+        """
+        Initializes a new instance of the BulkCampaignResponse class
+        :param chunk_responses: the SendResponse list, one per chunk of recipients
+        :type chunk_responses: list
+        """
+        self._chunk_responses = []
+        if chunk_responses is not None:
+            for item in chunk_responses:
+                if isinstance(item, SendResponse):
+                    self._chunk_responses.append(item)
+
+    @property
+    def result(self):
+        """
+        Get the result of the campaign. Success when every chunk was sent successfully,
+        otherwise the result of the first chunk that was not.
+        :return the result
+        :rtype SendResult
+        """
+        if len(self._chunk_responses) == 0:
+            return SendResult.RecipientValidationMissingTo
+        for response in self._chunk_responses:
+            if not response.result == SendResult.Success:
+                return response.result
+        return SendResult.Success
+
+    @property
+    def chunk_responses(self):
+        """
+        Get the SendResponse of each chunk of recipients, in recipient order.
+        :return the list of SendResponse
+        :rtype list
+        """
+        return self._chunk_responses
+
+    @property
+    def address_results(self):
+        """
+        Get the AddressResult objects of all chunks, for the addresses that failed.
+        :return the list of AddressResult
+        :rtype list
+        """
+        address_results = []
+        for response in self._chunk_responses:
+            address_results.extend(response.address_results)
+        return address_results
+
+    @property
+    def response_message(self):
+        """
+        A message detailing the result of the campaign.
+        :return the response_message
+        :rtype str
+        """
+        return str(self.result)
+
+    def __str__(self):
+        """
+        Represents the BulkCampaignResponse as a str.
+        :return the string
+        :rtype str
+        """
+        return "{result}: {response_message} ({chunks} requests)" \
+            .format(
+                result=self.result,
+                response_message=self.response_message,
+                chunks=len(self._chunk_responses))
+
+    def to_json(self):
+        """
+        build json dict for BulkCampaignResponse
+        :return the json dictionary
+        :rtype dict
+        """
+        return {
+            "result": self.result.name,
+            "responseMessage": self.response_message,
+            "chunkResponses": [response.to_json() for response in self._chunk_responses]
+        }
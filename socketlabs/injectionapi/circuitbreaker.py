@@ -0,0 +1,255 @@
+import threading
+import time
+from collections import deque
+from http import HTTPStatus
+from http.client import HTTPException
+
+from .circuitstate import CircuitState
+from .clienttimeoutexception import ClientTimeoutException
+
+
+class CircuitOpenException(Exception):
+    """
+    Raised when a request is not sent because the circuit breaker is open.
+    """
+    pass
+
+
+class CircuitBreaker(object):
+    """
+    Stops requests to the Injection API while it is failing, so sends fail fast instead of
+    waiting out connection and request timeouts. The breaker opens when the failure rate of
+    the requests in the recent window reaches the threshold, lets a few trial requests through
+    once the cool-down has passed, and closes again when a trial succeeds. Network errors,
+    timeouts and 5xx responses count as failures; other errors, e.g. of a request body that
+    cannot be read, are not counted, nor are ClientTimeoutExceptions, raised when the client
+    gives up before reaching the Injection API. The breaker is thread-safe and can be shared by several clients.
+
+    :Example:
+
+         def on_state_change(previous, current):
+             print("circuit {0} -> {1}".format(previous.name, current.name))
+
+         client.circuit_breaker = CircuitBreaker(failure_rate_threshold=0.5, cool_down=30,
+                                                 on_state_change=on_state_change)
+
+    """
+
+    FailureStatusCodes = [
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT
+    ]
+    FailureExceptions = (
+        OSError,
+        HTTPException
+    )
+
+    def __init__(self, failure_rate_threshold: float = 0.5, minimum_requests: int = 10, window: float = 30,
+                 cool_down: float = 30, half_open_max_requests: int = 1, on_state_change=None):
+        """
+        Initializes a new instance of the CircuitBreaker class
+        :param failure_rate_threshold: the fraction of failed requests in the window that opens the breaker
+        :type failure_rate_threshold: float
+        :param minimum_requests: the number of requests in the window before the failure rate is considered
+        :type minimum_requests: int
+        :param window: the length in seconds of the window of recent requests
+        :type window: float
+        :param cool_down: the time in seconds the breaker stays open before allowing trial requests
+        :type cool_down: float
+        :param half_open_max_requests: the number of trial requests allowed at once when half-open
+        :type half_open_max_requests: int
+        :param on_state_change: called with the previous and new CircuitState when the state changes
+        :type on_state_change: method
+        """
+        if failure_rate_threshold <= 0 or failure_rate_threshold > 1:
+            raise AttributeError("failure_rate_threshold must be greater than 0 and at most 1")
+        if minimum_requests < 1:
+            raise AttributeError("minimum_requests must be at least 1")
+        if window <= 0:
+            raise AttributeError("window must be greater than 0")
+        if cool_down < 0:
+            raise AttributeError("cool_down must not be negative")
+        if half_open_max_requests < 1:
+            raise AttributeError("half_open_max_requests must be at least 1")
+
+        self._failure_rate_threshold = failure_rate_threshold
+        self._minimum_requests = minimum_requests
+        self._window = window
+        self._cool_down = cool_down
+        self._half_open_max_requests = half_open_max_requests
+        self._on_state_change = on_state_change
+
+        self._state = CircuitState.Closed
+        self._outcomes = deque()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """
+        Get the current state of the breaker
+        :return the state
+        :rtype CircuitState
+        """
+        return self._state
+
+    @property
+    def cool_down(self):
+        """
+        Get the time in seconds the breaker stays open before allowing trial requests
+        :return the cool-down
+        :rtype float
+        """
+        return self._cool_down
+
+    @property
+    def on_state_change(self):
+        """
+        Get the method called with the previous and new CircuitState when the state changes
+        :return the state change hook
+        :rtype method
+        """
+        return self._on_state_change
+
+    @on_state_change.setter
+    def on_state_change(self, val):
+        """
+        Set the method called with the previous and new CircuitState when the state changes
+        :param val: the state change hook
+        :type val: method
+        """
+        self._on_state_change = val
+
+    def allow_request(self):
+        """
+        Check whether a request may be sent. Every allowed request must be followed by a call
+        to record_success, record_failure, record_response, record_exception or record_cancelled.
+        :return the result
+        :rtype bool
+        """
+        with self._lock:
+            change = None
+            if self._state == CircuitState.Open:
+                if time.monotonic() - self._opened_at < self._cool_down:
+                    return False
+                change = self.__transition(CircuitState.HalfOpen)
+
+            if self._state == CircuitState.HalfOpen:
+                if self._trials >= self._half_open_max_requests:
+                    allowed = False
+                else:
+                    self._trials += 1
+                    allowed = True
+            else:
+                allowed = True
+
+        self.__notify(change)
+        return allowed
+
+    def record_success(self):
+        """
+        Record a request that succeeded
+        """
+        with self._lock:
+            change = None
+            if self._state == CircuitState.HalfOpen:
+                change = self.__transition(CircuitState.Closed)
+            elif self._state == CircuitState.Closed:
+                self.__add_outcome(False)
+        self.__notify(change)
+
+    def record_failure(self):
+        """
+        Record a request that failed
+        """
+        with self._lock:
+            change = None
+            if self._state == CircuitState.HalfOpen:
+                change = self.__transition(CircuitState.Open)
+            elif self._state == CircuitState.Closed:
+                self.__add_outcome(True)
+                total = len(self._outcomes)
+                if total >= self._minimum_requests and self._failures / total >= self._failure_rate_threshold:
+                    change = self.__transition(CircuitState.Open)
+        self.__notify(change)
+
+    def record_response(self, status: int):
+        """
+        Record a request by the status code of its response
+        :param status: the HTTP status code
+        :type status: int
+        """
+        if status in self.FailureStatusCodes:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record_exception(self, exception: BaseException):
+        """
+        Record a request that raised an exception. Network errors and timeouts count as failures,
+        any other exception, e.g. a cancelled request or a ClientTimeoutException, is not counted.
+        :param exception: the exception
+        :type exception: BaseException
+        """
+        if isinstance(exception, self.FailureExceptions) and not isinstance(exception, ClientTimeoutException):
+            self.record_failure()
+        else:
+            self.record_cancelled()
+
+    def record_cancelled(self):
+        """
+        Record a request that was abandoned before it completed, without counting it
+        """
+        with self._lock:
+            if self._state == CircuitState.HalfOpen and self._trials > 0:
+                self._trials -= 1
+
+    def reset(self):
+        """
+        Close the breaker and forget the recorded requests
+        """
+        with self._lock:
+            change = self.__transition(CircuitState.Closed)
+        self.__notify(change)
+
+    def __add_outcome(self, failed: bool):
+        """
+        Add a request to the window, dropping requests older than the window
+        """
+        now = time.monotonic()
+        self._outcomes.append((now, failed))
+        if failed:
+            self._failures += 1
+        while self._outcomes and now - self._outcomes[0][0] > self._window:
+            _, old_failed = self._outcomes.popleft()
+            if old_failed:
+                self._failures -= 1
+
+    def __transition(self, state: CircuitState):
+        """
+        Move to a new state. Called with the lock held.
+        :return the previous and new state, or None when the state did not change
+        :rtype tuple
+        """
+        previous = self._state
+        self._state = state
+        self._trials = 0
+        if state == CircuitState.Open:
+            self._opened_at = time.monotonic()
+        if state == CircuitState.Closed:
+            self._outcomes.clear()
+            self._failures = 0
+        if previous == state:
+            return None
+        return previous, state
+
+    def __notify(self, change):
+        """
+        Call the state change hook, outside the lock
+        """
+        if change is not None and self._on_state_change is not None:
+            self._on_state_change(*change)
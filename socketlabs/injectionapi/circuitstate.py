@@ -0,0 +1,29 @@
+from enum import Enum
+
+
+class CircuitState(Enum):
+    """
+    Enumerated state of a CircuitBreaker
+    """
+
+    """ Requests are sent, and their failures are counted """
+    Closed = 0
+
+    """ Requests fail fast without being sent, until the cool-down has passed """
+    Open = 1
+
+    """ A limited number of trial requests are sent to test whether the endpoint has recovered """
+    HalfOpen = 2
+
+    def __str__(self):
+        """
+        String representation of the CircuitState Enum
+        :return the string
+        :rtype str
+        """
+        switcher = {
+            0: "Requests are sent, and their failures are counted",
+            1: "Requests fail fast without being sent, until the cool-down has passed",
+            2: "A limited number of trial requests are sent to test whether the endpoint has recovered"
+        }
+        return switcher.get(self.value, "Requests are sent, and their failures are counted")
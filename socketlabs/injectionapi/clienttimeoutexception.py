@@ -0,0 +1,11 @@
+import socket
+
+
+class ClientTimeoutException(socket.timeout):
+    """
+    Raised when a request times out on the client before reaching the Injection API:
+    no connection of the pool became available in time, or the send deadline had passed.
+    It is a socket.timeout, so the send reports a Timeout, but the circuit breaker does
+    not count it as a failure of the Injection API.
+    """
+    pass
@@ -0,0 +1,38 @@
+from enum import Enum
+
+
+class CompressionMethod(Enum):
+    """
+    Enumerated content encodings for compressing request bodies sent to the Injection API
+    """
+
+    """ gzip content encoding """
+    Gzip = 0
+
+    """ deflate content encoding (zlib format) """
+    Deflate = 1
+
+    @property
+    def content_encoding(self):
+        """
+        Get the value of the Content-Encoding header for the compression method
+        :return the content encoding
+        :rtype str
+        """
+        switcher = {
+            0: "gzip",
+            1: "deflate"
+        }
+        return switcher.get(self.value, "gzip")
+
+    def __str__(self):
+        """
+        String representation of the CompressionMethod Enum
+        :return the string
+        :rtype str
+        """
+        switcher = {
+            0: "gzip content encoding",
+            1: "deflate content encoding (zlib format)"
+        }
+        return switcher.get(self.value, "gzip content encoding")
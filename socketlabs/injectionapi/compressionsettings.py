@@ -0,0 +1,91 @@
+import zlib
+
+from .compressionmethod import CompressionMethod
+from .core.requestbody import RequestBody
+
+
+class CompressionSettings(object):
+    """
+    Settings for compressing request bodies sent to the Injection API.
+    Bodies smaller than the threshold are sent uncompressed.
+
+    :Example:
+
+         client.compression = CompressionSettings(CompressionMethod.Gzip, level=6, threshold=1024)
+
+    """
+
+    def __init__(self, method: CompressionMethod = CompressionMethod.Gzip, level: int = 6, threshold: int = 1024):
+        """
+        Initializes a new instance of the CompressionSettings class
+        :param method: the content encoding to compress with
+        :type method: CompressionMethod
+        :param level: the compression level, from 1 (fastest) to 9 (smallest)
+        :type level: int
+        :param threshold: the minimum size in bytes of a body to compress
+        :type threshold: int
+        """
+        if level < 1 or level > 9:
+            raise AttributeError("level must be between 1 and 9")
+        if threshold < 0:
+            raise AttributeError("threshold must not be negative")
+
+        self._method = method
+        self._level = level
+        self._threshold = threshold
+
+    @property
+    def method(self):
+        """
+        Get the content encoding to compress with
+        :return the compression method
+        :rtype CompressionMethod
+        """
+        return self._method
+
+    @property
+    def level(self):
+        """
+        Get the compression level
+        :return the level
+        :rtype int
+        """
+        return self._level
+
+    @property
+    def threshold(self):
+        """
+        Get the minimum size in bytes of a body to compress
+        :return the threshold
+        :rtype int
+        """
+        return self._threshold
+
+    def should_compress(self, body: RequestBody):
+        """
+        Check whether a body is large enough to be compressed
+        :param body: the request body
+        :type body: RequestBody
+        :return the result
+        :rtype bool
+        """
+        return len(body) >= self._threshold
+
+    def compress(self, body: RequestBody):
+        """
+        Compress a request body. The body is compressed segment by segment, so streamed
+        attachments are read through once without joining the uncompressed body.
+        :param body: the request body
+        :type body: RequestBody
+        :return the compressed request body
+        :rtype RequestBody
+        """
+        wbits = 31 if self._method == CompressionMethod.Gzip else 15
+        compressor = zlib.compressobj(self._level, zlib.DEFLATED, wbits)
+        segments = []
+        for chunk in body:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                segments.append(compressed)
+        segments.append(compressor.flush())
+        return RequestBody(segments, self._method.content_encoding)
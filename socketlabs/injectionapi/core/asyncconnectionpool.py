@@ -0,0 +1,228 @@
+import asyncio
+import collections
+import time
+
+from ..clienttimeoutexception import ClientTimeoutException
+
+
+class AsyncConnectionPool(object):
+    """
+    Pool of keep-alive asyncio stream connections, owned by the AsyncSocketLabsClient.
+    At most max_size connections are open at once, in use or idle; once they are all
+    in use, a send waits for one. The pool is bound to the event loop it is first used on;
+    idle connections left over from a previous event loop are dropped.
+
+    :Example:
+
+        client = AsyncSocketLabsClient(server_id, api_key)
+        client.connection_pool = AsyncConnectionPool(max_size=100, idle_timeout=30)
+
+    """
+
+    def __init__(self, max_size: int = 10, idle_timeout: float = 60):
+        """
+        Initializes a new instance of the AsyncConnectionPool class
+        :param max_size: the maximum number of connections open at once, in use or idle, over all endpoints
+        :type max_size: int
+        :param idle_timeout: seconds an idle connection is kept before it is closed
+        :type idle_timeout: float
+        """
+        if max_size is None or max_size < 1:
+            raise AttributeError("max_size must be greater than 0")
+        if idle_timeout is None or idle_timeout < 0:
+            raise AttributeError("idle_timeout must be greater than or equal to 0")
+
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._idle = {}
+        self._idle_count = 0
+        self._in_use = 0
+        self._waiters = collections.deque()
+        self._loop = None
+        self._closed = False
+
+    @property
+    def max_size(self):
+        """
+        Get the maximum number of connections open at once, in use or idle, over all endpoints
+        :return the maximum pool size
+        :rtype int
+        """
+        return self._max_size
+
+    @property
+    def idle_timeout(self):
+        """
+        Get the number of seconds an idle connection is kept before it is closed
+        :return the idle timeout
+        :rtype float
+        """
+        return self._idle_timeout
+
+    @property
+    def idle_count(self):
+        """
+        Get the number of idle connections currently held by the pool
+        :return the idle connection count
+        :rtype int
+        """
+        return self._idle_count
+
+    @property
+    def in_use_count(self):
+        """
+        Get the number of connections currently checked out of the pool
+        :return the checked out connection count
+        :rtype int
+        """
+        return self._in_use
+
+    async def acquire(self, key: tuple, factory, timeout: float = None):
+        """
+        Check out a connection for the endpoint key. Expired or broken idle connections are
+        closed and skipped. A new connection is created with the factory coroutine when no
+        idle connection is usable, once the number of open connections is below max_size.
+        An idle connection to another endpoint is closed to make room; otherwise the call
+        waits for a release.
+        :param key: the endpoint key the connection is bound to
+        :type key: tuple
+        :param factory: coroutine function returning a new AsyncConnection
+        :type factory: method
+        :param timeout: the seconds to wait for a connection when max_size are in use, None to wait until one is
+        :type timeout: float
+        :return a tuple of the connection and whether it was reused
+        :rtype tuple
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self.__drop_idle()
+            self._waiters = collections.deque()
+            self._loop = loop
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            idle = self._idle.get(key)
+            if idle:
+                connection, released_at = idle.pop()
+                self._idle_count -= 1
+                if time.monotonic() - released_at <= self._idle_timeout and connection.is_healthy():
+                    self._in_use += 1
+                    return connection, True
+                connection.close()
+                continue
+
+            if self._in_use + self._idle_count >= self._max_size:
+                evicted = self.__pop_other_idle()
+                if evicted is None:
+                    await self.__wait(deadline)
+                    continue
+                evicted.close()
+
+            self._in_use += 1
+            try:
+                return await factory(), False
+            except BaseException:
+                self.__return_slot()
+                raise
+
+    def release(self, key: tuple, connection):
+        """
+        Return a connection to the pool after its response has been fully read.
+        :param key: the endpoint key the connection is bound to
+        :type key: tuple
+        :param connection: the connection to return
+        :type connection: AsyncConnection
+        """
+        if not self._closed and connection.is_healthy():
+            self._in_use -= 1
+            self._idle.setdefault(key, collections.deque()).append((connection, time.monotonic()))
+            self._idle_count += 1
+            self.__notify()
+            return
+        self.__return_slot()
+        connection.close()
+
+    def discard(self, connection):
+        """
+        Close a checked out connection that must not be reused, e.g. after an error.
+        :param connection: the connection to discard
+        :type connection: AsyncConnection
+        """
+        self.__return_slot()
+        connection.close()
+
+    def close(self):
+        """
+        Close all idle connections.
+        """
+        self._closed = True
+        self.__drop_idle()
+        while self._waiters:
+            self.__notify()
+
+    async def __wait(self, deadline: float):
+        """
+        Wait until a connection is released or discarded
+        :param deadline: the time.monotonic() value to wait until at most, if any
+        :type deadline: float
+        """
+        remaining = deadline - time.monotonic() if deadline is not None else None
+        if remaining is not None and remaining <= 0:
+            raise ClientTimeoutException("No connection of the pool became available in time")
+
+        waiter = self._loop.create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, remaining)
+        except asyncio.TimeoutError:
+            raise ClientTimeoutException("No connection of the pool became available in time")
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # pass the wake-up on to the next waiter
+                self.__notify()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def __notify(self):
+        """
+        Wake the longest waiting acquire, if any
+        """
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def __return_slot(self):
+        """
+        Give back the slot of a checked out connection that was closed, waking a waiting acquire
+        """
+        self._in_use -= 1
+        self.__notify()
+
+    def __pop_other_idle(self):
+        """
+        Take the least recently released idle connection, to close it and open one to another endpoint.
+        :return the connection, or None when no connection is idle
+        :rtype AsyncConnection
+        """
+        oldest = None
+        for key, idle in self._idle.items():
+            if idle and (oldest is None or idle[0][1] < self._idle[oldest][0][1]):
+                oldest = key
+        if oldest is None:
+            return None
+        self._idle_count -= 1
+        return self._idle[oldest].popleft()[0]
+
+    def __drop_idle(self):
+        """
+        Close and forget all idle connections.
+        """
+        idle, self._idle = self._idle, {}
+        self._idle_count = 0
+        for entries in idle.values():
+            for connection, _ in entries:
+                connection.close()
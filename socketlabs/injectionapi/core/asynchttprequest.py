@@ -0,0 +1,483 @@
+import asyncio
+import http.client
+import socket
+import ssl
+import sys
+import time
+
+from ..version import __version__
+from ..circuitbreaker import CircuitBreaker, CircuitOpenException
+from ..clienttimeoutexception import ClientTimeoutException
+from ..proxy import Proxy
+from ..sendevent import SendEvent
+from ..sendphase import SendPhase
+
+from .stringextension import StringExtension
+from .asyncconnectionpool import AsyncConnectionPool
+from .httpendpoint import HttpEndpoint
+from .httpresponse import HttpResponse
+from .requestbody import RequestBody
+
+
+class AsyncConnection(object):
+    """
+    A single HTTP/1.1 connection over asyncio streams.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Creates a new instance of the AsyncConnection class
+        :param reader: the stream reader of the connection
+        :type reader: StreamReader
+        :param writer: the stream writer of the connection
+        :type writer: StreamWriter
+        """
+        self._reader = reader
+        self._writer = writer
+        self._will_close = False
+
+    def is_healthy(self):
+        """
+        Check that the connection can be used for another request
+        :return the result
+        :rtype bool
+        """
+        return not (self._will_close or self._reader.at_eof() or self._writer.transport.is_closing())
+
+    def close(self):
+        """
+        Close the connection
+        """
+        try:
+            self._writer.close()
+        except RuntimeError:
+            # the event loop the connection was opened on is already closed
+            pass
+
+    async def write_request(self, method: str, host: str, url: str, body: RequestBody, headers: dict,
+                            event: SendEvent = None):
+        """
+        Write the request
+        :param method: the HTTP method
+        :type method: str
+        :param host: the value of the Host header
+        :type host: str
+        :param url: the request path
+        :type url: str
+        :param body: the request body
+        :type body: RequestBody
+        :param headers: the request headers
+        :type headers: dict
+        :param event: the event the timing of the write is added to, if any
+        :type event: SendEvent
+        """
+        lines = ["{0} {1} HTTP/1.1".format(method, url), "Host: {0}".format(host),
+                 "Content-Length: {0}".format(len(body))]
+        if body.content_encoding is not None:
+            lines.append("Content-Encoding: {0}".format(body.content_encoding))
+        for name, value in headers.items():
+            lines.append("{0}: {1}".format(name, value))
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+        started = time.perf_counter()
+        self._writer.write(head)
+        for segment in body.segments:
+            if isinstance(segment, bytes):
+                self._writer.write(segment)
+                await self._writer.drain()
+            else:
+                await self.__write_stream(segment)
+        if event is not None:
+            event.add_timing(SendPhase.Write, time.perf_counter() - started)
+
+    async def __write_stream(self, segment):
+        """
+        Write a streamed segment, such as an AttachmentStream. Its chunks are produced in
+        the loop's default executor, so reading the file does not block the event loop.
+        :param segment: the iterable of byte chunks
+        :type segment: iterable
+        """
+        loop = asyncio.get_running_loop()
+        chunks = iter(segment)
+        while True:
+            chunk = await loop.run_in_executor(None, next, chunks, None)
+            if chunk is None:
+                break
+            self._writer.write(chunk)
+            await self._writer.drain()
+
+    async def read_response(self, event: SendEvent = None):
+        """
+        Read the status line, headers and body of the response to the request written.
+        A connection closed before the response was complete raises RemoteDisconnected.
+        :param event: the event the timings of the wait and the read are added to, if any
+        :type event: SendEvent
+        :return the response
+        :rtype HttpResponse
+        """
+        try:
+            return await self.__read_response(event)
+        except asyncio.IncompleteReadError:
+            raise http.client.RemoteDisconnected("The server closed the connection before the response was complete")
+
+    async def __read_response(self, event: SendEvent = None):
+        """
+        Read the status line, headers and body of a response
+        :param event: the event the timings of the wait and the read are added to, if any
+        :type event: SendEvent
+        :return the response
+        :rtype HttpResponse
+        """
+        started = time.perf_counter()
+        status_line = (await self._reader.readline()).decode("latin-1").rstrip("\r\n")
+        received = time.perf_counter()
+        if not status_line:
+            raise http.client.RemoteDisconnected("The server closed the connection without sending a response")
+        version, status, reason = (status_line.split(" ", 2) + [""])[:3]
+
+        headers = []
+        while True:
+            line = (await self._reader.readline()).decode("latin-1").rstrip("\r\n")
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers.append((name.strip(), value.strip()))
+        response = HttpResponse(int(status), reason, headers)
+
+        connection = (response.getheader("Connection") or "").lower()
+        self._will_close = connection == "close" or (version == "HTTP/1.0" and connection != "keep-alive")
+
+        if (response.getheader("Transfer-Encoding") or "").lower() == "chunked":
+            body = await self.__read_chunked()
+        elif response.getheader("Content-Length") is not None:
+            body = await self._reader.readexactly(int(response.getheader("Content-Length")))
+        else:
+            body = await self._reader.read()
+            self._will_close = True
+
+        if event is not None:
+            event.add_timing(SendPhase.Wait, received - started, received)
+            event.add_timing(SendPhase.Read, time.perf_counter() - received)
+        return HttpResponse(response.status, reason, headers, body)
+
+    async def __read_chunked(self):
+        """
+        Read a body sent with chunked transfer encoding
+        :return the body
+        :rtype bytes
+        """
+        chunks = []
+        while True:
+            size = int((await self._reader.readline()).split(b";")[0].strip(), 16)
+            if size == 0:
+                while (await self._reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await self._reader.readexactly(size))
+            await self._reader.readexactly(2)
+
+
+class AsyncHttpRequest(object):
+    """
+    Non-blocking HTTP request to the Injection API, built on asyncio streams
+    """
+
+    StaleConnectionErrors = (
+        ConnectionResetError,
+        ConnectionAbortedError,
+        BrokenPipeError
+    )
+    """ Errors writing the request on a reused connection the server has already closed """
+
+    def __init__(self, endpoint: HttpEndpoint, timeout: int, authentication: str,
+                 connection_pool: AsyncConnectionPool = None, circuit_breaker: CircuitBreaker = None):
+        """
+        Creates a new instance of the AsyncHttpRequest class
+        :param endpoint: the Http endpoint for the HTTP request
+        :type endpoint: HttpEndpoint
+        :param timeout: the timeout in seconds, used for connecting and reading unless set separately
+        :type timeout: int
+        :param authentication: the API key to include as a bearer token
+        :type authentication: str
+        :param connection_pool: the pool to draw keep-alive connections from, if any
+        :type connection_pool: AsyncConnectionPool
+        :param circuit_breaker: the circuit breaker guarding the endpoint, if any
+        :type circuit_breaker: CircuitBreaker
+        """
+        self._endpoint = endpoint
+        self._http_proxy = None
+        self._timeout = timeout
+        self._connect_timeout = None
+        self._read_timeout = None
+        self._connection_pool = connection_pool
+        self._circuit_breaker = circuit_breaker
+        self._headers = {
+            'User-Agent': "SocketLabs-python/{0};python({1})".format(__version__, sys.version.split(' ')[0]),
+            'Content-Type': 'application/json; charset=utf-8',
+            'Accept': 'application/json',
+        }
+        if not StringExtension.is_none_or_white_space(authentication):
+            self._headers["Authorization"] = "Bearer " + authentication
+
+    @property
+    def connect_timeout(self):
+        """
+        Get the timeout in seconds for opening a connection, including the proxy tunnel
+        and the TLS handshake. Falls back to the request timeout when not set.
+        :return the connect timeout
+        :rtype float
+        """
+        return self._connect_timeout if self._connect_timeout is not None else self._timeout
+
+    @connect_timeout.setter
+    def connect_timeout(self, val: float):
+        """
+        Set the timeout in seconds for opening a connection
+        :param val: the connect timeout, or None to use the request timeout
+        :type val: float
+        """
+        self._connect_timeout = val
+
+    @property
+    def read_timeout(self):
+        """
+        Get the timeout in seconds for writing the request and reading the response
+        once connected. Falls back to the request timeout when not set.
+        :return the read timeout
+        :rtype float
+        """
+        return self._read_timeout if self._read_timeout is not None else self._timeout
+
+    @read_timeout.setter
+    def read_timeout(self, val: float):
+        """
+        Set the timeout in seconds for writing the request and reading the response
+        :param val: the read timeout, or None to use the request timeout
+        :type val: float
+        """
+        self._read_timeout = val
+
+    @property
+    def proxy(self):
+        """
+        Get the Proxy to use when making the HTTP request
+        :return the Proxy to use for the HTTP request
+        :rtype Proxy
+        """
+        return self._http_proxy
+
+    @proxy.setter
+    def proxy(self, val: Proxy):
+        """
+        Set the Proxy to use when making the HTTP request
+        :param val: the Proxy to use for the HTTP request
+        :type val: Proxy
+        """
+        self._http_proxy = val
+
+    async def send_request(self, request: RequestBody, deadline: float = None, event: SendEvent = None):
+        """
+        Send the HTTP Request
+        :param request: the serialized request body
+        :type request: RequestBody
+        :param deadline: the time.monotonic() value by which the request must complete, if any.
+                         The connect and read timeouts are shortened to the time remaining.
+        :type deadline: float
+        :param event: the event the attempt and the timings of the request are added to, if any
+        :type event: SendEvent
+        :return the injection response received from the request
+        :rtype HttpResponse
+        """
+        breaker = self._circuit_breaker
+        if breaker is None and event is None:
+            return await self.__send_body(request, deadline)
+
+        if breaker is not None and not breaker.allow_request():
+            raise CircuitOpenException("The circuit breaker for {0} is open".format(self._endpoint.host))
+        if event is not None:
+            event.start_attempt()
+        try:
+            response = await self.__send_body(request, deadline, event)
+        except BaseException as e:
+            # any exception resolves the attempt, so a cancelled half-open trial is never left taken
+            if breaker is not None:
+                breaker.record_exception(e)
+            if event is not None:
+                event.end_attempt()
+            raise
+        if breaker is not None:
+            breaker.record_response(response.status)
+        if event is not None:
+            event.end_attempt(response.status)
+        return response
+
+    async def __send_body(self, body: RequestBody, deadline: float, event: SendEvent = None):
+        """
+        Send the request body, replacing pooled connections the server has closed.
+        The request is only written again on another connection when writing it failed;
+        once it is written the server may have accepted it, so any later error is raised
+        and left to the retry settings.
+        :param body: the request body
+        :type body: RequestBody
+        :param deadline: the time.monotonic() value by which the request must complete, if any
+        :type deadline: float
+        :param event: the event the timings of the request are added to, if any
+        :type event: SendEvent
+        :return the response
+        :rtype HttpResponse
+        """
+        try:
+            while True:
+                started = time.perf_counter()
+                connection, reused = await self.__get_connection(deadline)
+                if event is not None:
+                    event.add_timing(SendPhase.Connect, time.perf_counter() - started)
+                try:
+                    await asyncio.wait_for(
+                        connection.write_request("POST", self.__host_header, self._endpoint.url, body,
+                                                 self._headers, event),
+                        self.__bounded_timeout(self.read_timeout, deadline))
+
+                except self.StaleConnectionErrors:
+                    self.__discard_connection(connection)
+                    if not reused:
+                        raise
+                    # the server closed the idle keep-alive connection before reading the request, try another one
+                    continue
+
+                except BaseException:
+                    self.__discard_connection(connection)
+                    raise
+
+                try:
+                    response = await asyncio.wait_for(
+                        connection.read_response(event), self.__bounded_timeout(self.read_timeout, deadline))
+                except BaseException:
+                    self.__discard_connection(connection)
+                    raise
+
+                self.__release_connection(connection)
+                return response
+
+        except ClientTimeoutException:
+            raise
+        except asyncio.TimeoutError:
+            raise socket.timeout("The request to the Injection API timed out")
+
+    @property
+    def __host_header(self):
+        """
+        The value of the Host header for the endpoint
+        :return the host header
+        :rtype str
+        """
+        default_port = 80 if self._endpoint.scheme == "http" else 443
+        if self._endpoint.port == default_port:
+            return self._endpoint.host
+        return "{0}:{1}".format(self._endpoint.host, self._endpoint.port)
+
+    @property
+    def __pool_key(self):
+        """
+        The key identifying connections that can be shared with this request
+        :return the pool key
+        :rtype tuple
+        """
+        proxy = self._http_proxy
+        return (self._endpoint.scheme, self._endpoint.host, self._endpoint.port,
+                proxy.host if proxy is not None else None,
+                proxy.port if proxy is not None else None)
+
+    @staticmethod
+    def __bounded_timeout(timeout: float, deadline: float):
+        """
+        Shorten a timeout to the time remaining before the deadline
+        :param timeout: the timeout in seconds
+        :type timeout: float
+        :param deadline: the time.monotonic() value by which the request must complete, if any
+        :type deadline: float
+        :return the timeout to use
+        :rtype float
+        """
+        if deadline is None:
+            return timeout
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise ClientTimeoutException("The send deadline passed before the request completed")
+        return remaining if timeout is None else min(timeout, remaining)
+
+    async def __get_connection(self, deadline: float):
+        """
+        Get a connection for the request, from the pool when one is configured.
+        :param deadline: the time.monotonic() value by which the request must complete, if any
+        :type deadline: float
+        :return the connection and whether it was reused from the pool
+        :rtype tuple
+        """
+        if self._connection_pool is None:
+            return await self.__new_connection(deadline), False
+        return await self._connection_pool.acquire(self.__pool_key, lambda: self.__new_connection(deadline),
+                                                   self.__bounded_timeout(self.connect_timeout, deadline))
+
+    def __release_connection(self, connection: AsyncConnection):
+        """
+        Return the connection to the pool, or close it when no pool is configured.
+        :param connection: the connection to release
+        :type connection: AsyncConnection
+        """
+        if self._connection_pool is None:
+            connection.close()
+        else:
+            self._connection_pool.release(self.__pool_key, connection)
+
+    def __discard_connection(self, connection: AsyncConnection):
+        """
+        Close a connection that failed and must not be reused.
+        :param connection: the connection to discard
+        :type connection: AsyncConnection
+        """
+        if self._connection_pool is None:
+            connection.close()
+        else:
+            self._connection_pool.discard(connection)
+
+    async def __new_connection(self, deadline: float = None):
+        """
+        Opens a connection to the server, tunnelling through the proxy if one is set.
+        Connecting, the proxy tunnel and the TLS handshake are bounded by the connect timeout.
+        :param deadline: the time.monotonic() value by which the request must complete, if any
+        :type deadline: float
+        :return the connection to use in the request
+        :rtype AsyncConnection
+        """
+        connect_timeout = self.__bounded_timeout(self.connect_timeout, deadline)
+        ssl_context = ssl.create_default_context() if self._endpoint.scheme == "https" else None
+
+        if self._http_proxy is None:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self._endpoint.host, self._endpoint.port, ssl=ssl_context),
+                connect_timeout)
+            return AsyncConnection(reader, writer)
+
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self._http_proxy.host, self._http_proxy.port), connect_timeout)
+        target = "{0}:{1}".format(self._endpoint.host, self._endpoint.port)
+        writer.write("CONNECT {0} HTTP/1.1\r\nHost: {0}\r\n\r\n".format(target).encode("latin-1"))
+        await writer.drain()
+
+        status_line = (await reader.readline()).decode("latin-1")
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+        if len(status_line.split(" ")) < 2 or status_line.split(" ")[1] != "200":
+            writer.close()
+            raise OSError("Tunnel connection failed: {0}".format(status_line.strip()))
+
+        if ssl_context is not None:
+            if not hasattr(writer, "start_tls"):
+                writer.close()
+                raise Exception("Proxy tunnelling with the AsyncSocketLabsClient requires Python 3.11 or later")
+            await asyncio.wait_for(
+                writer.start_tls(ssl_context, server_hostname=self._endpoint.host),
+                self.__bounded_timeout(self.connect_timeout, deadline))
+
+        return AsyncConnection(reader, writer)
@@ -0,0 +1,71 @@
+from http import HTTPStatus
+from http.client import HTTPException
+from ..retrysettings import RetrySettings
+from ..sendevent import SendEvent
+from ..sendphase import SendPhase
+from .asynchttprequest import AsyncHttpRequest
+from .retryhandler import RetryHandler, get_retry_after
+import asyncio
+import socket
+import time
+
+
+class AsyncRetryHandler(object):
+    """
+    Retries requests made with the AsyncHttpRequest. Waiting between attempts
+    suspends the coroutine on the event loop instead of blocking a thread.
+    """
+
+    ErrorStatusCodes = RetryHandler.ErrorStatusCodes
+
+    def __init__(self, http_client: AsyncHttpRequest, settings: RetrySettings):
+
+        self.__http_client = http_client
+        self.__retry_settings = settings
+
+    async def send(self, body, event: SendEvent = None):
+
+        settings = self.__retry_settings
+        started = time.monotonic()
+        deadline = started + settings.deadline.total_seconds() if settings.deadline is not None else None
+        if settings.maximum_number_of_retries == 0:
+            return await self.__http_client.send_request(body, deadline, event)
+
+        attempts = 0
+        while True:
+
+            try:
+
+                response = await self.__http_client.send_request(body, deadline, event)
+
+            except (socket.timeout, HTTPException):
+
+                wait = settings.get_next_wait_interval(attempts).total_seconds()
+                if not settings.can_retry(attempts, wait, time.monotonic() - started):
+                    raise
+                attempts += 1
+                await self.__sleep(wait, event)
+                continue
+
+            if response.status not in self.ErrorStatusCodes:
+                return response
+
+            wait = get_retry_after(response)
+            if wait is None:
+                wait = settings.get_next_wait_interval(attempts).total_seconds()
+            if not settings.can_retry(attempts, wait, time.monotonic() - started):
+                if response.status == HTTPStatus.TOO_MANY_REQUESTS:
+                    # parsed as OverQuota by the caller
+                    return response
+                raise HTTPException("HttpStatusCode: {0}. Response contains server error.".format(response.status))
+            attempts += 1
+            await self.__sleep(wait, event)
+
+    @staticmethod
+    async def __sleep(wait: float, event: SendEvent = None):
+        """
+        Wait before the next attempt, adding the wait to the Backoff timing of the event
+        """
+        await asyncio.sleep(wait)
+        if event is not None:
+            event.add_timing(SendPhase.Backoff, wait)
@@ -0,0 +1,219 @@
+import collections
+import select
+import threading
+import time
+
+from ..clienttimeoutexception import ClientTimeoutException
+
+
+class ConnectionPool(object):
+    """
+    Thread-safe pool of keep-alive HTTP connections, owned by the SocketLabsClient
+    so that consecutive sends reuse an open TCP/TLS connection instead of
+    performing a new handshake for every message. At most max_size connections are
+    open at once, in use or idle; once they are all in use, a send waits for one.
+
+    :Example:
+
+        client = SocketLabsClient(server_id, api_key)
+        client.connection_pool = ConnectionPool(max_size=20, idle_timeout=30)
+
+    """
+
+    def __init__(self, max_size: int = 10, idle_timeout: float = 60):
+        """
+        Initializes a new instance of the ConnectionPool class
+        :param max_size: the maximum number of connections open at once, in use or idle, over all endpoints
+        :type max_size: int
+        :param idle_timeout: seconds an idle connection is kept before it is closed
+        :type idle_timeout: float
+        """
+        if max_size is None or max_size < 1:
+            raise AttributeError("max_size must be greater than 0")
+        if idle_timeout is None or idle_timeout < 0:
+            raise AttributeError("idle_timeout must be greater than or equal to 0")
+
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._idle = {}
+        self._idle_count = 0
+        self._in_use = 0
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._closed = False
+
+    @property
+    def max_size(self):
+        """
+        Get the maximum number of connections open at once, in use or idle, over all endpoints
+        :return the maximum pool size
+        :rtype int
+        """
+        return self._max_size
+
+    @property
+    def idle_timeout(self):
+        """
+        Get the number of seconds an idle connection is kept before it is closed
+        :return the idle timeout
+        :rtype float
+        """
+        return self._idle_timeout
+
+    @property
+    def idle_count(self):
+        """
+        Get the number of idle connections currently held by the pool
+        :return the idle connection count
+        :rtype int
+        """
+        with self._lock:
+            return self._idle_count
+
+    @property
+    def in_use_count(self):
+        """
+        Get the number of connections currently checked out of the pool
+        :return the checked out connection count
+        :rtype int
+        """
+        with self._lock:
+            return self._in_use
+
+    def acquire(self, key: tuple, factory, timeout: float = None):
+        """
+        Check out a connection for the endpoint key. Idle connections are health checked
+        before they are handed out; expired or broken connections are closed and skipped.
+        A new connection is created with the factory when no idle connection is usable,
+        once the number of open connections is below max_size. An idle connection to
+        another endpoint is closed to make room; otherwise the call waits for a release.
+        :param key: the endpoint key the connection is bound to
+        :type key: tuple
+        :param factory: callable returning a new HTTPConnection
+        :type factory: method
+        :param timeout: the seconds to wait for a connection when max_size are in use, None to wait until one is
+        :type timeout: float
+        :return a tuple of the connection and whether it was reused
+        :rtype tuple
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            evicted = None
+            with self._available:
+                while True:
+                    idle = self._idle.get(key)
+                    if idle:
+                        entry = idle.pop()
+                        self._idle_count -= 1
+                        break
+                    entry = None
+                    if self._in_use + self._idle_count < self._max_size:
+                        break
+                    evicted = self.__pop_other_idle()
+                    if evicted is not None:
+                        break
+                    remaining = deadline - time.monotonic() if deadline is not None else None
+                    if remaining is not None and remaining <= 0:
+                        raise ClientTimeoutException("No connection of the pool became available in time")
+                    self._available.wait(remaining)
+                self._in_use += 1
+
+            if evicted is not None:
+                evicted.close()
+            if entry is None:
+                try:
+                    return factory(), False
+                except BaseException:
+                    self.__return_slot()
+                    raise
+
+            connection, released_at = entry
+            if time.monotonic() - released_at <= self._idle_timeout and self.__is_healthy(connection):
+                return connection, True
+
+            connection.close()
+            self.__return_slot()
+
+    def release(self, key: tuple, connection):
+        """
+        Return a connection to the pool after its response has been fully read.
+        Connections the server asked to close, or released after the pool was closed, are closed.
+        :param key: the endpoint key the connection is bound to
+        :type key: tuple
+        :param connection: the connection to return
+        :type connection: HTTPConnection
+        """
+        with self._available:
+            self._in_use -= 1
+            self._available.notify()
+            if not self._closed and connection.sock is not None:
+                self._idle.setdefault(key, collections.deque()).append((connection, time.monotonic()))
+                self._idle_count += 1
+                return
+        connection.close()
+
+    def discard(self, connection):
+        """
+        Close a checked out connection that must not be reused, e.g. after an error.
+        :param connection: the connection to discard
+        :type connection: HTTPConnection
+        """
+        self.__return_slot()
+        connection.close()
+
+    def close(self):
+        """
+        Close all idle connections. Connections released after the pool is closed
+        are closed instead of being kept.
+        """
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, {}
+            self._idle_count = 0
+            self._available.notify_all()
+        for entries in idle.values():
+            for connection, _ in entries:
+                connection.close()
+
+    def __return_slot(self):
+        """
+        Give back the slot of a checked out connection that was closed, waking a waiting acquire
+        """
+        with self._available:
+            self._in_use -= 1
+            self._available.notify()
+
+    def __pop_other_idle(self):
+        """
+        Take the least recently released idle connection, to close it and open one to another endpoint.
+        Must be called with the lock held.
+        :return the connection, or None when no connection is idle
+        :rtype HTTPConnection
+        """
+        oldest = None
+        for key, idle in self._idle.items():
+            if idle and (oldest is None or idle[0][1] < self._idle[oldest][0][1]):
+                oldest = key
+        if oldest is None:
+            return None
+        self._idle_count -= 1
+        return self._idle[oldest].popleft()[0]
+
+    @staticmethod
+    def __is_healthy(connection):
+        """
+        Check that an idle connection is still usable. An idle keep-alive socket should have
+        nothing to read; if it is readable the server has closed it or sent unexpected data.
+        :param connection: the connection to check
+        :type connection: HTTPConnection
+        :return the result
+        :rtype bool
+        """
+        sock = connection.sock
+        if sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
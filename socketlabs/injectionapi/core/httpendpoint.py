@@ -14,7 +14,9 @@ class HttpEndpoint(object):
         :type url: str
         """
         parsed_url = urlparse(url)
+        self._scheme = parsed_url.scheme or "https"
         self._host = parsed_url.hostname
+        self._port = parsed_url.port or (80 if self._scheme == "http" else 443)
         self._url = parsed_url.path
 
 
@@ -35,3 +37,21 @@ class HttpEndpoint(object):
         :rtype str
         """
         return self._host
+
+    @property
+    def scheme(self):
+        """
+        Get the HTTP endpoint scheme, http or https
+        :return the scheme
+        :rtype str
+        """
+        return self._scheme
+
+    @property
+    def port(self):
+        """
+        Get the HTTP endpoint port
+        :return the port
+        :rtype int
+        """
+        return self._port
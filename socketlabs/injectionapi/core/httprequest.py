@@ -1,18 +1,24 @@
 import http
 import http.client
-import json
 import threading
 import sys
-import queue
+import socket
+import time
 from enum import Enum
 
 from ..version import __version__
+from ..circuitbreaker import CircuitBreaker, CircuitOpenException
+from ..clienttimeoutexception import ClientTimeoutException
 from ..proxy import Proxy
+from ..sendevent import SendEvent
+from ..sendphase import SendPhase
 
 from .stringextension import StringExtension
+from .connectionpool import ConnectionPool
 from .httpendpoint import HttpEndpoint
-from .injectionresponseparser import InjectionResponseParser
-from .serialization.injectionrequest import InjectionRequest
+from .httpresponse import HttpResponse
+from .requestbody import RequestBody
+from .sendexecutor import SendExecutor
 
 
 class HttpRequest(object):
@@ -29,19 +35,46 @@ class HttpRequest(object):
         PUT = 2
         DELETE = 3
 
-    def __init__(self, method: HttpRequestMethod, endpoint: HttpEndpoint, timeout: int, authentication: str):
+    BufferedBodySize = 1024 * 1024
+    """ Bodies up to this size are joined and written with the headers in one send """
+
+    StaleConnectionErrors = (
+        ConnectionResetError,
+        ConnectionAbortedError,
+        BrokenPipeError
+    )
+    """ Errors writing the request on a reused connection the server has already closed """
+
+    def __init__(self, method: HttpRequestMethod, endpoint: HttpEndpoint, timeout: int, authentication: str,
+                 connection_pool: ConnectionPool = None, executor: SendExecutor = None,
+                 circuit_breaker: CircuitBreaker = None):
         """
         Creates a new instance of the HTTP Request class
         :param method: the HTTP request method
         :type method: HttpRequestMethod
         :param endpoint: the Http endpoint for the HTTP request
         :type endpoint: HttpEndpoint
+        :param timeout: the timeout in seconds, used for connecting and reading unless set separately
+        :type timeout: int
+        :param authentication: the API key to include as a bearer token
+        :type authentication: str
+        :param connection_pool: the pool to draw keep-alive connections from, if any
+        :type connection_pool: ConnectionPool
+        :param executor: the worker pool that runs asynchronous requests, if any
+        :type executor: SendExecutor
+        :param circuit_breaker: the circuit breaker guarding the endpoint, if any
+        :type circuit_breaker: CircuitBreaker
         """
         self._request_method = method
         self._endpoint = endpoint
         self._http_proxy = None
         self._timeout = timeout
+        self._connect_timeout = None
+        self._read_timeout = None
         self._authentication = authentication
+        self._connection_pool = connection_pool
+        self._executor = executor
+        self._circuit_breaker = circuit_breaker
         self._headers = {
             'User-Agent': self.__user_agent,
             'Content-Type': 'application/json; charset=utf-8',
@@ -87,6 +120,44 @@ class HttpRequest(object):
         """ 
         return self._timeout       
 
+    @property
+    def connect_timeout(self):
+        """
+        Get the timeout in seconds for opening a connection, including the proxy tunnel
+        and the TLS handshake. Falls back to the request timeout when not set.
+        :return the connect timeout
+        :rtype float
+        """
+        return self._connect_timeout if self._connect_timeout is not None else self._timeout
+
+    @connect_timeout.setter
+    def connect_timeout(self, val: float):
+        """
+        Set the timeout in seconds for opening a connection
+        :param val: the connect timeout, or None to use the request timeout
+        :type val: float
+        """
+        self._connect_timeout = val
+
+    @property
+    def read_timeout(self):
+        """
+        Get the timeout in seconds for each socket read and write once connected.
+        Falls back to the request timeout when not set.
+        :return the read timeout
+        :rtype float
+        """
+        return self._read_timeout if self._read_timeout is not None else self._timeout
+
+    @read_timeout.setter
+    def read_timeout(self, val: float):
+        """
+        Set the timeout in seconds for each socket read and write once connected
+        :param val: the read timeout, or None to use the request timeout
+        :type val: float
+        """
+        self._read_timeout = val
+
     @property
     def proxy(self):
         """
@@ -105,76 +176,289 @@ class HttpRequest(object):
         """
         self._http_proxy = val
 
-    def send_async_request(self, request: InjectionRequest, on_success_callback, on_error_callback):
+    def send_async_request(self, request: RequestBody, on_success_callback, on_error_callback, deadline: float = None,
+                           event: SendEvent = None):
         """
-        Send an HTTP Request asynchronously
-        :param request: the injection request to send
-        :type request: InjectionRequest
+        Send an HTTP Request asynchronously. The request runs on the executor's worker
+        threads when an executor is set, otherwise on a new thread.
+        :param request: the serialized request body
+        :type request: RequestBody
         :param on_success_callback: the callback method for success
         :type on_success_callback: method
         :param on_error_callback: the callback method for error
         :type on_error_callback: method
+        :param deadline: the time.monotonic() value by which the request must complete, if any
+        :type deadline: float
+        :param event: the event the timings of the request are added to, if any
+        :type event: SendEvent
         """
 
         try:
-            print (request)
-            th = threading.Thread(target=self.__queue_request,
-                                  kwargs={
-                                      "request": request,
-                                      "on_success_callback": on_success_callback,
-                                      "on_error_callback": on_error_callback
-                                  })
-            th.start()
-            
+            if self._executor is not None:
+                self._executor.submit(self.__queue_request, request, on_success_callback, on_error_callback, deadline,
+                                      event)
+            else:
+                th = threading.Thread(target=self.__queue_request,
+                                      kwargs={
+                                          "request": request,
+                                          "on_success_callback": on_success_callback,
+                                          "on_error_callback": on_error_callback,
+                                          "deadline": deadline,
+                                          "event": event
+                                      })
+                th.start()
+
         except Exception as e:
             on_error_callback(e)
 
-    def __queue_request(self, request: InjectionRequest, on_success_callback, on_error_callback):
+    def __queue_request(self, request: RequestBody, on_success_callback, on_error_callback, deadline: float = None,
+                        event: SendEvent = None):
         """
         queue method for the threaded send request.
-        :param request: the injection request to send
-        :type request: InjectionRequest
-        :param out_queue: the Queue object to handle the response
-        :type out_queue: Queue
+        :param request: the serialized request body
+        :type request: RequestBody
+        :param on_success_callback: the callback method for success
+        :type on_success_callback: method
+        :param on_error_callback: the callback method for error
+        :type on_error_callback: method
+        :param deadline: the time.monotonic() value by which the request must complete, if any
+        :type deadline: float
+        :param event: the event the timings of the request are added to, if any
+        :type event: SendEvent
         """
         try:
-            response = self.send_request(request)
-            on_success_callback(response)
+            response = self.send_request(request, deadline, event)
 
-        except Exception:
-            on_error_callback(sys.exc_info()[0])
+        except Exception as e:
+            on_error_callback(e)
+            return
+
+        on_success_callback(response)
 
-    def send_request(self, request: InjectionRequest):
+    def send_request(self, request: RequestBody, deadline: float = None, event: SendEvent = None):
         """
-        Send the HTTP Request
-        :param request: the injection request to send
-        :type request: InjectionRequest
+        Send the HTTP Request. The response body is read in full so that the
+        connection can be returned to the pool for the next request.
+        :param request: the serialized request body
+        :type request: RequestBody
+        :param deadline: the time.monotonic() value by which the request must complete, if any.
+                         The connect and read timeouts are shortened to the time remaining.
+        :type deadline: float
+        :param event: the event the attempt and the timings of the request are added to, if any
+        :type event: SendEvent
         :return the injection response received from the request
-        :rtype InjectionResponse
+        :rtype HttpResponse
         """
+        breaker = self._circuit_breaker
+        if breaker is None and event is None:
+            return self.__send_body(request, deadline)
 
-        json_body = json.dumps(request.to_json())
-
+        if breaker is not None and not breaker.allow_request():
+            raise CircuitOpenException("The circuit breaker for {0} is open".format(self._endpoint.host))
+        if event is not None:
+            event.start_attempt()
         try:
-            connection = self.__get_connection()
-            connection.request("POST", self._endpoint.url, json_body, self._headers)
+            response = self.__send_body(request, deadline, event)
+        except BaseException as e:
+            # any exception resolves the attempt, so a half-open trial is never left taken
+            if breaker is not None:
+                breaker.record_exception(e)
+            if event is not None:
+                event.end_attempt()
+            raise
+        if breaker is not None:
+            breaker.record_response(response.status)
+        if event is not None:
+            event.end_attempt(response.status)
+        return response
+
+    def __send_body(self, json_body: RequestBody, deadline: float, event: SendEvent = None):
+        """
+        Send the request body, replacing pooled connections the server has closed.
+        The request is only written again on another connection when writing it failed;
+        once it is written the server may have accepted it, so any later error is raised
+        and left to the retry settings.
+        :param json_body: the request body
+        :type json_body: RequestBody
+        :param deadline: the time.monotonic() value by which the request must complete, if any
+        :type deadline: float
+        :param event: the event the timings of the request are added to, if any
+        :type event: SendEvent
+        :return the response
+        :rtype HttpResponse
+        """
+        while True:
+            started = time.perf_counter()
+            connection, reused = self.__get_connection(deadline)
+            written = time.perf_counter()
+            if event is not None:
+                event.add_timing(SendPhase.Connect, written - started, written)
+            try:
+                self.__write_request(connection, json_body)
+
+            except self.StaleConnectionErrors:
+                self.__discard_connection(connection)
+                if not reused:
+                    raise
+                # the server closed the idle keep-alive connection before reading the request, try another one
+                continue
+
+            except BaseException:
+                self.__discard_connection(connection)
+                raise
+
+            try:
+                response = self.__read_response(connection, written, event)
+            except BaseException:
+                self.__discard_connection(connection)
+                raise
+
+            self.__release_connection(connection)
+            return response
+
+    def __write_request(self, connection, body: RequestBody):
+        """
+        Write the request on the connection.
+        Large bodies are written segment by segment instead of being joined first.
+        :param connection: the connection to use
+        :type connection: HTTPConnection
+        :param body: the request body
+        :type body: RequestBody
+        """
+        headers = dict(self._headers)
+        headers["Content-Length"] = str(len(body))
+        if body.content_encoding is not None:
+            headers["Content-Encoding"] = body.content_encoding
+        payload = body.to_bytes() if len(body) <= self.BufferedBodySize else iter(body)
+        connection.request("POST", self._endpoint.url, payload, headers)
+
+    @staticmethod
+    def __read_response(connection, started: float, event: SendEvent = None):
+        """
+        Read the full response to the request written on the connection
+        :param connection: the connection the request was written on
+        :type connection: HTTPConnection
+        :param started: the time.perf_counter() value the write started at
+        :type started: float
+        :param event: the event the timings of the write, the wait and the read are added to, if any
+        :type event: SendEvent
+        :return the response
+        :rtype HttpResponse
+        """
+        if event is None:
             response = connection.getresponse()
+            return HttpResponse(response.status, response.reason, response.getheaders(), response.read())
 
-        except Exception as e:
-            raise e
+        written = time.perf_counter()
+        response = connection.getresponse()
+        received = time.perf_counter()
+        data = response.read()
+        event.add_timing(SendPhase.Write, written - started, written)
+        event.add_timing(SendPhase.Wait, received - written, received)
+        event.add_timing(SendPhase.Read, time.perf_counter() - received)
+        return HttpResponse(response.status, response.reason, response.getheaders(), data)
 
-        return response
+    @property
+    def __pool_key(self):
+        """
+        The key identifying connections that can be shared with this request
+        :return the pool key
+        :rtype tuple
+        """
+        proxy = self._http_proxy
+        return (self._endpoint.scheme, self._endpoint.host, self._endpoint.port,
+                proxy.host if proxy is not None else None,
+                proxy.port if proxy is not None else None)
+
+    @staticmethod
+    def __bounded_timeout(timeout: float, deadline: float):
+        """
+        Shorten a timeout to the time remaining before the deadline
+        :param timeout: the timeout in seconds
+        :type timeout: float
+        :param deadline: the time.monotonic() value by which the request must complete, if any
+        :type deadline: float
+        :return the timeout to use
+        :rtype float
+        """
+        if deadline is None:
+            return timeout
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise ClientTimeoutException("The send deadline passed before the request completed")
+        return remaining if timeout is None else min(timeout, remaining)
 
-    def __get_connection(self):
+    def __get_connection(self, deadline: float):
         """
-        Opens a socket connection to the server to set up an HTTP request.
-        :return the HTTPS connection to use in the request
-        :rtype HTTPSConnection
+        Get a connected connection for the request, from the pool when one is configured.
+        The socket is set to the read timeout, bounded by the deadline.
+        :param deadline: the time.monotonic() value by which the request must complete, if any
+        :type deadline: float
+        :return the connection and whether it was reused from the pool
+        :rtype tuple
         """
+        if self._connection_pool is None:
+            connection, reused = self.__new_connection(deadline), False
+        else:
+            connection, reused = self._connection_pool.acquire(
+                self.__pool_key, lambda: self.__new_connection(deadline),
+                self.__bounded_timeout(self.connect_timeout, deadline))
+
+        try:
+            read_timeout = self.__bounded_timeout(self.read_timeout, deadline)
+        except socket.timeout:
+            self.__discard_connection(connection)
+            raise
+        connection.timeout = read_timeout
+        connection.sock.settimeout(read_timeout)
+        return connection, reused
+
+    def __release_connection(self, connection):
+        """
+        Return the connection to the pool, or close it when no pool is configured.
+        :param connection: the connection to release
+        :type connection: HTTPConnection
+        """
+        if self._connection_pool is None:
+            connection.close()
+        else:
+            self._connection_pool.release(self.__pool_key, connection)
+
+    def __discard_connection(self, connection):
+        """
+        Close a connection that failed and must not be reused.
+        :param connection: the connection to discard
+        :type connection: HTTPConnection
+        """
+        if self._connection_pool is None:
+            connection.close()
+        else:
+            self._connection_pool.discard(connection)
+
+    def __new_connection(self, deadline: float = None):
+        """
+        Opens a socket connection to the server to set up an HTTP request. Connecting,
+        the proxy tunnel and the TLS handshake are bounded by the connect timeout.
+        :param deadline: the time.monotonic() value by which the request must complete, if any
+        :type deadline: float
+        :return the HTTP(S) connection to use in the request
+        :rtype HTTPConnection
+        """
+        connect_timeout = self.__bounded_timeout(self.connect_timeout, deadline)
+        if self._endpoint.scheme == "http":
+            connection_class = http.client.HTTPConnection
+        else:
+            connection_class = http.client.HTTPSConnection
+
         if self._http_proxy is not None:
-            connection = http.client.HTTPSConnection(self._http_proxy.host, self._http_proxy.port, timeout=self.__timeout)
-            connection.set_tunnel(self._endpoint.host, 443)
+            connection = connection_class(self._http_proxy.host, self._http_proxy.port, timeout=connect_timeout)
+            connection.set_tunnel(self._endpoint.host, self._endpoint.port)
         else:
-            connection = http.client.HTTPSConnection(self._endpoint.host, timeout=self.__timeout)
+            connection = connection_class(self._endpoint.host, self._endpoint.port, timeout=connect_timeout)
 
+        try:
+            connection.connect()
+        except Exception:
+            connection.close()
+            raise
         return connection
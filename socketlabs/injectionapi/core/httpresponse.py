@@ -0,0 +1,74 @@
+class HttpResponse(object):
+    """
+    A fully read HTTP response from the Injection API.
+    The body is read before the connection is returned to the pool,
+    so the response stays usable after the connection is reused.
+    """
+
+    def __init__(self, status: int, reason: str = None, headers: list = None, body: bytes = None):
+        """
+        Initializes a new instance of the HttpResponse class
+        :param status: the HTTP status code
+        :type status: int
+        :param reason: the HTTP reason phrase
+        :type reason: str
+        :param headers: the response headers as a list of (name, value) tuples
+        :type headers: list
+        :param body: the response body
+        :type body: bytes
+        """
+        self._status = status
+        self._reason = reason
+        self._headers = headers if headers is not None else []
+        self._body = body if body is not None else b""
+
+    @property
+    def status(self):
+        """
+        Get the HTTP status code
+        :return the status code
+        :rtype int
+        """
+        return self._status
+
+    @property
+    def reason(self):
+        """
+        Get the HTTP reason phrase
+        :return the reason phrase
+        :rtype str
+        """
+        return self._reason
+
+    @property
+    def headers(self):
+        """
+        Get the response headers
+        :return the list of (name, value) tuples
+        :rtype list
+        """
+        return self._headers
+
+    def getheader(self, name: str, default: str = None):
+        """
+        Get the value of a response header. Header names are case-insensitive.
+        :param name: the header name
+        :type name: str
+        :param default: the value returned when the header is not present
+        :type default: str
+        :return the header value
+        :rtype str
+        """
+        name = name.lower()
+        for key, value in self._headers:
+            if key.lower() == name:
+                return value
+        return default
+
+    def read(self):
+        """
+        Get the response body
+        :return the body
+        :rtype bytes
+        """
+        return self._body
@@ -69,7 +69,7 @@ def populate_metadata(metadata: list):
         return None
     metadata_json = []
     for item in metadata:
-        metadata_json.append(MetadataJson(item.name, item.value))
+        metadata_json.append(MetadataJson(item.key, item.value))
     return metadata_json
 
 
@@ -166,7 +166,7 @@ def generate_base_message(message: MessageBase):
     message_json.from_email_address = email_address_to_address_json(message.from_email_address)
     message_json.custom_headers = populate_custom_headers(message.custom_headers)
     message_json.attachments = populate_attachments(message.attachments)
-    message_json.metadata = populate_metadata(message.custom_headers)
+    message_json.metadata = populate_metadata(message.metadata)
     message_json.tags = message.tags
 
     if message.api_template is not None:
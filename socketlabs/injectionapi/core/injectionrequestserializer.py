@@ -0,0 +1,569 @@
+import json
+from itertools import islice
+from json.encoder import encode_basestring_ascii
+
+from .requestbody import RequestBody
+from ..message.basicmessage import BasicMessage
+from ..message.bulkmessage import BulkMessage
+from ..message.bulkrecipient import BulkRecipient
+from ..message.messagebase import MessageBase
+from ..message.recipienttable import RecipientTable
+
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def encode_value(val):
+    """
+    Encode a value as an ASCII JSON string. Strings take the fast path.
+    :param val: the value to encode
+    :type val: object
+    :return the JSON text
+    :rtype str
+    """
+    if val.__class__ is str:
+        return encode_basestring_ascii(val)
+    if val is None:
+        return "null"
+    return _encode_json(val)
+
+
+def is_none_or_blank(val: str):
+    """
+    Check if the string is None or Whitespace
+    :param val: string to check
+    :type val: str
+    :return the result
+    :rtype bool
+    """
+    return val is None or val.strip() == ''
+
+
+class JsonSegmentWriter(object):
+    """
+    Collects JSON text and raw byte segments into the segment list of a RequestBody.
+    Text is buffered and encoded once per segment; byte segments are kept as they are.
+    """
+
+    def __init__(self):
+        self._pieces = []
+        self._segments = []
+
+    def write(self, text: str):
+        """
+        Write JSON text
+        :param text: the ASCII JSON text
+        :type text: str
+        """
+        self._pieces.append(text)
+
+    def write_segment(self, segment):
+        """
+        Write a segment of bytes without copying it. A segment may also be a sized,
+        re-iterable stream of bytes chunks, such as an AttachmentStream.
+        :param segment: the bytes segment
+        :type segment: bytes, AttachmentStream
+        """
+        self.flush()
+        self._segments.append(segment)
+
+    def flush(self):
+        """
+        Encode the buffered text into a segment
+        """
+        if self._pieces:
+            self._segments.append("".join(self._pieces).encode("ascii"))
+            self._pieces = []
+
+    def segments(self):
+        """
+        Get the written segments
+        :return the list of segments
+        :rtype list
+        """
+        self.flush()
+        return self._segments
+
+
+def write_address(writer: JsonSegmentWriter, email_address: str, friendly_name: str = None):
+    """
+    Write an address object; the friendly name is only written when it is not blank.
+    """
+    writer.write('{"emailAddress":')
+    writer.write(encode_value(email_address))
+    if not is_none_or_blank(friendly_name):
+        writer.write(',"friendlyName":')
+        writer.write(encode_value(friendly_name))
+    writer.write('}')
+
+
+def write_address_list(writer: JsonSegmentWriter, key: str, addresses: list):
+    """
+    Write a list of EmailAddress objects, when the list is not empty.
+    """
+    if addresses is None or len(addresses) == 0:
+        return
+    writer.write(',"{0}":['.format(key))
+    separator = ''
+    for item in addresses:
+        writer.write(separator)
+        write_address(writer, item.email_address, item.friendly_name)
+        separator = ','
+    writer.write(']')
+
+
+def write_custom_headers(writer: JsonSegmentWriter, custom_headers: list):
+    """
+    Write a list of CustomHeader objects as name and value pairs, when the list is not empty.
+    """
+    if custom_headers is None or len(custom_headers) == 0:
+        return
+    writer.write(',"customHeaders":[')
+    separator = ''
+    for item in custom_headers:
+        writer.write(separator)
+        writer.write('{"name":')
+        writer.write(encode_value(item.name))
+        writer.write(',"value":')
+        writer.write(encode_value(item.value))
+        writer.write('}')
+        separator = ','
+    writer.write(']')
+
+
+def write_metadata(writer: JsonSegmentWriter, metadata: list):
+    """
+    Write a list of Metadata objects as key and value pairs, when the list is not empty.
+    """
+    if metadata is None or len(metadata) == 0:
+        return
+    writer.write(',"metadata":[')
+    separator = ''
+    for item in metadata:
+        writer.write(separator)
+        writer.write('{"key":')
+        writer.write(encode_value(item.key))
+        writer.write(',"value":')
+        writer.write(encode_value(item.value))
+        writer.write('}')
+        separator = ','
+    writer.write(']')
+
+
+def write_merge_field_list(writer: JsonSegmentWriter, merge_data: dict, delivery_address: str = None,
+                           recipient_name: str = None):
+    """
+    Write a merge data dictionary as a list of field and value pairs, followed by the
+    DeliveryAddress and RecipientName of the recipient when given.
+    """
+    writer.write('[')
+    separator = ''
+    for field, value in merge_data.items():
+        writer.write(separator)
+        writer.write('{"field":')
+        writer.write(encode_value(field))
+        writer.write(',"value":')
+        writer.write(encode_value(value))
+        writer.write('}')
+        separator = ','
+    if delivery_address is not None:
+        writer.write(separator)
+        writer.write('{"field":"DeliveryAddress","value":')
+        writer.write(encode_value(delivery_address))
+        writer.write('}')
+        if recipient_name:
+            writer.write(',{"field":"RecipientName","value":')
+            writer.write(encode_value(recipient_name))
+            writer.write('}')
+    writer.write(']')
+
+
+def write_per_message_merge_data(writer: JsonSegmentWriter, recipients: list):
+    """
+    Write the per message merge data of a list of BulkRecipients, or of a RecipientTable.
+    """
+    if isinstance(recipients, RecipientTable):
+        write_recipient_table(writer, recipients)
+        return
+    writer.write('[')
+    separator = ''
+    for item in recipients:
+        writer.write(separator)
+        write_merge_field_list(writer, item.merge_data, item.email_address, item.friendly_name)
+        separator = ','
+    writer.write(']')
+
+
+def write_recipient_table(writer: JsonSegmentWriter, table: RecipientTable):
+    """
+    Write the per message merge data of a RecipientTable from its columns. Each field name is
+    encoded once for the table; a value of None is left out of the recipient's list.
+    """
+    prefixes = ['{"field":' + encode_value(field) + ',"value":' for field in table.fields]
+    cells = list(zip(prefixes, table.columns))
+    writer.write('[')
+    for row, email_address in enumerate(table.email_addresses):
+        if row > 0:
+            writer.write(',')
+        writer.write('[')
+        for prefix, column in cells:
+            value = column[row]
+            if value is not None:
+                writer.write(prefix)
+                writer.write(encode_value(value))
+                writer.write('},')
+        writer.write('{"field":"DeliveryAddress","value":')
+        writer.write(encode_value(email_address))
+        writer.write('}')
+        recipient_name = table.friendly_names[row]
+        if recipient_name:
+            writer.write(',{"field":"RecipientName","value":')
+            writer.write(encode_value(recipient_name))
+            writer.write('}')
+        writer.write(']')
+    writer.write(']')
+
+
+def write_attachment_content(writer: JsonSegmentWriter, attachment):
+    """
+    Write the BASE64 content of an Attachment as a JSON string. Content taken from an
+    AttachmentCache is written as the cached bytes, and a streamed attachment as its
+    content stream, which is read from the file as the body is sent.
+    """
+    if attachment.content_json is not None:
+        writer.write_segment(attachment.content_json)
+        return
+    if attachment.content_stream is not None:
+        writer.write('"')
+        writer.write_segment(attachment.content_stream)
+        writer.write('"')
+        return
+    content = attachment.content
+    if content is None:
+        writer.write('null')
+        return
+    writer.write('"')
+    writer.write_segment(content.encode("ascii"))
+    writer.write('"')
+
+
+def write_attachments(writer: JsonSegmentWriter, attachments: list):
+    """
+    Write a list of Attachment objects, when the list is not empty.
+    """
+    if attachments is None or len(attachments) == 0:
+        return
+    writer.write(',"attachments":[')
+    separator = ''
+    for item in attachments:
+        writer.write(separator)
+        writer.write('{"name":')
+        writer.write(encode_value(item.name))
+        writer.write(',"content":')
+        write_attachment_content(writer, item)
+        writer.write(',"contentType":')
+        writer.write(encode_value(item.mime_type))
+        if not is_none_or_blank(item.content_id):
+            writer.write(',"contentId":')
+            writer.write(encode_value(item.content_id))
+        write_custom_headers(writer, item.custom_headers)
+        writer.write('}')
+        separator = ','
+    writer.write(']')
+
+
+def write_message_head(writer: JsonSegmentWriter, message: MessageBase):
+    """
+    Write the opening of a message object and the fields common to BasicMessage and
+    BulkMessage that precede the recipients: from, subject, bodies, template, ids,
+    reply to and character set.
+    """
+    writer.write('{"from":')
+    write_address(writer, message.from_email_address.email_address, message.from_email_address.friendly_name)
+
+    for key, value in (("subject", message.subject),
+                       ("htmlBody", message.html_body),
+                       ("ampBody", message.amp_body),
+                       ("textBody", message.plain_text_body),
+                       ("apiTemplate", str(message.api_template) if message.api_template is not None else None),
+                       ("mailingId", message.mailing_id),
+                       ("messageId", message.message_id)):
+        if not is_none_or_blank(value):
+            writer.write(',"{0}":'.format(key))
+            writer.write(encode_value(value))
+
+    if message.reply_to_email_address:
+        writer.write(',"replyTo":')
+        write_address(writer, message.reply_to_email_address.email_address,
+                      message.reply_to_email_address.friendly_name)
+
+    if not is_none_or_blank(message.charset):
+        writer.write(',"charSet":')
+        writer.write(encode_value(message.charset))
+
+
+def write_message_content(writer: JsonSegmentWriter, message: MessageBase):
+    """
+    Write the custom headers and attachments of a message.
+    """
+    write_custom_headers(writer, message.custom_headers)
+    write_attachments(writer, message.attachments)
+
+
+def write_message_tail(writer: JsonSegmentWriter, message: MessageBase):
+    """
+    Write the metadata and tags of a message and close the message object.
+    """
+    write_metadata(writer, message.metadata)
+    if message.tags is not None and len(message.tags) > 0:
+        writer.write(',"tags":')
+        writer.write(_encode_json(message.tags))
+    writer.write('}')
+
+
+def write_basic_message(writer: JsonSegmentWriter, message: BasicMessage):
+    """
+    Write a BasicMessage as a message object.
+    """
+    write_message_head(writer, message)
+    write_address_list(writer, "to", message.to_email_address)
+    write_address_list(writer, "cc", message.cc_email_address)
+    write_address_list(writer, "bcc", message.bcc_email_address)
+    write_message_content(writer, message)
+    write_message_tail(writer, message)
+
+
+def write_bulk_message_head(writer: JsonSegmentWriter, message: BulkMessage):
+    """
+    Write the part of a BulkMessage message object that precedes the per message merge data.
+    """
+    write_message_head(writer, message)
+    writer.write(',"to":[{"emailAddress":"%%DeliveryAddress%%","friendlyName":"%%RecipientName%%"}]')
+    write_message_content(writer, message)
+    writer.write(',"mergeData":{')
+    global_merge_data = message.global_merge_data
+    if global_merge_data is not None and len(global_merge_data) > 0:
+        writer.write('"global":')
+        write_merge_field_list(writer, global_merge_data)
+        writer.write(',')
+    writer.write('"perMessage":')
+
+
+def write_bulk_message_tail(writer: JsonSegmentWriter, message: BulkMessage):
+    """
+    Write the part of a BulkMessage message object that follows the per message merge data.
+    """
+    writer.write('}')
+    write_message_tail(writer, message)
+
+
+class InjectionRequestSerializer(object):
+    """
+    Used by the SocketLabsClient to serialize messages straight into the UTF-8 JSON body
+    of an injection request, in a single pass over the message and without building the
+    intermediate serialization objects.
+    """
+
+    def __init__(self, server_id: int, api_key: str):
+        """
+        Creates a new instance of the InjectionRequestSerializer.
+        :param server_id: Your SocketLabs ServerId number.
+        :type server_id: int
+        :param api_key: Your SocketLabs Injection API key.
+        :type api_key: str
+        """
+        self._server_id = server_id
+        self._api_key = api_key
+
+    def serialize(self, message):
+        """
+        Serialize the injection request for a message.
+        :param message: the message object to serialize. BasicMessage and BulkMessage allowed
+        :type message: BasicMessage, BulkMessage
+        :return the request body
+        :rtype RequestBody
+        """
+        if isinstance(message, BasicMessage):
+            writer = JsonSegmentWriter()
+            self.__write_request_head(writer)
+            write_basic_message(writer, message)
+            writer.write(']}')
+            return RequestBody(writer.segments())
+        elif isinstance(message, BulkMessage):
+            head, tail = self.__serialize_bulk_message_parts(message)
+            return self.__bulk_request_body(head, tail, message.to_recipient)
+        else:
+            raise Exception('Message type was not BasicMessage, BulkMessage. No request can be generated')
+
+    def serialize_message(self, message):
+        """
+        Serialize a single message object, without the serverId and apiKey of the request
+        around it, e.g. to store the message and send it later with build_request.
+        :param message: the message object to serialize. BasicMessage and BulkMessage allowed
+        :type message: BasicMessage, BulkMessage
+        :return the message object
+        :rtype bytes
+        """
+        writer = JsonSegmentWriter()
+        if isinstance(message, BasicMessage):
+            write_basic_message(writer, message)
+        elif isinstance(message, BulkMessage):
+            write_bulk_message_head(writer, message)
+            write_per_message_merge_data(writer, message.to_recipient)
+            write_bulk_message_tail(writer, message)
+        else:
+            raise Exception('Message type was not BasicMessage, BulkMessage. No request can be generated')
+        return RequestBody(writer.segments()).to_bytes()
+
+    def build_request(self, message: bytes):
+        """
+        Assemble the request body around a message object serialized by serialize_message
+        :param message: the serialized message object
+        :type message: bytes
+        :return the request body
+        :rtype RequestBody
+        """
+        writer = JsonSegmentWriter()
+        self.__write_request_head(writer)
+        writer.write_segment(message)
+        writer.write(']}')
+        return RequestBody(writer.segments())
+
+    def serialize_prepared(self, prepared):
+        """
+        Serialize the injection request for a PreparedBulkMessage. Only the per message
+        merge data of its recipients is serialized; the rest of the message is reused.
+        :param prepared: the prepared bulk message
+        :type prepared: PreparedBulkMessage
+        :return the request body
+        :rtype RequestBody
+        """
+        head, tail = self.__prepared_message_parts(prepared)
+        return self.__bulk_request_body(head, tail, prepared.to_recipient)
+
+    def serialize_bulk_chunks(self, message, recipients_per_request: int, recipients=None):
+        """
+        Serialize one request body per chunk of the message's To recipients. The shared parts
+        of the message are serialized once, and every chunk's body references the same bytes.
+        The recipients are read lazily, one chunk at a time.
+        :param message: the bulk message object to serialize
+        :type message: BulkMessage, PreparedBulkMessage
+        :param recipients_per_request: the maximum number of recipients in each request
+        :type recipients_per_request: int
+        :param recipients: the BulkRecipients or email addresses to use instead of the message's To recipients
+        :type recipients: iterable
+        :return generator of tuples of the recipient chunk and its RequestBody
+        :rtype generator
+        """
+        if isinstance(message, BulkMessage):
+            head, tail = self.__serialize_bulk_message_parts(message)
+        else:
+            head, tail = self.__prepared_message_parts(message)
+        source = message.to_recipient if recipients is None else recipients
+        if isinstance(source, RecipientTable):
+            for start in range(0, len(source), recipients_per_request):
+                chunk = source[start:start + recipients_per_request]
+                yield chunk, self.__bulk_request_body(head, tail, chunk)
+            return
+        source = iter(source)
+        while True:
+            chunk = [r if isinstance(r, BulkRecipient) else BulkRecipient(r)
+                     for r in islice(source, recipients_per_request)]
+            if len(chunk) == 0:
+                return
+            yield chunk, self.__bulk_request_body(head, tail, chunk)
+
+    def serialize_batches(self, messages: list, max_messages_per_request: int, max_bytes_per_request: int):
+        """
+        Pack several BasicMessages into as few request bodies as the budgets allow.
+        A message larger than the byte budget on its own is sent in a request by itself.
+        :param messages: the basic message objects to serialize
+        :type messages: list
+        :param max_messages_per_request: the maximum number of messages in a request
+        :type max_messages_per_request: int
+        :param max_bytes_per_request: the maximum size of a request body in bytes
+        :type max_bytes_per_request: int
+        :return generator of tuples of the message positions and their RequestBody
+        :rtype generator
+        """
+        writer = JsonSegmentWriter()
+        self.__write_request_head(writer)
+        head = writer.segments()
+        overhead = sum(len(segment) for segment in head) + 2
+
+        positions = []
+        segments = list(head)
+        batch_bytes = overhead
+        for position, message in enumerate(messages):
+            writer = JsonSegmentWriter()
+            write_basic_message(writer, message)
+            message_segments = writer.segments()
+            message_bytes = sum(len(segment) for segment in message_segments) + 1
+
+            if len(positions) > 0 and (len(positions) >= max_messages_per_request
+                                       or batch_bytes + message_bytes > max_bytes_per_request):
+                segments.append(b']}')
+                yield positions, RequestBody(segments)
+                positions = []
+                segments = list(head)
+                batch_bytes = overhead
+
+            if len(positions) > 0:
+                segments.append(b',')
+            positions.append(position)
+            segments.extend(message_segments)
+            batch_bytes += message_bytes
+
+        if len(positions) > 0:
+            segments.append(b']}')
+            yield positions, RequestBody(segments)
+
+    def __write_request_head(self, writer: JsonSegmentWriter):
+        """
+        Write the opening of the request object up to the start of the messages list
+        """
+        writer.write('{"serverId":')
+        writer.write(encode_value(str(self._server_id)))
+        writer.write(',"apiKey":')
+        writer.write(encode_value(self._api_key))
+        writer.write(',"messages":[')
+
+    def __serialize_bulk_message_parts(self, message: BulkMessage):
+        """
+        Serialize the parts of a bulk message request that do not depend on the recipients:
+        everything before the per message merge data, and everything after it.
+        :return the head and tail segment lists
+        :rtype tuple
+        """
+        writer = JsonSegmentWriter()
+        self.__write_request_head(writer)
+        write_bulk_message_head(writer, message)
+        head = writer.segments()
+
+        writer = JsonSegmentWriter()
+        write_bulk_message_tail(writer, message)
+        writer.write(']}')
+        return head, writer.segments()
+
+    def __prepared_message_parts(self, prepared):
+        """
+        Wrap the serialized parts of a PreparedBulkMessage in the request object
+        :return the head and tail segment lists
+        :rtype tuple
+        """
+        writer = JsonSegmentWriter()
+        self.__write_request_head(writer)
+        for segment in prepared.head:
+            writer.write_segment(segment)
+        head = writer.segments()
+        return head, prepared.tail + [b']}']
+
+    @staticmethod
+    def __bulk_request_body(head: list, tail: list, recipients: list):
+        """
+        Assemble a bulk request body from the shared head and tail and the recipients' merge data
+        :return the request body
+        :rtype RequestBody
+        """
+        writer = JsonSegmentWriter()
+        write_per_message_merge_data(writer, recipients)
+        return RequestBody(head + writer.segments() + tail)
@@ -1,6 +1,7 @@
 import json
 from collections import OrderedDict
 
+from ..addressresult import AddressResult
 from ..sendresponse import SendResponse
 from ..sendresult import SendResult
 from .serialization.messageresultdto import MessageResultDto
@@ -25,8 +26,8 @@ def determine_send_result(response_dto: InjectionResponseDto, response_code: int
         else:
             return result_enum
 
-    # HttpStatusCode.InternalServerError
-    elif response_code == 500:
+    # HttpStatusCode.InternalServerError, BadGateway, ServiceUnavailable, GatewayTimeout
+    elif 500 <= response_code < 600:
         return SendResult.InternalError
 
     # HttpStatusCode.RequestTimeout
@@ -37,19 +38,43 @@ def determine_send_result(response_dto: InjectionResponseDto, response_code: int
     elif response_code == 401:
         return SendResult.InvalidAuthentication
 
+    # HttpStatusCode.TooManyRequests
+    elif response_code == 429:
+        return SendResult.OverQuota
+
     else:
         return SendResult.InvalidAuthentication
 
 
+def get_address_results(address_results: list):
+    """
+    Get the list of AddressResult from the AddressResults of a message result
+    :param address_results: the list of address result dictionaries
+    :type address_results: list
+    :return the converted list of AddressResult
+    :rtype list
+    """
+    results = []
+    for item in address_results or []:
+        results.append(AddressResult(item.get('EmailAddress'), item.get('Accepted'), item.get('ErrorCode')))
+    return results
+
+
 def get_injection_response_dto(response: str):
     """
-    Get the InjectionResponseDto from the response str
+    Get the InjectionResponseDto from the response str. A body that is not JSON, such as
+    the plain text or empty body of a throttling or gateway error, gives an empty dto.
     :param response: the Http response in string format
     :type response: str
     :return the converted injection response dto
     :rtype InjectionResponseDto
     """
-    dct = json.loads(response, object_pairs_hook=OrderedDict)
+    try:
+        dct = json.loads(response, object_pairs_hook=OrderedDict)
+    except ValueError:
+        dct = {}
+    if not isinstance(dct, dict):
+        dct = {}
 
     resp_dto = InjectionResponseDto()
     if 'ErrorCode' in dct:
@@ -65,7 +90,7 @@ def get_injection_response_dto(response: str):
             if 'Index' in item:
                 message_dto.index = item['Index']
             if 'AddressResults' in item:
-                message_dto.address_results = str(item['AddressResults'])
+                message_dto.address_results = get_address_results(item['AddressResults'])
             if 'ErrorCode' in item:
                 message_dto.error_code = item['ErrorCode']
             resp_dto.message_results.append(message_dto)
@@ -102,3 +127,44 @@ class InjectionResponseParser(object):
             new_response.address_results = injection_response.message_results[0].address_results
 
         return new_response
+
+    @staticmethod
+    def parse_many(response: str, response_code: int, message_count: int):
+        """
+        Parse the response from the Injection Api for a request holding several messages
+        into one SendResponse per message. Message results are matched to messages by Index;
+        when the request has warnings, messages without a result of their own were accepted.
+        :param response: the Http response in string format
+        :type response: str
+        :param response_code: the Http Response code
+        :type response_code: int
+        :param message_count: the number of messages in the request
+        :type message_count: int
+        :return the converted responses, in message order
+        :rtype list
+        """
+        injection_response = get_injection_response_dto(response)
+        result_enum = determine_send_result(injection_response, response_code)
+
+        responses = []
+        for _ in range(message_count):
+            new_response = SendResponse(result_enum)
+            new_response.transaction_receipt = injection_response.transaction_receipt
+            responses.append(new_response)
+
+        if not injection_response.message_results:
+            return responses
+
+        if result_enum == SendResult.Warning:
+            for new_response in responses:
+                new_response.result = SendResult.Success
+
+        for message_result in injection_response.message_results:
+            index = message_result.index
+            if index is None or index < 0 or index >= message_count:
+                continue
+            if result_enum == SendResult.Warning and message_result.error_code in SendResult.__members__:
+                responses[index].result = SendResult[message_result.error_code]
+            responses[index].address_results = message_result.address_results
+
+        return responses
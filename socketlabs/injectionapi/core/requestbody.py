@@ -0,0 +1,68 @@
+class RequestBody(object):
+    """
+    A serialized injection request body. The body is held as a list of byte segments,
+    so parts shared by several requests (e.g. the content of a bulk message sent in
+    chunks) are referenced rather than copied, and are written to the socket in turn.
+    """
+
+    def __init__(self, segments: list = None, content_encoding: str = None):
+        """
+        Initializes a new instance of the RequestBody class
+        :param segments: the list of byte segments making up the body
+        :type segments: list
+        :param content_encoding: the Content-Encoding of the body, when it is compressed
+        :type content_encoding: str
+        """
+        self._segments = segments if segments is not None else []
+        self._content_encoding = content_encoding
+        self._length = None
+
+    @property
+    def segments(self):
+        """
+        Get the list of byte segments making up the body
+        :return the list of segments
+        :rtype list
+        """
+        return self._segments
+
+    @property
+    def content_encoding(self):
+        """
+        Get the Content-Encoding of the body, when it is compressed
+        :return the content encoding, or None
+        :rtype str
+        """
+        return self._content_encoding
+
+    def __len__(self):
+        """
+        Get the size of the body in bytes
+        :return the size
+        :rtype int
+        """
+        if self._length is None:
+            self._length = sum(len(segment) for segment in self._segments)
+        return self._length
+
+    def __iter__(self):
+        """
+        Iterate over the chunks of the body, in order
+        :return iterator of bytes
+        :rtype iterator
+        """
+        for segment in self._segments:
+            if isinstance(segment, bytes):
+                yield segment
+            else:
+                yield from segment
+
+    def to_bytes(self):
+        """
+        Get the whole body as a single bytes object
+        :return the body
+        :rtype bytes
+        """
+        if len(self._segments) == 1 and isinstance(self._segments[0], bytes):
+            return self._segments[0]
+        return b"".join(self)
@@ -1,15 +1,46 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from http import HTTPStatus
 from http.client import HTTPException
 from ..retrysettings import RetrySettings
+from ..sendevent import SendEvent
+from ..sendphase import SendPhase
 from .httprequest import HttpRequest
-from .serialization.injectionrequest import InjectionRequest
+from .requestbody import RequestBody
 import socket
 import time
 
 
+def get_retry_after(response):
+    """
+    Get the delay the server asked for in the Retry-After header of a response
+    :param response: the response
+    :type response: HttpResponse
+    :return the delay in seconds, or None when the header is missing or invalid
+    :rtype float
+    """
+    value = response.getheader("Retry-After")
+    if value is None:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 class RetryHandler(object):
-    attempts = 0
     ErrorStatusCodes = [
+        HTTPStatus.TOO_MANY_REQUESTS,
         HTTPStatus.INTERNAL_SERVER_ERROR,
         HTTPStatus.BAD_GATEWAY,
         HTTPStatus.SERVICE_UNAVAILABLE,
@@ -20,70 +51,154 @@ class RetryHandler(object):
         HTTPException
     ]
 
-    def __init__(self, http_client: HttpRequest, settings: RetrySettings):
-
+    def __init__(self, http_client: HttpRequest, settings: RetrySettings, scheduler=None):
+        """
+        Creates a new instance of the RetryHandler. Each send uses its own RetryHandler,
+        which holds the attempt count of that send.
+        :param http_client: the HttpRequest to send with
+        :type http_client: HttpRequest
+        :param settings: the retry settings
+        :type settings: RetrySettings
+        :param scheduler: schedules the retries of send_async without holding a thread,
+                          e.g. the SendExecutor; when None the worker thread sleeps
+        :type scheduler: SendExecutor
+        """
         self.__http_client = http_client
         self.__retry_settings = settings
-
-    def send(self, body):
-
+        self.__scheduler = scheduler
+        self.__started = time.monotonic()
+        self.attempts = 0
+
+    def get_wait_seconds(self, response=None):
+        """
+        Get how long to wait before the next attempt: the delay the server asked for
+        in a Retry-After header, otherwise the next backoff interval.
+        :param response: the response of the failed attempt, if there is one
+        :type response: HttpResponse
+        :return the wait in seconds
+        :rtype float
+        """
+        if response is not None:
+            retry_after = get_retry_after(response)
+            if retry_after is not None:
+                return retry_after
+        return self.__retry_settings.get_next_wait_interval(self.attempts).total_seconds()
+
+    def can_retry(self, wait: float):
+        """
+        Check whether another attempt may be made after waiting
+        :param wait: the wait in seconds before the attempt
+        :type wait: float
+        :return the result
+        :rtype bool
+        """
+        return self.__retry_settings.can_retry(self.attempts, wait, time.monotonic() - self.__started)
+
+    @property
+    def deadline(self):
+        """
+        Get the time.monotonic() value by which the send must complete, from the
+        deadline of the retry settings. Each attempt is bounded by the time remaining.
+        :return the deadline, or None for no deadline
+        :rtype float
+        """
+        if self.__retry_settings.deadline is None:
+            return None
+        return self.__started + self.__retry_settings.deadline.total_seconds()
+
+    def send(self, body, event: SendEvent = None):
+
+        self.__started = time.monotonic()
         if self.__retry_settings.maximum_number_of_retries == 0:
-            return self.__http_client.send_request(body)
+            return self.__http_client.send_request(body, self.deadline, event)
 
         while True:
-            wait_interval = self.__retry_settings.get_next_wait_interval(self.attempts)
 
             try:
 
-                response = self.__http_client.send_request(body)
-
-                if response.status in self.ErrorStatusCodes:
-                    raise HTTPException("HttpStatusCode: {0}. Response contains server error.".format(response.status))
-
-                return response
-
-            except socket.timeout:
-
-                self.attempts += 1
-
-                if self.attempts > self.__retry_settings.maximum_number_of_retries:
-                    raise socket.timeout
-                time.sleep(wait_interval.seconds)
+                response = self.__http_client.send_request(body, self.deadline, event)
 
-            except HTTPException:
+            except tuple(self.Exceptions):
 
+                wait = self.get_wait_seconds()
+                if not self.can_retry(wait):
+                    raise
                 self.attempts += 1
+                self.__sleep(wait, event)
+                continue
 
-                if self.attempts > self.__retry_settings.maximum_number_of_retries:
-                    raise HTTPException
-                time.sleep(wait_interval.seconds)
-
-    def send_async(self, request: InjectionRequest, on_success_callback, on_error_callback):
+            if response.status not in self.ErrorStatusCodes:
+                return response
 
-        wait_interval = self.__retry_settings.get_next_wait_interval(self.attempts)
+            wait = self.get_wait_seconds(response)
+            if not self.can_retry(wait):
+                if response.status == HTTPStatus.TOO_MANY_REQUESTS:
+                    # parsed as OverQuota by the caller
+                    return response
+                raise HTTPException("HttpStatusCode: {0}. Response contains server error.".format(response.status))
+            self.attempts += 1
+            self.__sleep(wait, event)
+
+    @staticmethod
+    def __sleep(wait: float, event: SendEvent = None):
+        """
+        Wait before the next attempt, adding the wait to the Backoff timing of the event
+        """
+        time.sleep(wait)
+        if event is not None:
+            event.add_timing(SendPhase.Backoff, wait)
+
+    def send_async(self, request: RequestBody, on_success_callback, on_error_callback,
+                   event: SendEvent = None):
+
+        self.__started = time.monotonic()
+        self.__attempt_async(request, on_success_callback, on_error_callback, event)
+
+    def __attempt_async(self, request: RequestBody, on_success_callback, on_error_callback,
+                        event: SendEvent = None):
+        """
+        Make an attempt of send_async, scheduling the next one when it can be retried
+        """
 
         def on_success(response):
 
-            if response.status in self.ErrorStatusCodes and self.attempts < self.__retry_settings.maximum_number_of_retries:
+            if response.status in self.ErrorStatusCodes:
 
-                self.attempts += 1
-                time.sleep(wait_interval.seconds)
-                self.send_async(request, on_success_callback, on_error_callback)
+                wait = self.get_wait_seconds(response)
+                if self.can_retry(wait):
+                    self.attempts += 1
+                    self.__retry_later(wait, request, on_success_callback, on_error_callback, event)
+                    return
 
-            else:
-                on_success_callback(response)
+            on_success_callback(response)
 
         def on_error(exception):
 
-            if exception in self.Exceptions and self.attempts < self.__retry_settings.maximum_number_of_retries:
-
-                self.attempts += 1
-                time.sleep(wait_interval.seconds)
-                self.send_async(request, on_success_callback, on_error_callback)
-
-            else:
-
-                self.attempts = self.__retry_settings.maximum_number_of_retries + 1
-                on_error_callback(exception)
-
-        self.__http_client.send_async_request(request, on_success, on_error)
+            if isinstance(exception, tuple(self.Exceptions)):
+
+                wait = self.get_wait_seconds()
+                if self.can_retry(wait):
+                    self.attempts += 1
+                    self.__retry_later(wait, request, on_success_callback, on_error_callback, event)
+                    return
+
+            on_error_callback(exception)
+
+        self.__http_client.send_async_request(request, on_success, on_error, self.deadline, event)
+
+    def __retry_later(self, wait: float, request, on_success_callback, on_error_callback, event: SendEvent = None):
+        """
+        Send the request again after waiting. With a scheduler no thread is held while waiting.
+        """
+        if event is not None:
+            event.add_timing(SendPhase.Backoff, wait, time.perf_counter() + wait)
+        if self.__scheduler is None:
+            time.sleep(wait)
+            self.__attempt_async(request, on_success_callback, on_error_callback, event)
+            return
+
+        try:
+            self.__scheduler.schedule(wait, self.__attempt_async, request, on_success_callback, on_error_callback,
+                                      event)
+        except Exception as e:
+            on_error_callback(e)
@@ -0,0 +1,87 @@
+import heapq
+import itertools
+import threading
+import time
+
+
+class RetryScheduler(object):
+    """
+    Runs callables after a delay on a single timer thread. Waiting callables are held
+    in a heap ordered by due time, so any number of pending retries costs one thread.
+    Scheduled callables should only hand work on (e.g. submit a request to the
+    SendExecutor) and return quickly, as they run on the timer thread in turn.
+    """
+
+    def __init__(self):
+        """
+        Initializes a new instance of the RetryScheduler class
+        """
+        self._queue = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._shutdown = False
+
+    @property
+    def pending_count(self):
+        """
+        Get the number of callables waiting to run
+        :return the number of pending callables
+        :rtype int
+        """
+        with self._condition:
+            return len(self._queue)
+
+    def schedule(self, delay: float, fn, *args):
+        """
+        Run a callable on the timer thread after a delay
+        :param delay: the delay in seconds
+        :type delay: float
+        :param fn: the callable
+        :type fn: method
+        """
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new callables after shutdown")
+            due = time.monotonic() + max(0.0, delay)
+            heapq.heappush(self._queue, (due, next(self._sequence), fn, args))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self.__run, name="socketlabs-retry", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop accepting callables. Callables already scheduled still run when due.
+        :param wait: wait for the scheduled callables to run
+        :type wait: bool
+        """
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify()
+            thread = self._thread
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def __run(self):
+        """
+        The timer thread: wait for the earliest callable to be due, then run it
+        """
+        while True:
+            with self._condition:
+                while True:
+                    if not self._queue:
+                        if self._shutdown:
+                            return
+                        self._condition.wait()
+                        continue
+                    remaining = self._queue[0][0] - time.monotonic()
+                    if remaining <= 0:
+                        _, _, fn, args = heapq.heappop(self._queue)
+                        break
+                    self._condition.wait(remaining)
+            try:
+                fn(*args)
+            except Exception:
+                # a scheduled callable reports its own failures; keep the timer thread alive
+                pass
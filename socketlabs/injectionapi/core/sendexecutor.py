@@ -0,0 +1,180 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ..backpressurepolicy import BackpressurePolicy
+from .retryscheduler import RetryScheduler
+
+
+class SendQueueFullException(Exception):
+    """
+    Raised when an asynchronous send is rejected because the send queue is full.
+    """
+    pass
+
+
+class SendExecutor(object):
+    """
+    Bounded worker pool used by SocketLabsClient.send_async. A fixed number of worker
+    threads performs the HTTP requests, and the number of sends queued or in flight
+    is capped, so a burst of sends cannot create unbounded threads and sockets.
+
+    :Example:
+
+        client = SocketLabsClient(server_id, api_key)
+        client.send_executor = SendExecutor(max_workers=20, max_queue_size=5000,
+                                            backpressure_policy=BackpressurePolicy.Raise)
+
+    """
+
+    def __init__(self, max_workers: int = 10, max_queue_size: int = 1000,
+                 backpressure_policy: BackpressurePolicy = BackpressurePolicy.Block):
+        """
+        Initializes a new instance of the SendExecutor class
+        :param max_workers: the number of worker threads
+        :type max_workers: int
+        :param max_queue_size: the maximum number of sends queued or in flight
+        :type max_queue_size: int
+        :param backpressure_policy: what to do with a send when the queue is full
+        :type backpressure_policy: BackpressurePolicy
+        """
+        if max_workers is None or max_workers <= 0:
+            raise AttributeError("max_workers must be greater than 0")
+        if max_queue_size is None or max_queue_size <= 0:
+            raise AttributeError("max_queue_size must be greater than 0")
+
+        self._max_workers = max_workers
+        self._max_queue_size = max_queue_size
+        self._backpressure_policy = backpressure_policy
+        self._slots = threading.BoundedSemaphore(max_queue_size)
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._shutdown = False
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="socketlabs-send")
+        self._scheduler = RetryScheduler()
+
+    @property
+    def max_workers(self):
+        """
+        Get the number of worker threads
+        :return the number of worker threads
+        :rtype int
+        """
+        return self._max_workers
+
+    @property
+    def max_queue_size(self):
+        """
+        Get the maximum number of sends queued or in flight
+        :return the maximum queue size
+        :rtype int
+        """
+        return self._max_queue_size
+
+    @property
+    def backpressure_policy(self):
+        """
+        Get what happens to a send when the queue is full
+        :return the backpressure policy
+        :rtype BackpressurePolicy
+        """
+        return self._backpressure_policy
+
+    def reserve(self, block: bool = False):
+        """
+        Reserve a queue slot for a send, applying the backpressure policy when the queue is full.
+        Every successful reservation must be paired with a call to release.
+        :param block: wait for a slot whatever the backpressure policy, for sends the caller waits for anyway
+        :type block: bool
+        :return True if a slot was reserved, False if the send should be dropped
+        :rtype bool
+        """
+        if block or self._backpressure_policy == BackpressurePolicy.Block:
+            self._slots.acquire()
+            self.__add_pending(1)
+            return True
+
+        if self._slots.acquire(blocking=False):
+            self.__add_pending(1)
+            return True
+
+        if self._backpressure_policy == BackpressurePolicy.Raise:
+            raise SendQueueFullException(
+                "The send queue is full ({0} sends queued or in flight)".format(self._max_queue_size))
+        return False
+
+    def release(self):
+        """
+        Release a queue slot reserved for a send.
+        """
+        self.__add_pending(-1)
+        self._slots.release()
+
+    @property
+    def pending_count(self):
+        """
+        Get the number of sends queued, in flight or waiting to be retried
+        :return the number of pending sends
+        :rtype int
+        """
+        return self._pending
+
+    def __add_pending(self, count: int):
+        """
+        Adjust the number of pending sends, waking waiters when none remain
+        :param count: the change in the number of pending sends
+        :type count: int
+        """
+        with self._idle:
+            self._pending += count
+            if self._pending > 0:
+                return
+            self._idle.notify_all()
+            if not self._shutdown:
+                return
+        # shut down without waiting while sends were pending, the last one releases the workers
+        self.__release_workers()
+
+    def schedule(self, delay: float, fn, *args):
+        """
+        Run a callable after a delay, without holding a worker thread while waiting.
+        Used to schedule retries; the callable should submit its work and return.
+        :param delay: the delay in seconds
+        :type delay: float
+        :param fn: the callable
+        :type fn: method
+        """
+        self._scheduler.schedule(delay, fn, *args)
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Schedule a callable on the worker threads
+        :param fn: the callable
+        :type fn: method
+        :return the future of the callable
+        :rtype Future
+        """
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True):
+        """
+        Release the worker threads once the pending sends, including scheduled retries, have finished.
+        :param wait: wait for the pending sends to finish; when False the worker threads are released
+                     in the background, once the last pending send has finished
+        :type wait: bool
+        """
+        with self._idle:
+            self._shutdown = True
+            if wait:
+                while self._pending > 0:
+                    self._idle.wait()
+            elif self._pending > 0:
+                return
+        self._scheduler.shutdown(wait=wait)
+        self._executor.shutdown(wait=wait)
+
+    def __release_workers(self):
+        """
+        Stop accepting work and release the worker threads, without waiting for them
+        """
+        self._scheduler.shutdown(wait=False)
+        self._executor.shutdown(wait=False)
@@ -3,6 +3,7 @@ from ..addressresult import AddressResult
 from ..message.basicmessage import BasicMessage
 from ..message.bulkmessage import BulkMessage
 from ..message.messagebase import MessageBase
+from ..message.recipienttable import RecipientTable
 from ..sendresponse import SendResponse
 from ..sendresult import SendResult
 
@@ -160,11 +161,27 @@ def validate_recipients(message: BulkMessage):
     :return the result
     :rtype SendResponse
     """
-    if message.to_recipient is None or len(message.to_recipient) <= 0:
+    return validate_recipient_list(message.to_recipient)
+
+
+def validate_recipient_list(recipients: list):
+    """
+    Validate a list of BulkRecipients sent in a single request
+    Checks the list for the following:
+        > At least 1 recipient is in the list.
+        > Count of recipients does not exceed the MaximumRecipientsPerMessage
+        > Recipients in the list are valid.
+    If errors are found, the SendResponse will contain the invalid email addresses
+    :param recipients: list of BulkRecipient to validate
+    :type recipients: list
+    :return the result
+    :rtype SendResponse
+    """
+    if recipients is None or len(recipients) <= 0:
         return SendResponse(SendResult.RecipientValidationMissingTo)
-    if len(message.to_recipient) > maximumRecipientsPerMessage:
+    if len(recipients) > maximumRecipientsPerMessage:
         return SendResponse(SendResult.RecipientValidationMaxExceeded)
-    invalidRec = has_invalid_recipients(message)
+    invalidRec = find_invalid_recipients(recipients)
     if invalidRec is not None and len(invalidRec) > 0:
         return SendResponse(SendResult.RecipientValidationInvalidRecipients, invalidRec)
     return SendResponse(SendResult.Success)
@@ -229,9 +246,10 @@ def find_invalid_email_addresses(email_addresses: list):
     invalid = []
     if email_addresses is None:
         return None
-    for item in email_addresses:
-        if item.isvalid() is False:
-            invalid.append(AddressResult(item.email_address, False, "InvalidAddress"))
+    addresses = [item.email_address for item in email_addresses]
+    for email_address, valid in zip(addresses, StringExtension.validate_addresses(addresses)):
+        if not valid:
+            invalid.append(AddressResult(email_address, False, "InvalidAddress"))
     if len(invalid) > 0:
         return invalid
     else:
@@ -249,10 +267,13 @@ def find_invalid_recipients(recipients: list):
     invalid = []
     if recipients is None:
         return None
-    for item in recipients:
-        valid = item.isvalid()
-        if valid is False:
-            invalid.append(AddressResult(item.email_address, False, "InvalidAddress"))
+    if isinstance(recipients, RecipientTable):
+        addresses = recipients.email_addresses
+    else:
+        addresses = [item.email_address for item in recipients]
+    for email_address, valid in zip(addresses, StringExtension.validate_addresses(addresses)):
+        if not valid:
+            invalid.append(AddressResult(email_address, False, "InvalidAddress"))
     if len(invalid) > 0:
         return invalid
     else:
@@ -366,6 +387,75 @@ class SendValidator(object):
         if isinstance(message, BulkMessage):
             return validate_bulk_message(message)
 
+    @staticmethod
+    def validate_bulk_campaign(message: BulkMessage):
+        """
+        Validate a bulk email message that will be split into several requests
+        before sending to the Injection API. The recipient count is not limited;
+        each chunk of recipients is validated with validate_recipient_list.
+        :param message: message to validate
+        :type message: BulkMessage
+        :return the validation result
+        :rtype SendResponse
+        """
+        valid_base = validate_base_message(message)
+        if not valid_base == SendResult.Success:
+            return SendResponse(valid_base)
+
+        if message.to_recipient is None or len(message.to_recipient) <= 0:
+            return SendResponse(SendResult.RecipientValidationMissingTo)
+
+        return SendResponse(SendResult.Success)
+
+    @staticmethod
+    def validate_bulk_campaign_content(message):
+        """
+        Validate the content of a BulkMessage or PreparedBulkMessage whose recipients are read
+        from another source. Each chunk of recipients is validated with validate_recipient_list.
+        :param message: message to validate
+        :type message: BulkMessage, PreparedBulkMessage
+        :return the validation result
+        :rtype SendResponse
+        """
+        if isinstance(message, BulkMessage):
+            return SendResponse(validate_base_message(message))
+
+        return SendResponse(message.validation_result)
+
+    @staticmethod
+    def validate_prepared_message(message):
+        """
+        Validate a PreparedBulkMessage before sending to the Injection API. The content
+        is validated once when the message is prepared; only the recipients are validated here.
+        :param message: message to validate
+        :type message: PreparedBulkMessage
+        :return the validation result
+        :rtype SendResponse
+        """
+        if not message.validation_result == SendResult.Success:
+            return SendResponse(message.validation_result)
+
+        return validate_recipient_list(message.to_recipient)
+
+    @staticmethod
+    def validate_prepared_bulk_campaign(message):
+        """
+        Validate a PreparedBulkMessage that will be split into several requests before
+        sending to the Injection API. The recipient count is not limited; each chunk of
+        recipients is validated with validate_recipient_list.
+        :param message: message to validate
+        :type message: PreparedBulkMessage
+        :return the validation result
+        :rtype SendResponse
+        """
+        if not message.validation_result == SendResult.Success:
+            return SendResponse(message.validation_result)
+
+        if message.to_recipient is None or len(message.to_recipient) <= 0:
+            return SendResponse(SendResult.RecipientValidationMissingTo)
+
+        return SendResponse(SendResult.Success)
+
     @staticmethod
     def validate_credentials(server_id: int, api_key: str):
         """
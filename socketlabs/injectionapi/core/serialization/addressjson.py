@@ -4,6 +4,8 @@ class AddressJson(object):
     To be serialized into JSON string before sending to the Injection Api.
     """
 
+    __slots__ = ("_email_address", "_friendly_name")
+
     def __init__(self, email_address: str = None, friendly_name: str = None):
         """
         Initializes a new instance of the AddressJson class
@@ -7,6 +7,8 @@ class AttachmentJson(object):
     To be serialized into JSON string before sending to the Injection Api.
     """
 
+    __slots__ = ("_name", "_mime_type", "_content", "_content_id", "_custom_headers")
+
     def __init__(self):
         """
         Initializes a new instance of the AttachmentJson class
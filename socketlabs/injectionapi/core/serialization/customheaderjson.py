@@ -4,6 +4,8 @@ class CustomHeaderJson(object):
     To be serialized into JSON string before sending to the Injection Api.
     """
 
+    __slots__ = ("_name", "_value")
+
     def __init__(self, name: str = None, val: str = None):
         """
         Initializes a new instance of the CustomHeaderJson class
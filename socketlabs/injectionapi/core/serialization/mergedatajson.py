@@ -7,6 +7,8 @@ class MergeDataJson(object):
     To be serialized into JSON string before sending to the Injection Api.
     """
 
+    __slots__ = ("_per_message", "_global")
+
     def __init__(self, per_message: list = None, global_merge_data: list = None):
         """
         Creates a new instance of the MergeDataJson class.
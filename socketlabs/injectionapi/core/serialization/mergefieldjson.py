@@ -4,6 +4,8 @@ class MergeFieldJson(object):
     To be serialized into JSON string before sending to the Injection Api.
     """
 
+    __slots__ = ("_field", "_value")
+
     def __init__(self, field: str = None, val: str = None):
         """
         Initializes a new instance of the MergeFieldJson class
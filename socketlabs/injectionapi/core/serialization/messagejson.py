@@ -11,6 +11,11 @@ class MessageJson(object):
     To be serialized into JSON string before sending to the Injection Api.
     """
 
+    __slots__ = ("_subject", "_plain_text_body", "_html_body", "_amp_body", "_api_template", "_mailing_id",
+                 "_message_id", "_charset", "_from_email", "_reply_to", "_attachments", "_custom_headers",
+                 "_to_email_address", "_cc_email_address", "_bcc_email_address", "_merge_data", "_metadata",
+                 "_tags")
+
     def __init__(self):
         self._subject = None
         self._plain_text_body = None
@@ -4,6 +4,8 @@ class MetadataJson(object):
     To be serialized into JSON string before sending to the Injection Api.
     """
 
+    __slots__ = ("_key", "_value")
+
     def __init__(self, key: str = None, val: str = None):
         """
         Initializes a new instance of the MetadataJson class
@@ -1,3 +1,10 @@
+import re
+
+# One '@' between a local part and a domain which are not blank, and no ',', ' ' or ';' anywhere.
+# Either part may start with whitespace other than a space, as long as it is not all whitespace.
+_email_address_match = re.compile(r'[^\S ]*[^@,;\s][^@,; ]*@[^\S ]*[^@,;\s][^@,; ]*').fullmatch
+
+
 class StringExtension(object):
 
     @staticmethod
@@ -43,16 +50,17 @@ class StringExtension(object):
         if len(email_address) > 320:
             return False
 
-        parts = email_address.split('@')
-        if len(parts) != 2:
-            return False
-
-        if len(parts[0].strip()) < 1:
-            return False
-        if len(parts[1].strip()) < 1:
-            return False
+        return _email_address_match(email_address) is not None
 
-        badChars = list(StringExtension.find_character_in_string(email_address, ","))
-        badChars.extend(list(StringExtension.find_character_in_string(email_address, ' ')))
-        badChars.extend(list(StringExtension.find_character_in_string(email_address, ';')))
-        return len(badChars) == 0
\ No newline at end of file
+    @staticmethod
+    def validate_addresses(email_addresses):
+        """
+        Determines if each email address is valid, with the same checks as is_valid_email_address.
+        :param email_addresses: the email addresses to validate
+        :type email_addresses: iterable
+        :return the result for each email address, in order
+        :rtype list
+        """
+        match = _email_address_match
+        return [email_address is not None and len(email_address) <= 320 and match(email_address) is not None
+                for email_address in email_addresses]
@@ -0,0 +1,58 @@
+import time
+
+
+class TokenBucket(object):
+    """
+    A token bucket refilled at a steady rate up to its capacity. Tokens may be borrowed
+    ahead of the refill; the caller is told how long to wait before the debt is repaid,
+    so concurrent callers are spaced out in the order they reserved. Not thread-safe on
+    its own; the RateLimiter serializes access.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initializes a new instance of the TokenBucket class
+        :param rate: the number of tokens added per second
+        :type rate: float
+        :param capacity: the maximum number of tokens the bucket holds
+        :type capacity: float
+        """
+        self._rate = float(rate)
+        self._capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    @property
+    def rate(self):
+        """
+        Get the number of tokens added per second
+        :return the rate
+        :rtype float
+        """
+        return self._rate
+
+    @property
+    def capacity(self):
+        """
+        Get the maximum number of tokens the bucket holds
+        :return the capacity
+        :rtype float
+        """
+        return self._capacity
+
+    def reserve(self, tokens: float, now: float):
+        """
+        Take tokens from the bucket
+        :param tokens: the number of tokens to take
+        :type tokens: float
+        :param now: the current time.monotonic() value
+        :type now: float
+        :return the number of seconds until the tokens are available
+        :rtype float
+        """
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        self._tokens -= tokens
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self._rate
@@ -1,8 +1,14 @@
 from .attachment import Attachment
+from .attachmentcache import AttachmentCache
+from .attachmentstream import AttachmentStream
 from .basicmessage import BasicMessage
 from .bulkmessage import BulkMessage
 from .bulkrecipient import BulkRecipient
+from .csvrecipientsource import CsvRecipientSource
+from .cursorrecipientsource import CursorRecipientSource
 from .customheader import CustomHeader
 from .emailaddress import EmailAddress
 from .messagebase import MessageBase
-from .metadata import Metadata
\ No newline at end of file
+from .metadata import Metadata
+from .recipientsource import RecipientSource
+from .recipienttable import RecipientTable
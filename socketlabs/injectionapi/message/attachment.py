@@ -3,6 +3,8 @@ import os
 import mimetypes
 
 
+from .attachmentcache import AttachmentCache
+from .attachmentstream import AttachmentStream
 from .customheader import CustomHeader
 
 
@@ -20,9 +22,14 @@ class Attachment(object):
          attachment3.add_custom_header("name1", "value1")
          attachment3.add_custom_header("name2", "value2")
 
+         attachment4 = Attachment(file_path="./report.pdf", stream=True)
+
+         attachment5 = Attachment(file_path="./logo.png", cache=AttachmentCache())
+
     """
 
-    def __init__(self, name: str = None, mime_type: str = None, file_path: str = None, content: bytes = None):
+    def __init__(self, name: str = None, mime_type: str = None, file_path: str = None, content: bytes = None,
+                 stream: bool = False, cache: AttachmentCache = None):
         """
         Initializes a new instance of the Attachment class
         :param name: the name
@@ -31,15 +38,24 @@ class Attachment(object):
         :type mime_type: str
         :param file_path: the local file path
         :type file_path: str
+        :param content: the binary content
+        :type content: bytes
+        :param stream: when True the file is not read now, but BASE64 encoded in chunks
+                       straight into the request body when the message is sent
+        :type stream: bool
+        :param cache: the cache to take the encoded content of the file from
+        :type cache: AttachmentCache
         """
         self._name = None
         self._mime_type = None
         self._content = None
+        self._content_stream = None
+        self._content_json = None
         self._content_id = None
         self._custom_headers = []
 
         if file_path is not None:
-            self.readfile(file_path)
+            self.readfile(file_path, stream, cache)
 
         if name is not None:
             self._name = name
@@ -48,7 +64,7 @@ class Attachment(object):
             self._mime_type = mime_type
 
         if content is not None:
-            self._content = base64.b64encode(content).decode('UTF-8')
+            self.content = base64.b64encode(content).decode('UTF-8')
 
     @property
     def name(self):
@@ -108,9 +124,14 @@ class Attachment(object):
     def content(self):
         """
         Get Content of an Attachment. The BASE64 encoded str containing the contents of an attachment.
+        For a streamed attachment the file is read and encoded on each call.
         :return the BASE64 encoded string of content
         :rtype str
         """
+        if self._content_stream is not None:
+            return self._content_stream.read()
+        if self._content_json is not None:
+            return self._content_json[1:-1].decode('ascii')
         return self._content
 
     @content.setter
@@ -121,6 +142,27 @@ class Attachment(object):
         :type val: str
         """
         self._content = val
+        self._content_stream = None
+        self._content_json = None
+
+    @property
+    def content_stream(self):
+        """
+        Get the stream of the BASE64 encoded content, when the attachment streams its file
+        :return the content stream, or None
+        :rtype AttachmentStream
+        """
+        return self._content_stream
+
+    @property
+    def content_json(self):
+        """
+        Get the BASE64 encoded content as a JSON string, when the content was taken from an AttachmentCache.
+        The bytes are shared with every other attachment of the same file.
+        :return the encoded content, quotes included, or None
+        :rtype bytes
+        """
+        return self._content_json
 
     @property
     def custom_headers(self):
@@ -160,24 +202,40 @@ class Attachment(object):
             for name, value in header.items():
                 self._custom_headers.append(CustomHeader(name, value))
 
-    def readfile(self, file_path: str):
+    def readfile(self, file_path: str, stream: bool = False, cache: AttachmentCache = None):
         """
         Read the specified file and get a str containing the resulting binary data.
         :param file_path: the file path to read
         :type: str
+        :param stream: when True only the path and size of the file are recorded, and its
+                       content is streamed into the request body when the message is sent
+        :type stream: bool
+        :param cache: the cache to take the encoded content of the file from. Ignored when streaming
+        :type cache: AttachmentCache
         """
-        mimes = mimetypes.MimeTypes()
+        self._name = os.path.split(file_path)[1]
+        mime = mimetypes.guess_type(file_path)
+        if mime[0] is None:
+            ext = os.path.splitext(file_path)[1][1:].strip()
+            self._mime_type = self.__get_mime_type_from_ext(ext)
+        else:
+            self._mime_type = str(mime[0])
+
+        self._content = None
+        self._content_stream = None
+        self._content_json = None
+
+        if stream:
+            self._content_stream = AttachmentStream(file_path)
+            return
+
+        if cache is not None:
+            self._content_json = cache.get_content(file_path)
+            return
+
         with open(file_path, 'rb') as f:
-            self._name = os.path.split(f.name)[1]
-            mime = mimes.guess_type(f.name)
-            if mime[0] is None:
-                ext = os.path.splitext(f.name)[1][1:].strip()
-                self._mime_type = self.__get_mime_type_from_ext(ext)
-            else:
-                self._mime_type = str(mime[0])
             data = f.read()
-            self._content = base64.b64encode(data).decode('UTF-8')
-            f.close()
+        self._content = base64.b64encode(data).decode('UTF-8')
 
     @staticmethod
     def __get_mime_type_from_ext(extension: str):
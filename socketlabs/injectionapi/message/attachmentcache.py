@@ -0,0 +1,123 @@
+import binascii
+import os
+import threading
+from collections import OrderedDict
+
+
+class AttachmentCache(object):
+    """
+    Holds the encoded content of attachment files, so a file attached to many messages is
+    read and BASE64 encoded once. Entries are keyed by the file's path, modification time
+    and size, so a changed file is read again. The least recently used entries are evicted
+    once the cached content exceeds the byte budget. The cache is safe to share between threads.
+
+    :Example:
+
+         cache = AttachmentCache(max_bytes=32 * 1024 * 1024)
+         attachment = Attachment(file_path="./brochure.pdf", cache=cache)
+
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initializes a new instance of the AttachmentCache class
+        :param max_bytes: the maximum total size in bytes of the cached content
+        :type max_bytes: int
+        """
+        if max_bytes < 0:
+            raise AttributeError("max_bytes must not be negative")
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self):
+        """
+        Get the maximum total size in bytes of the cached content
+        :return the byte budget
+        :rtype int
+        """
+        return self._max_bytes
+
+    @property
+    def size(self):
+        """
+        Get the total size in bytes of the cached content
+        :return the size
+        :rtype int
+        """
+        return self._size
+
+    @property
+    def count(self):
+        """
+        Get the number of cached files
+        :return the count
+        :rtype int
+        """
+        return len(self._entries)
+
+    @property
+    def hits(self):
+        """
+        Get the number of lookups answered from the cache
+        :return the number of hits
+        :rtype int
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        Get the number of lookups that read the file
+        :return the number of misses
+        :rtype int
+        """
+        return self._misses
+
+    def get_content(self, file_path: str):
+        """
+        Get the BASE64 encoded content of a file as a JSON string, quotes included,
+        ready to be written into a request body.
+        :param file_path: the file path to read
+        :type file_path: str
+        :return the encoded content
+        :rtype bytes
+        """
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            content = self._entries.get(key)
+            if content is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return content
+            self._misses += 1
+
+        with open(path, 'rb') as f:
+            content = b'"' + binascii.b2a_base64(f.read(), newline=False) + b'"'
+
+        if len(content) > self._max_bytes:
+            return content
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = content
+                self._size += len(content)
+                while self._size > self._max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._size -= len(evicted)
+        return content
+
+    def clear(self):
+        """
+        Remove all entries from the cache
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
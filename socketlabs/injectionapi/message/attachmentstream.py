@@ -0,0 +1,72 @@
+import binascii
+import os
+
+
+class AttachmentStream(object):
+    """
+    The BASE64 encoded content of a file attachment, read from the file in fixed-size
+    chunks each time it is iterated. Only the path and size of the file are held in memory.
+    """
+
+    ChunkSize = 3 * 64 * 1024
+    """ The number of file bytes read per chunk. A multiple of 3, so chunks encode without padding """
+
+    def __init__(self, file_path: str):
+        """
+        Initializes a new instance of the AttachmentStream class
+        :param file_path: the local file path
+        :type file_path: str
+        """
+        self._file_path = os.path.abspath(file_path)
+        self._size = os.path.getsize(self._file_path)
+
+    @property
+    def file_path(self):
+        """
+        Get the absolute path of the file
+        :return the file path
+        :rtype str
+        """
+        return self._file_path
+
+    @property
+    def size(self):
+        """
+        Get the size of the file in bytes, as recorded when the stream was created
+        :return the size
+        :rtype int
+        """
+        return self._size
+
+    def __len__(self):
+        """
+        Get the length of the BASE64 encoded content
+        :return the length
+        :rtype int
+        """
+        return 4 * ((self._size + 2) // 3)
+
+    def __iter__(self):
+        """
+        Read the file and yield its BASE64 encoded content in chunks
+        :return iterator of bytes
+        :rtype iterator
+        """
+        with open(self._file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size != self._size:
+                raise Exception("The attachment file {0} changed size since it was attached".format(self._file_path))
+            remaining = self._size
+            while remaining > 0:
+                data = f.read(min(self.ChunkSize, remaining))
+                if not data:
+                    raise Exception("The attachment file {0} was truncated while reading".format(self._file_path))
+                remaining -= len(data)
+                yield binascii.b2a_base64(data, newline=False)
+
+    def read(self):
+        """
+        Read the whole BASE64 encoded content as a str
+        :return the BASE64 encoded string of content
+        :rtype str
+        """
+        return b"".join(self).decode('ascii')
@@ -4,6 +4,7 @@ from .customheader import CustomHeader
 from .emailaddress import EmailAddress
 from .messagebase import MessageBase
 from .metadata import Metadata
+from .recipienttable import RecipientTable
 
 
 class BulkMessage(MessageBase):
@@ -66,10 +67,13 @@ class BulkMessage(MessageBase):
     @to_recipient.setter
     def to_recipient(self, val: list):
         """
-        Get the To email address list
-        :param val: list of BulkRecipient
-        :rtype val: list
+        Get the To email address list. A RecipientTable is kept as it is.
+        :param val: list of BulkRecipient, or a RecipientTable
+        :rtype val: list, RecipientTable
         """
+        if isinstance(val, RecipientTable):
+            self._to_recipients = val
+            return
         self._to_recipients = []
         if val is not None:
             for item in val:
@@ -13,6 +13,8 @@ class BulkRecipient(object):
 
     """
 
+    __slots__ = ("_email_address", "_friendly_name", "_merge_data")
+
     def __init__(self, email_address: str = None, friendly_name: str = None, merge_data: dict = None):
         """
         Initializes a new instance of the BulkRecipient class
@@ -0,0 +1,58 @@
+import csv
+
+from .recipientsource import RecipientSource
+
+
+class CsvRecipientSource(RecipientSource):
+    """
+    Reads BulkRecipients from a CSV file with a header row, one row at a time.
+    The file is opened again each time the source is iterated.
+
+    :Example:
+
+         recipients = CsvRecipientSource("customers.csv", email_column="Email", name_column="Name",
+                                         merge_fields={"First": "FirstName", "Color": "FavoriteColor"})
+         response = client.send_bulk_campaign(message, recipients)
+
+    """
+
+    def __init__(self, file_path: str, email_column: str = "email", name_column: str = None, merge_fields=None,
+                 encoding: str = "utf-8", **fmtparams):
+        """
+        Initializes a new instance of the CsvRecipientSource class
+        :param file_path: the path of the CSV file
+        :type file_path: str
+        :param email_column: the column holding the email address
+        :type email_column: str
+        :param name_column: the column holding the friendly name, if any
+        :type name_column: str
+        :param merge_fields: the columns to add as merge data: a dict of column to merge field name,
+                             a list of columns used under their own names, or None for all other columns
+        :type merge_fields: dict, list
+        :param encoding: the encoding of the file
+        :type encoding: str
+        :param fmtparams: formatting parameters passed to csv.DictReader, e.g. delimiter
+        :type fmtparams: dict
+        """
+        super().__init__(email_column, name_column, merge_fields)
+        self._file_path = file_path
+        self._encoding = encoding
+        self._fmtparams = fmtparams
+
+    @property
+    def file_path(self):
+        """
+        Get the path of the CSV file
+        :return the file path
+        :rtype str
+        """
+        return self._file_path
+
+    def _rows(self):
+        """
+        Read the rows of the CSV file
+        :return iterator of dicts of column name to value
+        :rtype iterator
+        """
+        with open(self._file_path, "r", encoding=self._encoding, newline="") as f:
+            yield from csv.DictReader(f, **self._fmtparams)
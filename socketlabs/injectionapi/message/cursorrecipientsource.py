@@ -0,0 +1,63 @@
+from .recipientsource import RecipientSource
+
+
+class CursorRecipientSource(RecipientSource):
+    """
+    Reads BulkRecipients from a DB-API cursor on which a query has been executed. Rows are
+    fetched in batches with fetchmany, so the result set is never loaded at once. The columns
+    are named as in the cursor's description. A cursor can only be iterated once.
+
+    :Example:
+
+         cursor = connection.cursor()
+         cursor.execute("SELECT email, first_name, color FROM customers")
+         recipients = CursorRecipientSource(cursor, email_column="email",
+                                            merge_fields={"first_name": "FirstName", "color": "FavoriteColor"})
+         response = client.send_bulk_campaign(message, recipients)
+
+    """
+
+    def __init__(self, cursor, email_column: str = "email", name_column: str = None, merge_fields=None,
+                 fetch_size: int = 1000):
+        """
+        Initializes a new instance of the CursorRecipientSource class
+        :param cursor: the DB-API cursor holding the result set
+        :type cursor: object
+        :param email_column: the column holding the email address
+        :type email_column: str
+        :param name_column: the column holding the friendly name, if any
+        :type name_column: str
+        :param merge_fields: the columns to add as merge data: a dict of column to merge field name,
+                             a list of columns used under their own names, or None for all other columns
+        :type merge_fields: dict, list
+        :param fetch_size: the number of rows fetched at a time
+        :type fetch_size: int
+        """
+        if fetch_size is None or fetch_size <= 0:
+            raise AttributeError("fetch_size must be greater than 0")
+        super().__init__(email_column, name_column, merge_fields)
+        self._cursor = cursor
+        self._fetch_size = fetch_size
+
+    @property
+    def fetch_size(self):
+        """
+        Get the number of rows fetched at a time
+        :return the fetch size
+        :rtype int
+        """
+        return self._fetch_size
+
+    def _rows(self):
+        """
+        Read the rows of the cursor
+        :return iterator of dicts of column name to value
+        :rtype iterator
+        """
+        columns = [description[0] for description in self._cursor.description]
+        while True:
+            rows = self._cursor.fetchmany(self._fetch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield dict(zip(columns, row))
@@ -15,6 +15,8 @@ class CustomHeader(object):
 
     """
 
+    __slots__ = ("_name", "_value")
+
     def __init__(self, name: str = None, val: str = None):
         """
         Initializes a new instance of the CustomHeader class
@@ -11,6 +11,8 @@ class EmailAddress(object):
 
     """
 
+    __slots__ = ("_email_address", "_friendly_name")
+
     def __init__(self, email_address: str = None, friendly_name: str = None):
         """
         Initializes a new instance of the EmailAddress class
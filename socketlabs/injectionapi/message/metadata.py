@@ -15,6 +15,8 @@ class Metadata(object):
 
     """
 
+    __slots__ = ("_key", "_value")
+
     def __init__(self, key: str = None, val: str = None):
         """
         Initializes a new instance of the Metadata class
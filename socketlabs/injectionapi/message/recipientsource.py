@@ -0,0 +1,92 @@
+from .bulkrecipient import BulkRecipient
+
+
+class RecipientSource(object):
+    """
+    Base class of the sources that read BulkRecipients lazily from rows of data, such as a CSV
+    file or a database cursor. Each row is mapped to a BulkRecipient as it is read, so a source
+    of any size can be passed to SocketLabsClient.send_bulk_campaign without loading it into memory.
+    """
+
+    def __init__(self, email_column: str, name_column: str = None, merge_fields=None):
+        """
+        Initializes a new instance of the RecipientSource class
+        :param email_column: the column holding the email address
+        :type email_column: str
+        :param name_column: the column holding the friendly name, if any
+        :type name_column: str
+        :param merge_fields: the columns to add as merge data: a dict of column to merge field name,
+                             a list of columns used under their own names, or None for all other columns
+        :type merge_fields: dict, list
+        """
+        if email_column is None:
+            raise AttributeError("email_column must be set")
+        if merge_fields is not None and not isinstance(merge_fields, dict):
+            merge_fields = dict((column, column) for column in merge_fields)
+
+        self._email_column = email_column
+        self._name_column = name_column
+        self._merge_fields = merge_fields
+
+    @property
+    def email_column(self):
+        """
+        Get the column holding the email address
+        :return the column name
+        :rtype str
+        """
+        return self._email_column
+
+    @property
+    def name_column(self):
+        """
+        Get the column holding the friendly name
+        :return the column name, or None
+        :rtype str
+        """
+        return self._name_column
+
+    @property
+    def merge_fields(self):
+        """
+        Get the mapping of columns to merge field names
+        :return the mapping, or None when all other columns are added
+        :rtype dict
+        """
+        return self._merge_fields
+
+    def _rows(self):
+        """
+        Read the rows of the source
+        :return iterator of dicts of column name to value
+        :rtype iterator
+        """
+        raise NotImplementedError()
+
+    def _merge_field_map(self, columns: list):
+        """
+        Get the columns to add as merge data and their merge field names
+        :param columns: the columns of the source
+        :type columns: list
+        :return list of tuples of the column and the merge field name
+        :rtype list
+        """
+        if self._merge_fields is not None:
+            return list(self._merge_fields.items())
+        return [(column, column) for column in columns
+                if column != self._email_column and column != self._name_column]
+
+    def __iter__(self):
+        """
+        Iterate over the recipients of the source
+        :return iterator of BulkRecipient
+        :rtype iterator
+        """
+        fields = None
+        for row in self._rows():
+            if fields is None:
+                fields = self._merge_field_map(list(row.keys()))
+            merge_data = dict((field, str(row[column]) if row[column] is not None else "")
+                              for column, field in fields)
+            name = row[self._name_column] if self._name_column is not None else None
+            yield BulkRecipient(row[self._email_column], name, merge_data)
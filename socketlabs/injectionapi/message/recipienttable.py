@@ -0,0 +1,199 @@
+import sys
+
+from .bulkrecipient import BulkRecipient
+
+
+class RecipientTable(object):
+    """
+    Columnar store of the recipients of a BulkMessage. The email addresses, friendly names and
+    the values of each merge field are held in one list per column, and each merge field name is
+    stored once, instead of a BulkRecipient and a merge data dictionary per recipient. The table
+    can be assigned to BulkMessage.to_recipient; the per message merge data is then serialized
+    straight from the columns. Iterating the table or indexing it yields BulkRecipient objects.
+    A merge field whose value is None is left out of that recipient's merge data.
+
+    :Example:
+
+         table = RecipientTable(["FirstName", "FavoriteColor"])
+         table.add_row("recipient1@example.com", "Recipient One", ["One", "Green"])
+         table.add_row("recipient2@example.com", merge_data={"FirstName": "Two"})
+         message.to_recipient = table
+
+    """
+
+    def __init__(self, fields: list = None):
+        """
+        Initializes a new instance of the RecipientTable class
+        :param fields: the names of the merge fields
+        :type fields: list
+        """
+        self._email_addresses = []
+        self._friendly_names = []
+        self._fields = []
+        self._columns = []
+        self._field_index = {}
+        for field in fields if fields is not None else []:
+            self.add_field(field)
+
+    @property
+    def fields(self):
+        """
+        Get the names of the merge fields, in column order
+        :return the list of field names
+        :rtype list
+        """
+        return self._fields
+
+    @property
+    def email_addresses(self):
+        """
+        Get the email address column
+        :return the list of email addresses
+        :rtype list
+        """
+        return self._email_addresses
+
+    @property
+    def friendly_names(self):
+        """
+        Get the friendly name column
+        :return the list of friendly names
+        :rtype list
+        """
+        return self._friendly_names
+
+    @property
+    def columns(self):
+        """
+        Get the merge field columns, in the order of fields
+        :return the list of value lists
+        :rtype list
+        """
+        return self._columns
+
+    def column(self, field: str):
+        """
+        Get the values of a merge field
+        :param field: the merge field name
+        :type field: str
+        :return the list of values
+        :rtype list
+        """
+        return self._columns[self._field_index[field]]
+
+    def add_field(self, field: str):
+        """
+        Add a merge field column. Existing rows have no value for it.
+        :param field: the merge field name
+        :type field: str
+        :return the index of the column
+        :rtype int
+        """
+        index = self._field_index.get(field)
+        if index is None:
+            index = len(self._fields)
+            self._fields.append(sys.intern(field))
+            self._columns.append([None] * len(self._email_addresses))
+            self._field_index[self._fields[index]] = index
+        return index
+
+    def add_row(self, email_address: str, friendly_name: str = None, values: list = None, merge_data: dict = None):
+        """
+        Add a recipient. The merge data is given either as values in the order of the fields,
+        or as a dictionary; fields not yet in the table are added.
+        :param email_address: the email address
+        :type email_address: str
+        :param friendly_name: the recipients friendly name
+        :type friendly_name: str
+        :param values: the merge field values, in the order of the fields
+        :type values: list
+        :param merge_data: the merge field values by field name
+        :type merge_data: dict
+        """
+        if values is not None and len(values) > len(self._fields):
+            raise AttributeError("values has more items than the table has fields")
+
+        row = len(self._email_addresses)
+        self._email_addresses.append(email_address)
+        self._friendly_names.append(friendly_name)
+        for column in self._columns:
+            column.append(None)
+
+        if values is not None:
+            for index, value in enumerate(values):
+                self._columns[index][row] = value
+        if merge_data is not None:
+            for field, value in merge_data.items():
+                self._columns[self.add_field(field)][row] = value
+
+    def append(self, recipient: BulkRecipient):
+        """
+        Add a BulkRecipient to the table
+        :param recipient: the recipient
+        :type recipient: BulkRecipient
+        """
+        self.add_row(recipient.email_address, recipient.friendly_name, merge_data=recipient.merge_data)
+
+    @staticmethod
+    def from_recipients(recipients):
+        """
+        Build a table from BulkRecipient objects
+        :param recipients: the recipients
+        :type recipients: iterable
+        :return the table
+        :rtype RecipientTable
+        """
+        table = RecipientTable()
+        for recipient in recipients:
+            table.append(recipient)
+        return table
+
+    def __len__(self):
+        """
+        Get the number of recipients
+        :return the count
+        :rtype int
+        """
+        return len(self._email_addresses)
+
+    def __getitem__(self, index):
+        """
+        Get a recipient, or a table of the recipients in a slice
+        :param index: the row index or slice
+        :type index: int, slice
+        :return the recipient or the table
+        :rtype BulkRecipient, RecipientTable
+        """
+        if isinstance(index, slice):
+            table = RecipientTable()
+            # the field names are shared, the lists holding them are not
+            table._fields = list(self._fields)
+            table._field_index = dict(self._field_index)
+            table._email_addresses = self._email_addresses[index]
+            table._friendly_names = self._friendly_names[index]
+            table._columns = [column[index] for column in self._columns]
+            return table
+        return self.__recipient(range(len(self._email_addresses))[index])
+
+    def __iter__(self):
+        """
+        Iterate over the recipients
+        :return iterator of BulkRecipient
+        :rtype iterator
+        """
+        for row in range(len(self._email_addresses)):
+            yield self.__recipient(row)
+
+    def __recipient(self, row: int):
+        """
+        Build the BulkRecipient of a row
+        :param row: the row index
+        :type row: int
+        :return the recipient
+        :rtype BulkRecipient
+        """
+        merge_data = {}
+        for field, column in zip(self._fields, self._columns):
+            if column[row] is not None:
+                merge_data[field] = column[row]
+        return BulkRecipient(self._email_addresses[row], self._friendly_names[row], merge_data)
@@ -0,0 +1,6 @@
+from .counter import Counter
+from .gauge import Gauge
+from .histogram import Histogram
+from .metric import Metric
+from .metricsobserver import MetricsObserver
+from .metricsregistry import MetricsRegistry
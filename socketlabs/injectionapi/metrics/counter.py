@@ -0,0 +1,62 @@
+from .metric import Metric
+
+
+class Counter(Metric):
+    """
+    A value that only goes up, such as the number of messages sent. Thread-safe.
+
+    :Example:
+
+         sends = registry.counter("app_sends_total", "Sends by result", ("result",))
+         sends.inc(labels={"result": "Success"})
+
+    """
+
+    Type = "counter"
+
+    def __init__(self, name: str, description: str, label_names: tuple = ()):
+        """
+        Initializes a new instance of the Counter class
+        :param name: the name of the metric
+        :type name: str
+        :param description: the help text of the metric
+        :type description: str
+        :param label_names: the names of the labels of the metric
+        :type label_names: tuple
+        """
+        super().__init__(name, description, label_names)
+        self._values = {} if label_names else {(): 0}
+
+    def inc(self, amount: float = 1, labels: dict = None):
+        """
+        Increase the counter
+        :param amount: the amount to add, not negative
+        :type amount: float
+        :param labels: the label values by label name, for a counter with labels
+        :type labels: dict
+        """
+        if amount < 0:
+            raise AttributeError("A counter can only be increased")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, labels: dict = None):
+        """
+        Get the value of the counter
+        :param labels: the label values by label name, for a counter with labels
+        :type labels: dict
+        :return the value, 0 when never increased
+        :rtype float
+        """
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        """
+        Get the value of the counter for each combination of label values
+        :return the list of (name suffix, labels, value) tuples
+        :rtype list
+        """
+        with self._lock:
+            values = sorted(self._values.items())
+        return [("", list(zip(self._label_names, key)), value) for key, value in values]
@@ -0,0 +1,93 @@
+from .metric import Metric
+
+
+class Gauge(Metric):
+    """
+    A value that goes up and down, such as the number of sends in flight. Thread-safe.
+    A gauge given a function reads its value from the function each time it is exported.
+
+    :Example:
+
+         in_flight = registry.gauge("app_sends_in_flight", "Sends in progress")
+         in_flight.inc()
+         registry.gauge("app_pool_idle", "Idle connections", function=lambda: client.connection_pool.idle_count)
+
+    """
+
+    Type = "gauge"
+
+    def __init__(self, name: str, description: str, label_names: tuple = (), function=None):
+        """
+        Initializes a new instance of the Gauge class
+        :param name: the name of the metric
+        :type name: str
+        :param description: the help text of the metric
+        :type description: str
+        :param label_names: the names of the labels of the metric
+        :type label_names: tuple
+        :param function: the function returning the value of a gauge without labels, if the gauge is not set
+        :type function: function
+        """
+        if function is not None and label_names:
+            raise AttributeError("A gauge read from a function cannot have labels")
+        super().__init__(name, description, label_names)
+        self._function = function
+        self._values = {} if label_names else {(): 0}
+
+    def set(self, value: float, labels: dict = None):
+        """
+        Set the gauge
+        :param value: the value
+        :type value: float
+        :param labels: the label values by label name, for a gauge with labels
+        :type labels: dict
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, labels: dict = None):
+        """
+        Increase the gauge
+        :param amount: the amount to add
+        :type amount: float
+        :param labels: the label values by label name, for a gauge with labels
+        :type labels: dict
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, labels: dict = None):
+        """
+        Decrease the gauge
+        :param amount: the amount to subtract
+        :type amount: float
+        :param labels: the label values by label name, for a gauge with labels
+        :type labels: dict
+        """
+        self.inc(-amount, labels)
+
+    def get(self, labels: dict = None):
+        """
+        Get the value of the gauge
+        :param labels: the label values by label name, for a gauge with labels
+        :type labels: dict
+        :return the value, 0 when never set
+        :rtype float
+        """
+        if self._function is not None:
+            return self._function()
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        """
+        Get the value of the gauge for each combination of label values
+        :return the list of (name suffix, labels, value) tuples
+        :rtype list
+        """
+        if self._function is not None:
+            return [("", [], self._function())]
+        with self._lock:
+            values = sorted(self._values.items())
+        return [("", list(zip(self._label_names, key)), value) for key, value in values]
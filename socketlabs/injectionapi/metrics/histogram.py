@@ -0,0 +1,122 @@
+from bisect import bisect_left
+
+from .metric import Metric
+
+
+class Histogram(Metric):
+    """
+    Counts observed values, such as latencies, in buckets with fixed upper bounds, and keeps their
+    count and sum. The buckets are exported cumulatively, each counting the values less than or
+    equal to its bound, followed by the +Inf bucket. Thread-safe.
+
+    :Example:
+
+         latency = registry.histogram("app_send_seconds", "Send latency", buckets=(0.1, 0.5, 1, 5))
+         latency.observe(0.27)
+
+    """
+
+    Type = "histogram"
+
+    DefaultBuckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+    def __init__(self, name: str, description: str, label_names: tuple = (), buckets: tuple = None):
+        """
+        Initializes a new instance of the Histogram class
+        :param name: the name of the metric
+        :type name: str
+        :param description: the help text of the metric
+        :type description: str
+        :param label_names: the names of the labels of the metric
+        :type label_names: tuple
+        :param buckets: the upper bounds of the buckets, in increasing order; DefaultBuckets if None
+        :type buckets: tuple
+        """
+        if "le" in label_names:
+            raise AttributeError("le is reserved for the bucket bounds of a histogram")
+        buckets = tuple(float(b) for b in (buckets if buckets is not None else self.DefaultBuckets))
+        if len(buckets) == 0 or any(b >= n for b, n in zip(buckets, buckets[1:])):
+            raise AttributeError("The buckets of a histogram must be in increasing order")
+        super().__init__(name, description, label_names)
+        self._buckets = buckets
+        self._values = {}
+
+    @property
+    def buckets(self):
+        """
+        Get the upper bounds of the buckets
+        :return the bounds
+        :rtype tuple
+        """
+        return self._buckets
+
+    def observe(self, value: float, labels: dict = None):
+        """
+        Count a value in its bucket
+        :param value: the value
+        :type value: float
+        :param labels: the label values by label name, for a histogram with labels
+        :type labels: dict
+        """
+        key = self._key(labels)
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            values = self._values.get(key)
+            if values is None:
+                # a count per bucket and one for +Inf, then the sum
+                values = self._values[key] = [0] * (len(self._buckets) + 1) + [0.0]
+            values[index] += 1
+            values[-1] += value
+
+    def get_count(self, labels: dict = None):
+        """
+        Get the number of values observed
+        :param labels: the label values by label name, for a histogram with labels
+        :type labels: dict
+        :return the count
+        :rtype int
+        """
+        values = self._values.get(self._key(labels))
+        return sum(values[:-1]) if values is not None else 0
+
+    def get_sum(self, labels: dict = None):
+        """
+        Get the sum of the values observed
+        :param labels: the label values by label name, for a histogram with labels
+        :type labels: dict
+        :return the sum
+        :rtype float
+        """
+        values = self._values.get(self._key(labels))
+        return values[-1] if values is not None else 0.0
+
+    def samples(self):
+        """
+        Get the cumulative bucket counts, the count and the sum for each combination of label values
+        :return the list of (name suffix, labels, value) tuples
+        :rtype list
+        """
+        with self._lock:
+            values = sorted((key, list(counts)) for key, counts in self._values.items())
+        if not values and not self._label_names:
+            values = [((), [0] * (len(self._buckets) + 1) + [0.0])]
+
+        samples = []
+        for key, counts in values:
+            labels = list(zip(self._label_names, key))
+            total = 0
+            for bound, count in zip(self._buckets + (float("inf"),), counts):
+                total += count
+                samples.append(("_bucket", labels + [("le", _format_bound(bound))], total))
+            samples.append(("_count", labels, total))
+            samples.append(("_sum", labels, counts[-1]))
+        return samples
+
+
+def _format_bound(bound: float):
+    """
+    Format the upper bound of a bucket as the value of its le label
+    """
+    if bound == float("inf"):
+        return "+Inf"
+    return repr(bound)
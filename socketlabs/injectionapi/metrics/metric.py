@@ -0,0 +1,127 @@
+import math
+import re
+import threading
+
+_name_match = re.compile(r'[a-zA-Z_:][a-zA-Z0-9_:]*').fullmatch
+_label_name_match = re.compile(r'[a-zA-Z_][a-zA-Z0-9_]*').fullmatch
+
+
+class Metric(object):
+    """
+    Base class of the metrics held by a MetricsRegistry. A metric has a value, or a set of values,
+    for each combination of the values of its labels.
+    """
+
+    Type = "untyped"
+
+    def __init__(self, name: str, description: str, label_names: tuple = ()):
+        """
+        Initializes a new instance of the Metric class
+        :param name: the name of the metric
+        :type name: str
+        :param description: the help text of the metric
+        :type description: str
+        :param label_names: the names of the labels of the metric
+        :type label_names: tuple
+        """
+        if name is None or not _name_match(name):
+            raise AttributeError("{0} is not a valid metric name".format(name))
+        for label_name in label_names:
+            if not _label_name_match(label_name):
+                raise AttributeError("{0} is not a valid label name".format(label_name))
+        self._name = name
+        self._description = description
+        self._label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    @property
+    def name(self):
+        """
+        Get the name of the metric
+        :return the name
+        :rtype str
+        """
+        return self._name
+
+    @property
+    def description(self):
+        """
+        Get the help text of the metric
+        :return the description
+        :rtype str
+        """
+        return self._description
+
+    @property
+    def label_names(self):
+        """
+        Get the names of the labels of the metric
+        :return the label names
+        :rtype tuple
+        """
+        return self._label_names
+
+    def _key(self, labels: dict):
+        """
+        Get the values of the labels, in the order of the label names
+        :param labels: the label values by label name
+        :type labels: dict
+        :return the label values
+        :rtype tuple
+        """
+        if not labels:
+            if self._label_names:
+                raise AttributeError("{0} requires the labels {1}".format(self._name, ", ".join(self._label_names)))
+            return ()
+        if len(labels) != len(self._label_names):
+            raise AttributeError("{0} requires the labels {1}".format(self._name, ", ".join(self._label_names)))
+        return tuple(str(labels[label_name]) for label_name in self._label_names)
+
+    def samples(self):
+        """
+        Get the current samples of the metric
+        :return the list of (name suffix, labels, value) tuples, the labels as a list of (name, value) tuples
+        :rtype list
+        """
+        return []
+
+    def to_text(self):
+        """
+        Get the metric in the Prometheus text exposition format
+        :return the HELP and TYPE lines followed by a line per sample
+        :rtype str
+        """
+        lines = [
+            "# HELP {0} {1}".format(self._name, _escape(self._description, False)),
+            "# TYPE {0} {1}".format(self._name, self.Type)
+        ]
+        for suffix, labels, value in self.samples():
+            if labels:
+                lines.append("{0}{1}{{{2}}} {3}".format(self._name, suffix, ",".join(
+                    '{0}="{1}"'.format(n, _escape(v, True)) for n, v in labels), _format_value(value)))
+            else:
+                lines.append("{0}{1} {2}".format(self._name, suffix, _format_value(value)))
+        return "\n".join(lines) + "\n"
+
+
+def _escape(text: str, quoted: bool):
+    """
+    Escape the backslashes and line feeds of help text, and the double quotes of a label value
+    """
+    text = str(text).replace("\\", "\\\\").replace("\n", "\\n")
+    return text.replace('"', '\\"') if quoted else text
+
+
+def _format_value(value):
+    """
+    Format a sample value, writing whole numbers without a decimal part
+    """
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if math.isnan(value):
+            return "NaN"
+        if value.is_integer() and abs(value) < 1e15:
+            return str(int(value))
+        return repr(value)
+    return str(value)
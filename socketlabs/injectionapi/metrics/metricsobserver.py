@@ -0,0 +1,97 @@
+from ..sendobserver import SendObserver
+from .metricsregistry import MetricsRegistry
+
+
+class MetricsObserver(SendObserver):
+    """
+    Keeps the metrics of the sends of a client in a MetricsRegistry. The metrics, named with the prefix, are:
+        _sends_total{result}              counter of the sends by SendResult, Exception when the send raised one
+        _messages_total{result}           counter of the messages sent
+        _recipients_total{result}         counter of the recipients of the messages sent
+        _request_bytes_total              counter of the bytes of the request bodies, after compression,
+                                          counted once per send
+        _response_bytes_total             counter of the bytes received
+        _attempts_total                   counter of the requests made, retries included
+        _retries_total{reason}            counter of the retries, by the status code of the attempt
+                                          retried, or exception when it failed without a response
+        _retried_sends_total{result}      counter of the sends that were retried, by their final result
+        _sends_in_flight                  gauge of the sends in progress
+        _send_duration_seconds            histogram of the seconds each send took
+        _phase_duration_seconds{phase}    histogram of the seconds each send spent in each SendPhase
+
+    A rising rate of _retries_total over _attempts_total, or of 429 retries, warns of throttling
+    before sends start returning OverQuota.
+    """
+
+    def __init__(self, registry: MetricsRegistry, prefix: str = "socketlabs", buckets: tuple = None):
+        """
+        Initializes a new instance of the MetricsObserver class
+        :param registry: the registry to keep the metrics in
+        :type registry: MetricsRegistry
+        :param prefix: the prefix of the metric names
+        :type prefix: str
+        :param buckets: the upper bounds of the buckets of the duration histograms; Histogram.DefaultBuckets if None
+        :type buckets: tuple
+        """
+        self._sends = registry.counter(
+            prefix + "_sends_total", "Sends to the Injection API by result", ("result",))
+        self._messages = registry.counter(
+            prefix + "_messages_total", "Messages sent to the Injection API by result", ("result",))
+        self._recipients = registry.counter(
+            prefix + "_recipients_total", "Recipients of the messages sent to the Injection API by result",
+            ("result",))
+        self._request_bytes = registry.counter(
+            prefix + "_request_bytes_total",
+            "Bytes of the request bodies sent to the Injection API, after compression")
+        self._response_bytes = registry.counter(
+            prefix + "_response_bytes_total", "Bytes received from the Injection API")
+        self._attempts = registry.counter(
+            prefix + "_attempts_total", "Requests made to the Injection API, retries included")
+        self._retries = registry.counter(
+            prefix + "_retries_total", "Retried requests by the status code of the attempt retried", ("reason",))
+        self._retried_sends = registry.counter(
+            prefix + "_retried_sends_total", "Sends that were retried by their final result", ("result",))
+        self._in_flight = registry.gauge(
+            prefix + "_sends_in_flight", "Sends to the Injection API in progress")
+        self._duration = registry.histogram(
+            prefix + "_send_duration_seconds", "Duration of the sends to the Injection API", buckets=buckets)
+        self._phase_duration = registry.histogram(
+            prefix + "_phase_duration_seconds", "Time the sends spent in each phase", ("phase",), buckets)
+        self._started = set()
+
+    def on_send_start(self, event):
+        """
+        Count the send as in flight
+        :param event: the event of the send
+        :type event: SendEvent
+        """
+        self._started.add(event)
+        self._in_flight.inc()
+
+    def on_send_complete(self, event):
+        """
+        Record the outcome, the attempts and the timings of the send
+        :param event: the event of the send
+        :type event: SendEvent
+        """
+        if event in self._started:
+            self._started.discard(event)
+            self._in_flight.dec()
+
+        result = {"result": event.result.name if event.result is not None else "Exception"}
+        self._sends.inc(1, result)
+        self._messages.inc(event.message_count, result)
+        self._recipients.inc(event.recipient_count, result)
+        self._request_bytes.inc(event.request_bytes)
+        self._response_bytes.inc(event.response_bytes)
+        self._attempts.inc(event.attempts)
+
+        retried = event.attempt_intervals[:-1]
+        for _, _, status_code in retried:
+            self._retries.inc(1, {"reason": status_code if status_code is not None else "exception"})
+        if retried:
+            self._retried_sends.inc(1, result)
+
+        self._duration.observe(event.duration)
+        for phase, seconds in event.timings.items():
+            self._phase_duration.observe(seconds, {"phase": phase.name})
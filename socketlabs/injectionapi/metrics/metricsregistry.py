@@ -0,0 +1,136 @@
+import threading
+
+from .counter import Counter
+from .gauge import Gauge
+from .histogram import Histogram
+
+
+class MetricsRegistry(object):
+    """
+    In-process registry of counters, gauges and histograms, exported in the Prometheus text
+    exposition format. Asking for a metric that is already registered returns it, so the same
+    registry can be shared by several clients.
+
+    :Example:
+
+         registry = MetricsRegistry()
+         sends = registry.counter("app_sends_total", "Sends by result", ("result",))
+         sends.inc(labels={"result": "Success"})
+         print(registry.to_text())
+
+    """
+
+    ContentType = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        """
+        Initializes a new instance of the MetricsRegistry class
+        """
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    @property
+    def metrics(self):
+        """
+        Get the registered metrics, in the order they were registered
+        :return the list of metrics
+        :rtype list
+        """
+        return list(self._metrics.values())
+
+    def get(self, name: str):
+        """
+        Get a registered metric
+        :param name: the name of the metric
+        :type name: str
+        :return the metric, or None when no metric has the name
+        :rtype Metric
+        """
+        return self._metrics.get(name)
+
+    def counter(self, name: str, description: str, label_names: tuple = ()):
+        """
+        Get the counter with the name, registering it if needed
+        :param name: the name of the counter
+        :type name: str
+        :param description: the help text of the counter
+        :type description: str
+        :param label_names: the names of the labels of the counter
+        :type label_names: tuple
+        :return the counter
+        :rtype Counter
+        """
+        return self.__register(Counter, name, label_names, lambda: Counter(name, description, label_names))
+
+    def gauge(self, name: str, description: str, label_names: tuple = (), function=None):
+        """
+        Get the gauge with the name, registering it if needed
+        :param name: the name of the gauge
+        :type name: str
+        :param description: the help text of the gauge
+        :type description: str
+        :param label_names: the names of the labels of the gauge
+        :type label_names: tuple
+        :param function: the function returning the value of the gauge when it is exported, if the gauge is not set
+        :type function: function
+        :return the gauge
+        :rtype Gauge
+        """
+        return self.__register(Gauge, name, label_names, lambda: Gauge(name, description, label_names, function))
+
+    def histogram(self, name: str, description: str, label_names: tuple = (), buckets: tuple = None):
+        """
+        Get the histogram with the name, registering it if needed
+        :param name: the name of the histogram
+        :type name: str
+        :param description: the help text of the histogram
+        :type description: str
+        :param label_names: the names of the labels of the histogram
+        :type label_names: tuple
+        :param buckets: the upper bounds of the buckets; Histogram.DefaultBuckets if None
+        :type buckets: tuple
+        :return the histogram
+        :rtype Histogram
+        """
+        return self.__register(Histogram, name, label_names,
+                               lambda: Histogram(name, description, label_names, buckets))
+
+    def unregister(self, name: str):
+        """
+        Remove a metric from the registry
+        :param name: the name of the metric
+        :type name: str
+        """
+        with self._lock:
+            self._metrics.pop(name, None)
+
+    def to_text(self):
+        """
+        Get all the metrics in the Prometheus text exposition format, served with ContentType
+        :return the exposition
+        :rtype str
+        """
+        return "".join(metric.to_text() for metric in self.metrics)
+
+    def __register(self, metric_type, name: str, label_names: tuple, create):
+        """
+        Get the metric with the name, creating and registering it when there is none
+        :param metric_type: the class the metric must be
+        :type metric_type: type
+        :param name: the name of the metric
+        :type name: str
+        :param label_names: the names of the labels the metric must have
+        :type label_names: tuple
+        :param create: the function creating the metric
+        :type create: function
+        :return the metric
+        :rtype Metric
+        """
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = create()
+            elif type(metric) is not metric_type or metric.label_names != tuple(label_names):
+                raise Exception("The metric {0} is already registered as a {1} with the labels ({2})".format(
+                    name, metric.Type, ", ".join(metric.label_names)))
+            return metric
@@ -0,0 +1,169 @@
+from .sendobserver import SendObserver
+from .sendresult import SendResult
+from .version import __version__
+
+try:
+    from opentelemetry import metrics, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:  # opentelemetry is an optional dependency, only needed by this observer
+    metrics = None
+    trace = None
+
+
+class OpenTelemetryObserver(SendObserver):
+    """
+    Reports the sends of a client to OpenTelemetry. Each send is traced as a socketlabs.send span,
+    with a socketlabs.attempt child span for each time the request was sent, retries included,
+    and a child span for each SendPhase, e.g. socketlabs.serialize, socketlabs.connect or
+    socketlabs.wait. The phases of the request are children of the attempt they belong to.
+    The phase and attempt spans are built from the SendEvent once the send completes.
+
+    The metrics, all with the socketlabs.result attribute, are:
+        socketlabs.messages.sent      counter of the messages sent
+        socketlabs.recipients.sent    counter of the recipients of the messages sent
+        socketlabs.request.bytes      counter of the bytes sent, after compression
+        socketlabs.response.bytes     counter of the bytes received
+        socketlabs.send.duration      histogram of the seconds each send took
+
+    Requires the opentelemetry-api package, installed with the opentelemetry extra of this
+    package; the client itself does not depend on it. The global tracer and meter providers
+    are used unless others are given.
+
+    :Example:
+
+         from socketlabs.injectionapi.opentelemetryobserver import OpenTelemetryObserver
+
+         client.add_observer(OpenTelemetryObserver())
+
+    """
+
+    InstrumentationName = "socketlabs.injectionapi"
+
+    def __init__(self, tracer_provider=None, meter_provider=None):
+        """
+        Initializes a new instance of the OpenTelemetryObserver class
+        :param tracer_provider: the tracer provider to trace with, the global one if None
+        :type tracer_provider: TracerProvider
+        :param meter_provider: the meter provider to record the metrics with, the global one if None
+        :type meter_provider: MeterProvider
+        """
+        if trace is None:
+            raise Exception("The OpenTelemetryObserver requires the opentelemetry-api package")
+
+        self._tracer = trace.get_tracer(self.InstrumentationName, __version__, tracer_provider)
+        meter = metrics.get_meter(self.InstrumentationName, __version__, meter_provider)
+        self._messages = meter.create_counter(
+            "socketlabs.messages.sent", unit="{message}", description="Messages sent to the Injection API")
+        self._recipients = meter.create_counter(
+            "socketlabs.recipients.sent", unit="{recipient}",
+            description="Recipients of the messages sent to the Injection API")
+        self._request_bytes = meter.create_counter(
+            "socketlabs.request.bytes", unit="By", description="Bytes sent to the Injection API, after compression")
+        self._response_bytes = meter.create_counter(
+            "socketlabs.response.bytes", unit="By", description="Bytes received from the Injection API")
+        self._duration = meter.create_histogram(
+            "socketlabs.send.duration", unit="s", description="Duration of the sends to the Injection API")
+        self._spans = {}
+
+    def on_send_start(self, event):
+        """
+        Start the span of the send, as a child of the span current where the send is made
+        :param event: the event of the send
+        :type event: SendEvent
+        """
+        self._spans[event] = self._tracer.start_span("socketlabs.send", start_time=self.__timestamp(event, 0))
+
+    def on_send_complete(self, event):
+        """
+        Add the attempt and phase spans of the send, end its span and record the metrics
+        :param event: the event of the send
+        :type event: SendEvent
+        """
+        span = self._spans.pop(event, None)
+        if span is None:
+            # the observer was added while the send was in progress
+            span = self._tracer.start_span("socketlabs.send", start_time=self.__timestamp(event, 0))
+        result = self.__result_name(event)
+        end_time = self.__timestamp(event, event.duration)
+
+        span.set_attributes({
+            "socketlabs.result": result,
+            "socketlabs.message_count": event.message_count,
+            "socketlabs.recipient_count": event.recipient_count,
+            "socketlabs.attempts": event.attempts,
+            "socketlabs.request.bytes": event.request_bytes,
+            "socketlabs.response.bytes": event.response_bytes
+        })
+        if event.status_code is not None:
+            span.set_attribute("http.response.status_code", event.status_code)
+        if event.exception is not None:
+            span.set_attribute("error.type", type(event.exception).__name__)
+            span.record_exception(event.exception, timestamp=end_time)
+            span.set_status(Status(StatusCode.ERROR, str(event.exception)))
+        elif event.result not in (SendResult.Success, SendResult.Warning):
+            span.set_status(Status(StatusCode.ERROR, result))
+
+        self.__add_child_spans(span, event)
+        span.end(end_time=end_time)
+
+        attributes = {"socketlabs.result": result}
+        self._messages.add(event.message_count, attributes)
+        self._recipients.add(event.recipient_count, attributes)
+        self._request_bytes.add(event.request_bytes, attributes)
+        self._response_bytes.add(event.response_bytes, attributes)
+        self._duration.record(event.duration, attributes)
+
+    def __add_child_spans(self, span, event):
+        """
+        Add a span for each attempt and each phase of the send. A phase is put under the attempt
+        it happened in, the others under the span of the send.
+        :param span: the span of the send
+        :type span: Span
+        :param event: the event of the send
+        :type event: SendEvent
+        """
+        attempts = []
+        for number, (start, end, status_code) in enumerate(event.attempt_intervals, 1):
+            attempt = self._tracer.start_span(
+                "socketlabs.attempt", trace.set_span_in_context(span), kind=SpanKind.CLIENT,
+                attributes={"socketlabs.attempt": number}, start_time=self.__timestamp(event, start))
+            if status_code is not None:
+                attempt.set_attribute("http.response.status_code", status_code)
+            else:
+                attempt.set_status(Status(StatusCode.ERROR))
+            attempts.append((start, end, attempt))
+
+        for phase, start, end in event.intervals:
+            middle = (start + end) / 2
+            parent = next((a for a_start, a_end, a in attempts if a_start <= middle <= a_end), span)
+            child = self._tracer.start_span(
+                "socketlabs.{0}".format(phase.name.lower()), trace.set_span_in_context(parent),
+                kind=SpanKind.INTERNAL, start_time=self.__timestamp(event, start))
+            child.end(end_time=self.__timestamp(event, end))
+
+        for _, end, attempt in attempts:
+            attempt.end(end_time=self.__timestamp(event, end))
+
+    @staticmethod
+    def __timestamp(event, offset: float):
+        """
+        Get the time a number of seconds after the start of a send
+        :param event: the event of the send
+        :type event: SendEvent
+        :param offset: the seconds from the start of the send
+        :type offset: float
+        :return the nanoseconds since the epoch
+        :rtype int
+        """
+        return int(event.started_at * 1e9) + int(offset * 1e9)
+
+    @staticmethod
+    def __result_name(event):
+        """
+        Get the name of the result of a send, Exception when the send raised one
+        :param event: the event of the send
+        :type event: SendEvent
+        :return the name
+        :rtype str
+        """
+        return event.result.name if event.result is not None else "Exception"
@@ -0,0 +1,357 @@
+import logging
+import socket
+import sqlite3
+import threading
+import time
+
+from .core.sendvalidator import get_full_recipient_count
+from .message.bulkmessage import BulkMessage
+from .outboxentry import OutboxEntry
+from .outboxstate import OutboxState
+from .sendresult import SendResult
+
+logger = logging.getLogger(__name__)
+
+
+class Outbox(object):
+    """
+    Durable spool of messages on disk, so a message is not lost when the process stops before
+    it has been sent. enqueue stores the serialized message in a SQLite database and returns at
+    once; worker threads send the stored messages with the client, retry them with backoff while
+    the Injection API is unavailable, and mark them sent with the transaction receipt of the
+    response. Messages that were being sent when the process stopped are sent again when the
+    outbox is opened, so delivery is at least once. The server id and API key are not stored,
+    they are taken from the client when the message is sent. Only one Outbox should use a
+    database file at a time.
+
+    :Example:
+
+         client = SocketLabsClient(server_id, api_key)
+         with Outbox(client, "outbox.db") as outbox:
+             entry_id = outbox.enqueue(message)
+             outbox.flush(timeout=30)
+
+    """
+
+    SentResults = [
+        SendResult.Success,
+        SendResult.Warning
+    ]
+    RetryResults = [
+        SendResult.UnknownError,
+        SendResult.Timeout,
+        SendResult.InternalError,
+        SendResult.OverQuota,
+        SendResult.CircuitOpen
+    ]
+
+    def __init__(self, client, path: str, workers: int = 2, max_attempts: int = 10, retry_interval: float = 1,
+                 max_retry_interval: float = 300, poll_interval: float = 1):
+        """
+        Initializes a new instance of the Outbox class, creating the database if it does not exist
+        :param client: the client that sends the messages
+        :type client: SocketLabsClient
+        :param path: the path of the SQLite database file
+        :type path: str
+        :param workers: the number of worker threads sending messages
+        :type workers: int
+        :param max_attempts: the number of attempts after which a message is marked failed
+        :type max_attempts: int
+        :param retry_interval: the wait in seconds before the first retry; it doubles with each attempt
+        :type retry_interval: float
+        :param max_retry_interval: the longest wait in seconds between attempts
+        :type max_retry_interval: float
+        :param poll_interval: how often in seconds idle workers look for messages due to be retried
+        :type poll_interval: float
+        """
+        if workers is None or workers <= 0:
+            raise AttributeError("workers must be greater than 0")
+        if max_attempts is None or max_attempts <= 0:
+            raise AttributeError("max_attempts must be greater than 0")
+
+        self._client = client
+        self._path = path
+        self._workers = workers
+        self._max_attempts = max_attempts
+        self._retry_interval = retry_interval
+        self._max_retry_interval = max_retry_interval
+        self._poll_interval = poll_interval
+        self._local = threading.local()
+        self._connections = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition()
+        self._threads = []
+        self._stopping = False
+
+        connection = self.__connection
+        connection.execute("CREATE TABLE IF NOT EXISTS outbox ("
+                           "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                           "message BLOB NOT NULL, "
+                           "recipients INTEGER NOT NULL, "
+                           "state INTEGER NOT NULL, "
+                           "attempts INTEGER NOT NULL DEFAULT 0, "
+                           "next_attempt_at REAL NOT NULL, "
+                           "result INTEGER, "
+                           "transaction_receipt TEXT, "
+                           "error TEXT, "
+                           "created_at REAL NOT NULL, "
+                           "updated_at REAL NOT NULL)")
+        connection.execute("CREATE INDEX IF NOT EXISTS outbox_due ON outbox (state, next_attempt_at)")
+        # sends interrupted by the process stopping are made again
+        connection.execute("UPDATE outbox SET state = ? WHERE state = ?",
+                           (OutboxState.Pending.value, OutboxState.Sending.value))
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def path(self):
+        """
+        Get the path of the SQLite database file
+        :return the path
+        :rtype str
+        """
+        return self._path
+
+    @property
+    def pending_count(self):
+        """
+        Get the number of messages waiting to be sent or being sent
+        :return the number of pending messages
+        :rtype int
+        """
+        return self.__connection.execute(
+            "SELECT COUNT(*) FROM outbox WHERE state IN (?, ?)",
+            (OutboxState.Pending.value, OutboxState.Sending.value)).fetchone()[0]
+
+    @property
+    def __connection(self):
+        """
+        The SQLite connection of the current thread
+        :return the connection
+        :rtype Connection
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self._path, timeout=30, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=FULL")
+            self._local.connection = connection
+            with self._lock:
+                self._connections[threading.get_ident()] = connection
+        return connection
+
+    def __close_connection(self):
+        """
+        Close the SQLite connection of the current thread, if it has one
+        """
+        with self._lock:
+            connection = self._connections.pop(threading.get_ident(), None)
+        self._local.connection = None
+        if connection is not None:
+            connection.close()
+
+    def start(self):
+        """
+        Start the worker threads that send the stored messages
+        :return the outbox
+        :rtype Outbox
+        """
+        with self._lock:
+            if self._stopping:
+                raise Exception("The outbox is closed")
+            while len(self._threads) < self._workers:
+                thread = threading.Thread(target=self.__work, daemon=True,
+                                          name="socketlabs-outbox-{0}".format(len(self._threads)))
+                self._threads.append(thread)
+                thread.start()
+        return self
+
+    def enqueue(self, message):
+        """
+        Validate a BasicMessage or BulkMessage message and store it to be sent by the workers.
+        The message is on disk when this method returns.
+        :param message: a BasicMessage or BulkMessage object to be sent
+        :type message: object
+        :return the id of the entry in the outbox
+        :rtype int
+        """
+        resp, data = self._client.serialize_message(message)
+        if data is None:
+            raise Exception("The message is not valid: {0}".format(resp.result.name))
+
+        if isinstance(message, BulkMessage):
+            recipients = len(message.to_recipient) if message.to_recipient is not None else 0
+        else:
+            recipients = get_full_recipient_count(message)
+
+        now = time.time()
+        cursor = self.__connection.execute(
+            "INSERT INTO outbox (message, recipients, state, next_attempt_at, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (data, recipients, OutboxState.Pending.value, now, now, now))
+        with self._wakeup:
+            self._wakeup.notify()
+        return cursor.lastrowid
+
+    def get_entry(self, entry_id: int):
+        """
+        Get the state of a stored message
+        :param entry_id: the id returned by enqueue
+        :type entry_id: int
+        :return the entry, or None when there is no entry with the id
+        :rtype OutboxEntry
+        """
+        row = self.__connection.execute(
+            "SELECT id, state, attempts, result, transaction_receipt, error FROM outbox WHERE id = ?",
+            (entry_id,)).fetchone()
+        if row is None:
+            return None
+        return OutboxEntry(row[0], OutboxState(row[1]), row[2], SendResult(row[3]) if row[3] is not None else None,
+                           row[4], row[5])
+
+    def flush(self, timeout: float = None):
+        """
+        Wait until no messages are waiting to be sent or being sent. Messages waiting to be
+        retried are waited for as well.
+        :param timeout: the longest time in seconds to wait, or None to wait indefinitely
+        :type timeout: float
+        :return True when the outbox is empty, False when the timeout passed first
+        :rtype bool
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while self.pending_count > 0:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def purge_sent(self):
+        """
+        Delete the messages that have been sent from the database
+        :return the number of messages deleted
+        :rtype int
+        """
+        return self.__connection.execute("DELETE FROM outbox WHERE state = ?", (OutboxState.Sent.value,)).rowcount
+
+    def close(self, wait: bool = True):
+        """
+        Stop the worker threads. Messages not yet sent stay in the database and are sent
+        the next time an Outbox is opened on it. Each worker closes its database connection
+        when it exits.
+        :param wait: wait for the sends in progress to finish
+        :type wait: bool
+        """
+        with self._lock:
+            self._stopping = True
+            threads = list(self._threads)
+        with self._wakeup:
+            self._wakeup.notify_all()
+        if wait:
+            for thread in threads:
+                thread.join()
+
+        workers = set(thread.ident for thread in threads if thread.is_alive())
+        with self._lock:
+            connections = [c for ident, c in self._connections.items() if ident not in workers]
+            self._connections = {ident: c for ident, c in self._connections.items() if ident in workers}
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def __work(self):
+        """
+        Worker thread: send the messages that are due until the outbox is closed.
+        Database errors, e.g. the database being locked for longer than the timeout or
+        a constraint failing, are logged and the worker carries on.
+        """
+        try:
+            while not self._stopping:
+                try:
+                    entry = self.__claim()
+                except sqlite3.Error:
+                    logger.exception("Could not take the next message from the outbox %s", self._path)
+                    entry = None
+                if entry is None:
+                    with self._wakeup:
+                        if not self._stopping:
+                            self._wakeup.wait(self._poll_interval)
+                    continue
+
+                try:
+                    self.__deliver(*entry)
+                except sqlite3.Error:
+                    logger.exception("Could not record the send of the message %s of the outbox %s",
+                                     entry[0], self._path)
+                    self.__reset(entry[0])
+        finally:
+            self.__close_connection()
+
+    def __claim(self):
+        """
+        Take the next message that is due and mark it as being sent
+        :return the id, message, recipient count and attempts of the message, or None when none is due
+        :rtype tuple
+        """
+        connection = self.__connection
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT id, message, recipients, attempts FROM outbox "
+                "WHERE state = ? AND next_attempt_at <= ? ORDER BY next_attempt_at, id LIMIT 1",
+                (OutboxState.Pending.value, now)).fetchone()
+            if row is not None:
+                connection.execute("UPDATE outbox SET state = ?, updated_at = ? WHERE id = ?",
+                                   (OutboxState.Sending.value, now, row[0]))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return row
+
+    def __deliver(self, entry_id: int, message: bytes, recipients: int, attempts: int):
+        """
+        Send a claimed message and record the outcome: sent, due to be retried, or failed
+        """
+        attempts += 1
+        receipt = None
+        error = None
+        try:
+            resp = self._client.send_serialized_message(message, recipients)
+            result = resp.result
+            receipt = resp.transaction_receipt
+        except socket.timeout as e:
+            result = SendResult.Timeout
+            error = str(e) or type(e).__name__
+        except Exception as e:
+            result = SendResult.UnknownError
+            error = str(e) or type(e).__name__
+
+        next_attempt_at = time.time()
+        if result in self.SentResults:
+            state = OutboxState.Sent
+        elif result in self.RetryResults and attempts < self._max_attempts:
+            state = OutboxState.Pending
+            next_attempt_at += min(self._retry_interval * pow(2, attempts - 1), self._max_retry_interval)
+        else:
+            state = OutboxState.Failed
+
+        self.__connection.execute(
+            "UPDATE outbox SET state = ?, attempts = ?, next_attempt_at = ?, result = ?, "
+            "transaction_receipt = ?, error = ?, updated_at = ? WHERE id = ?",
+            (state.value, attempts, next_attempt_at, result.value, receipt, error, time.time(), entry_id))
+
+    def __reset(self, entry_id: int):
+        """
+        Put a message whose send could not be recorded back to be sent again. When that fails
+        as well, the message is sent again the next time an Outbox is opened on the database.
+        """
+        try:
+            self.__connection.execute("UPDATE outbox SET state = ?, updated_at = ? WHERE id = ? AND state = ?",
+                                      (OutboxState.Pending.value, time.time(), entry_id, OutboxState.Sending.value))
+        except sqlite3.Error:
+            logger.exception("Could not put the message %s of the outbox %s back to be sent", entry_id, self._path)
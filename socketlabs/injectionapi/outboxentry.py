@@ -0,0 +1,94 @@
+from .outboxstate import OutboxState
+from .sendresult import SendResult
+
+
+class OutboxEntry(object):
+    """
+    The state of a message stored in an Outbox
+    """
+
+    def __init__(self, entry_id: int, state: OutboxState, attempts: int = 0, result: SendResult = None,
+                 transaction_receipt: str = None, error: str = None):
+        """
+        Initializes a new instance of the OutboxEntry class
+        :param entry_id: the id of the entry in the outbox
+        :type entry_id: int
+        :param state: the state of the message
+        :type state: OutboxState
+        :param attempts: the number of send attempts made
+        :type attempts: int
+        :param result: the SendResult of the last attempt, if any
+        :type result: SendResult
+        :param transaction_receipt: the transaction receipt of the last response, if any
+        :type transaction_receipt: str
+        :param error: the error of the last attempt, if it raised one
+        :type error: str
+        """
+        self._entry_id = entry_id
+        self._state = state
+        self._attempts = attempts
+        self._result = result
+        self._transaction_receipt = transaction_receipt
+        self._error = error
+
+    @property
+    def entry_id(self):
+        """
+        Get the id of the entry in the outbox
+        :return the id
+        :rtype int
+        """
+        return self._entry_id
+
+    @property
+    def state(self):
+        """
+        Get the state of the message
+        :return the state
+        :rtype OutboxState
+        """
+        return self._state
+
+    @property
+    def attempts(self):
+        """
+        Get the number of send attempts made
+        :return the number of attempts
+        :rtype int
+        """
+        return self._attempts
+
+    @property
+    def result(self):
+        """
+        Get the SendResult of the last attempt
+        :return the result, or None before the first attempt
+        :rtype SendResult
+        """
+        return self._result
+
+    @property
+    def transaction_receipt(self):
+        """
+        Get the transaction receipt of the last response from the Injection API
+        :return the transaction receipt, or None
+        :rtype str
+        """
+        return self._transaction_receipt
+
+    @property
+    def error(self):
+        """
+        Get the error of the last attempt, when sending raised one
+        :return the error, or None
+        :rtype str
+        """
+        return self._error
+
+    def __str__(self):
+        """
+        String representation of the OutboxEntry class
+        :return the string
+        :rtype str
+        """
+        return "{0}: {1} after {2} attempts".format(self._entry_id, self._state.name, self._attempts)
@@ -0,0 +1,33 @@
+from enum import Enum
+
+
+class OutboxState(Enum):
+    """
+    Enumerated state of a message in an Outbox
+    """
+
+    """ The message is waiting to be sent """
+    Pending = 0
+
+    """ The message is being sent by a worker """
+    Sending = 1
+
+    """ The message was accepted by the Injection API """
+    Sent = 2
+
+    """ The message was rejected, or could not be sent within the maximum number of attempts """
+    Failed = 3
+
+    def __str__(self):
+        """
+        String representation of the OutboxState Enum
+        :return the string
+        :rtype str
+        """
+        switcher = {
+            0: "The message is waiting to be sent",
+            1: "The message is being sent by a worker",
+            2: "The message was accepted by the Injection API",
+            3: "The message was rejected, or could not be sent within the maximum number of attempts"
+        }
+        return switcher.get(self.value, "The message is waiting to be sent")
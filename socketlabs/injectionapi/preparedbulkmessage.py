@@ -0,0 +1,104 @@
+import copy
+
+from .core.injectionrequestserializer import JsonSegmentWriter, write_bulk_message_head, write_bulk_message_tail
+from .core.sendvalidator import validate_base_message
+from .message.bulkmessage import BulkMessage
+from .message.bulkrecipient import BulkRecipient
+from .message.recipienttable import RecipientTable
+
+
+class PreparedBulkMessage(object):
+    """
+    A BulkMessage whose content, which is the same for every recipient, has been validated
+    and serialized once. Sending it only serializes the per message merge data of the
+    recipients, so one template can be sent to many batches of recipients cheaply.
+    Changes made to the BulkMessage after it is prepared are not sent; prepare it again.
+
+    :Example:
+
+         prepared = PreparedBulkMessage(message)
+         for batch in batches:
+             response = client.send(prepared.for_recipients(batch))
+
+    """
+
+    def __init__(self, message: BulkMessage):
+        """
+        Initializes a new instance of the PreparedBulkMessage class
+        :param message: the bulk message to prepare, with its recipients
+        :type message: BulkMessage
+        """
+        if not isinstance(message, BulkMessage):
+            raise Exception('Message type was not BulkMessage. No message can be prepared')
+
+        self._message = message
+        self._to_recipients = message.to_recipient
+        self._validation_result = validate_base_message(message)
+
+        writer = JsonSegmentWriter()
+        write_bulk_message_head(writer, message)
+        self._head = writer.segments()
+
+        writer = JsonSegmentWriter()
+        write_bulk_message_tail(writer, message)
+        self._tail = writer.segments()
+
+    @property
+    def message(self):
+        """
+        Get the BulkMessage the template was prepared from
+        :return the bulk message
+        :rtype BulkMessage
+        """
+        return self._message
+
+    @property
+    def to_recipient(self):
+        """
+        Get the list of BulkRecipient the message is sent to
+        :return the recipients
+        :rtype list
+        """
+        return self._to_recipients
+
+    @property
+    def validation_result(self):
+        """
+        Get the result of validating the content of the message, recipients excluded
+        :return the result
+        :rtype SendResult
+        """
+        return self._validation_result
+
+    @property
+    def head(self):
+        """
+        Get the serialized part of the message object that precedes the per message merge data
+        :return the list of segments
+        :rtype list
+        """
+        return self._head
+
+    @property
+    def tail(self):
+        """
+        Get the serialized part of the message object that follows the per message merge data
+        :return the list of segments
+        :rtype list
+        """
+        return self._tail
+
+    def for_recipients(self, recipients: list):
+        """
+        Get the prepared message addressed to other recipients. The serialized content is shared, not copied.
+        :param recipients: the recipients, as BulkRecipient objects or email addresses, or a RecipientTable
+        :type recipients: list, RecipientTable
+        :return the prepared message for the recipients
+        :rtype PreparedBulkMessage
+        """
+        prepared = copy.copy(self)
+        if isinstance(recipients, RecipientTable):
+            prepared._to_recipients = recipients
+            return prepared
+        prepared._to_recipients = [r if isinstance(r, BulkRecipient) else BulkRecipient(r) for r in recipients]
+        return prepared
@@ -0,0 +1,108 @@
+import threading
+import time
+
+from .core.tokenbucket import TokenBucket
+
+
+class RateLimiter(object):
+    """
+    Client-side token-bucket limiter for the rate of messages and recipients sent to the
+    Injection API. The limiter is thread-safe, and one instance can be shared by several
+    clients to apply a single process-wide rate.
+
+    :Example:
+
+         limiter = RateLimiter(messages_per_second=50, recipients_per_second=500, message_burst=100)
+         client1.rate_limiter = limiter
+         client2.rate_limiter = limiter
+
+    """
+
+    def __init__(self, messages_per_second: float = None, recipients_per_second: float = None,
+                 message_burst: float = None, recipient_burst: float = None):
+        """
+        Initializes a new instance of the RateLimiter class
+        :param messages_per_second: the sustained number of messages per second, or None for no limit
+        :type messages_per_second: float
+        :param recipients_per_second: the sustained number of recipients per second, or None for no limit
+        :type recipients_per_second: float
+        :param message_burst: the number of messages that may be sent at once; defaults to one second's worth
+        :type message_burst: float
+        :param recipient_burst: the number of recipients that may be sent at once; defaults to one second's worth
+        :type recipient_burst: float
+        """
+        self._message_bucket = self.__create_bucket("messages_per_second", messages_per_second, message_burst)
+        self._recipient_bucket = self.__create_bucket("recipients_per_second", recipients_per_second,
+                                                      recipient_burst)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def __create_bucket(name: str, rate: float, burst: float):
+        """
+        Create the token bucket for a rate, or None when the rate is not limited
+        :return the token bucket
+        :rtype TokenBucket
+        """
+        if rate is None:
+            return None
+        if rate <= 0:
+            raise AttributeError("{0} must be greater than 0".format(name))
+        if burst is None:
+            burst = max(rate, 1)
+        if burst < 1:
+            raise AttributeError("the burst for {0} must be at least 1".format(name))
+        return TokenBucket(rate, burst)
+
+    @property
+    def messages_per_second(self):
+        """
+        Get the sustained number of messages per second
+        :return the rate, or None when not limited
+        :rtype float
+        """
+        return self._message_bucket.rate if self._message_bucket is not None else None
+
+    @property
+    def recipients_per_second(self):
+        """
+        Get the sustained number of recipients per second
+        :return the rate, or None when not limited
+        :rtype float
+        """
+        return self._recipient_bucket.rate if self._recipient_bucket is not None else None
+
+    def reserve(self, messages: int = 1, recipients: int = 0):
+        """
+        Reserve capacity for a send without waiting. The caller must wait the returned
+        number of seconds before sending; sleeping in a thread and awaiting in a
+        coroutine are both fine.
+        :param messages: the number of messages in the send
+        :type messages: int
+        :param recipients: the number of recipients in the send
+        :type recipients: int
+        :return the number of seconds to wait before sending
+        :rtype float
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = 0.0
+            if self._message_bucket is not None and messages > 0:
+                wait = self._message_bucket.reserve(messages, now)
+            if self._recipient_bucket is not None and recipients > 0:
+                wait = max(wait, self._recipient_bucket.reserve(recipients, now))
+            return wait
+
+    def acquire(self, messages: int = 1, recipients: int = 0):
+        """
+        Wait, blocking the calling thread, until a send may go ahead
+        :param messages: the number of messages in the send
+        :type messages: int
+        :param recipients: the number of recipients in the send
+        :type recipients: int
+        :return the number of seconds waited
+        :rtype float
+        """
+        wait = self.reserve(messages, recipients)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
@@ -7,8 +7,9 @@ class RetrySettings(object):
     __maximum_allowed_number_of_retries = 5
     __minimum_retry_time = timedelta(seconds=1)
     __maximum_retry_time = timedelta(seconds=10)
+    __default_maximum_retry_after = timedelta(seconds=60)
 
-    def __init__(self, maximum_retries=None):
+    def __init__(self, maximum_retries=None, deadline: timedelta = None, maximum_retry_after: timedelta = None):
 
         if maximum_retries:
 
@@ -24,10 +25,59 @@ class RetrySettings(object):
         else:
             self.__maximum_number_of_retries = self.__default_number_of_retries
 
+        if deadline is not None and deadline.total_seconds() < 0:
+            raise AttributeError("deadline must not be negative")
+        self.__deadline = deadline
+
+        if maximum_retry_after is None:
+            maximum_retry_after = self.__default_maximum_retry_after
+        self.__maximum_retry_after = maximum_retry_after
+
     @property
     def maximum_number_of_retries(self):
         return self.__maximum_number_of_retries
 
+    @property
+    def deadline(self):
+        """
+        Get the longest time a send may take, including the waits between attempts.
+        A retry that would finish waiting after the deadline is not made.
+        :return the deadline, or None for no deadline
+        :rtype timedelta
+        """
+        return self.__deadline
+
+    @property
+    def maximum_retry_after(self):
+        """
+        Get the longest Retry-After delay from the server that will be waited for.
+        A response asking for a longer delay is not retried.
+        :return the maximum delay
+        :rtype timedelta
+        """
+        return self.__maximum_retry_after
+
+    def can_retry(self, number_of_attempts, wait, elapsed):
+        """
+        Check whether another attempt may be made: retries remain, the wait is not longer
+        than the maximum Retry-After delay, and the attempt starts before the deadline.
+        :param number_of_attempts: the number of retries made so far
+        :type number_of_attempts: int
+        :param wait: the wait in seconds before the attempt
+        :type wait: float
+        :param elapsed: the time in seconds since the send started
+        :type elapsed: float
+        :return the result
+        :rtype bool
+        """
+        if number_of_attempts >= self.__maximum_number_of_retries:
+            return False
+        if wait > self.__maximum_retry_after.total_seconds():
+            return False
+        if self.__deadline is not None and elapsed + wait > self.__deadline.total_seconds():
+            return False
+        return True
+
     def get_next_wait_interval(self, number_of_attempts):
 
         interval = int(min(
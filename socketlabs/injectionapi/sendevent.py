@@ -0,0 +1,266 @@
+import time
+
+from .sendphase import SendPhase
+from .sendresult import SendResult
+
+
+class SendEvent(object):
+    """
+    The instrumentation of one request sent to the Injection API, given to each SendObserver of the client.
+    The time spent in each SendPhase is added up over all attempts of the send; the intervals
+    keep each stretch of time spent in a phase, and each attempt, in the order they ended.
+    """
+
+    __slots__ = ("_message", "_message_count", "_recipient_count", "_started_at", "_started", "_duration",
+                 "_timings", "_intervals", "_attempt_started", "_attempt_intervals", "_request_bytes",
+                 "_response_bytes", "_attempts", "_status_code", "_result", "_response", "_exception")
+
+    def __init__(self, message=None, message_count: int = 1, recipient_count: int = 0):
+        """
+        Initializes a new instance of the SendEvent class
+        :param message: the message sent, if it is known
+        :type message: object
+        :param message_count: the number of messages in the request
+        :type message_count: int
+        :param recipient_count: the number of recipients in the request
+        :type recipient_count: int
+        """
+        self._message = message
+        self._message_count = message_count
+        self._recipient_count = recipient_count
+        self._started_at = time.time()
+        self._started = time.perf_counter()
+        self._duration = None
+        self._timings = {}
+        self._intervals = []
+        self._attempt_started = None
+        self._attempt_intervals = []
+        self._request_bytes = 0
+        self._response_bytes = 0
+        self._attempts = 0
+        self._status_code = None
+        self._result = None
+        self._response = None
+        self._exception = None
+
+    @property
+    def message(self):
+        """
+        Get the message sent: a BasicMessage, BulkMessage or PreparedBulkMessage, the list of
+        BasicMessage of a batch, or None when a serialized message was sent
+        :return the message
+        :rtype object
+        """
+        return self._message
+
+    @property
+    def message_count(self):
+        """
+        Get the number of messages in the request
+        :return the message count
+        :rtype int
+        """
+        return self._message_count
+
+    @property
+    def recipient_count(self):
+        """
+        Get the number of recipients in the request
+        :return the recipient count
+        :rtype int
+        """
+        return self._recipient_count
+
+    @property
+    def started_at(self):
+        """
+        Get the time the send started, in seconds since the epoch
+        :return the start time
+        :rtype float
+        """
+        return self._started_at
+
+    @property
+    def duration(self):
+        """
+        Get the seconds from the start to the completion of the send
+        :return the duration, or None while the send is in progress
+        :rtype float
+        """
+        return self._duration
+
+    @property
+    def timings(self):
+        """
+        Get the seconds spent in each phase of the send. Phases the send did not go through are left out.
+        :return the dictionary of SendPhase to seconds
+        :rtype dict
+        """
+        return self._timings
+
+    def get_timing(self, phase: SendPhase):
+        """
+        Get the seconds spent in a phase of the send
+        :param phase: the phase
+        :type phase: SendPhase
+        :return the seconds, 0 when the send did not go through the phase
+        :rtype float
+        """
+        return self._timings.get(phase, 0.0)
+
+    def add_timing(self, phase: SendPhase, seconds: float, ended: float = None):
+        """
+        Add time spent in a phase of the send
+        :param phase: the phase
+        :type phase: SendPhase
+        :param seconds: the seconds spent
+        :type seconds: float
+        :param ended: the time.perf_counter() value the phase ended at, now if None
+        :type ended: float
+        """
+        self._timings[phase] = self._timings.get(phase, 0.0) + seconds
+        end = (time.perf_counter() if ended is None else ended) - self._started
+        self._intervals.append((phase, end - seconds, end))
+
+    @property
+    def intervals(self):
+        """
+        Get each stretch of time spent in a phase, as seconds from the start of the send
+        :return the list of (SendPhase, start, end) tuples
+        :rtype list
+        """
+        return self._intervals
+
+    @property
+    def attempt_intervals(self):
+        """
+        Get the time of each attempt, as seconds from the start of the send, with the HTTP status
+        code the attempt received, or None when it failed without a response
+        :return the list of (start, end, status code) tuples
+        :rtype list
+        """
+        return self._attempt_intervals
+
+    def start_attempt(self):
+        """
+        Record that the request is being sent, once per attempt
+        """
+        self._attempts += 1
+        self._attempt_started = time.perf_counter() - self._started
+
+    def end_attempt(self, status_code: int = None):
+        """
+        Record the end of the attempt in progress
+        :param status_code: the HTTP status code received, None when the attempt failed without a response
+        :type status_code: int
+        """
+        if self._attempt_started is not None:
+            self._attempt_intervals.append((self._attempt_started, time.perf_counter() - self._started, status_code))
+            self._attempt_started = None
+
+    @property
+    def request_bytes(self):
+        """
+        Get the size of the request body, as sent after compression
+        :return the size in bytes
+        :rtype int
+        """
+        return self._request_bytes
+
+    @request_bytes.setter
+    def request_bytes(self, val: int):
+        """
+        Set the size of the request body, as sent after compression
+        :param val: the size in bytes
+        :type val: int
+        """
+        self._request_bytes = val
+
+    @property
+    def response_bytes(self):
+        """
+        Get the size of the body of the final response
+        :return the size in bytes
+        :rtype int
+        """
+        return self._response_bytes
+
+    @response_bytes.setter
+    def response_bytes(self, val: int):
+        """
+        Set the size of the body of the final response
+        :param val: the size in bytes
+        :type val: int
+        """
+        self._response_bytes = val
+
+    @property
+    def attempts(self):
+        """
+        Get the number of times the request was sent, retries included
+        :return the attempt count
+        :rtype int
+        """
+        return self._attempts
+
+    @property
+    def status_code(self):
+        """
+        Get the HTTP status code of the final response
+        :return the status code, or None when no response was received
+        :rtype int
+        """
+        return self._status_code
+
+    @status_code.setter
+    def status_code(self, val: int):
+        """
+        Set the HTTP status code of the final response
+        :param val: the status code
+        :type val: int
+        """
+        self._status_code = val
+
+    @property
+    def result(self):
+        """
+        Get the result of the send. For a batch of messages, the first result that is not Success.
+        :return the result, or None when the send raised an exception
+        :rtype SendResult
+        """
+        return self._result
+
+    @property
+    def response(self):
+        """
+        Get the response of the send: a SendResponse, or the list of SendResponse of a batch
+        :return the response, or None when the send raised an exception
+        :rtype SendResponse, list
+        """
+        return self._response
+
+    @property
+    def exception(self):
+        """
+        Get the exception the send raised
+        :return the exception, or None
+        :rtype Exception
+        """
+        return self._exception
+
+    def complete(self, response=None, exception: Exception = None):
+        """
+        Record the outcome and the duration of the send
+        :param response: the SendResponse, or the list of SendResponse of a batch
+        :type response: SendResponse, list
+        :param exception: the exception the send raised, if any
+        :type exception: Exception
+        """
+        self._duration = time.perf_counter() - self._started
+        self._response = response
+        self._exception = exception
+        if isinstance(response, list):
+            failed = [r.result for r in response if r.result != SendResult.Success]
+            self._result = failed[0] if failed else SendResult.Success
+        elif response is not None:
+            self._result = response.result
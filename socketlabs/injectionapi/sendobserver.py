@@ -0,0 +1,63 @@
+class SendObserver(object):
+    """
+    Receives a SendEvent for every request a client sends to the Injection API, with the time
+    spent in each SendPhase, the bytes sent and received, the number of attempts and the result.
+    Subclass it and override the hooks of interest; the default hooks do nothing.
+    The hooks are called on the thread, or event loop, making the send, so they should return quickly.
+    An exception raised by a hook is ignored and does not affect the send.
+
+    :Example:
+
+         class LatencyObserver(SendObserver):
+             def on_send_complete(self, event):
+                 print(event.result, event.duration, event.get_timing(SendPhase.Wait))
+
+         client.add_observer(LatencyObserver())
+
+    """
+
+    def on_send_start(self, event):
+        """
+        Called when a send starts, before the request is made
+        :param event: the event of the send; its timings are filled in as the send progresses
+        :type event: SendEvent
+        """
+        pass
+
+    def on_send_complete(self, event):
+        """
+        Called when a send has completed, failed validation or raised an exception
+        :param event: the event of the send
+        :type event: SendEvent
+        """
+        pass
+
+
+def notify_send_start(observers: list, event):
+    """
+    Call on_send_start on each observer, ignoring exceptions they raise
+    :param observers: the observers
+    :type observers: list
+    :param event: the event of the send
+    :type event: SendEvent
+    """
+    for observer in observers:
+        try:
+            observer.on_send_start(event)
+        except Exception:
+            pass
+
+
+def notify_send_complete(observers: list, event):
+    """
+    Call on_send_complete on each observer, ignoring exceptions they raise
+    :param observers: the observers
+    :type observers: list
+    :param event: the event of the send
+    :type event: SendEvent
+    """
+    for observer in observers:
+        try:
+            observer.on_send_complete(event)
+        except Exception:
+            pass
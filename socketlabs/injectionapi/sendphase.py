@@ -0,0 +1,58 @@
+from enum import Enum
+
+
+class SendPhase(Enum):
+    """
+    Enumerated phase of a send, timed in the SendEvent given to a SendObserver
+    """
+
+    """ Validating the message and the credentials """
+    Validate = 0
+
+    """ Serializing the message into the request body """
+    Serialize = 1
+
+    """ Compressing the request body """
+    Compress = 2
+
+    """ Waiting for the rate limiter to let the send go ahead """
+    Throttle = 3
+
+    """ Taking a keep-alive connection from the pool, or opening one, including the proxy tunnel and TLS handshake """
+    Connect = 4
+
+    """ Writing the request headers and body """
+    Write = 5
+
+    """ Waiting for the server to send the response status and headers """
+    Wait = 6
+
+    """ Reading the response body """
+    Read = 7
+
+    """ Parsing the response into the SendResponse """
+    Parse = 8
+
+    """ Waiting between attempts before a retry """
+    Backoff = 9
+
+    def __str__(self):
+        """
+        String representation of the SendPhase Enum
+        :return the string
+        :rtype str
+        """
+        switcher = {
+            0: "Validating the message and the credentials",
+            1: "Serializing the message into the request body",
+            2: "Compressing the request body",
+            3: "Waiting for the rate limiter to let the send go ahead",
+            4: "Taking a keep-alive connection from the pool, or opening one, "
+               "including the proxy tunnel and TLS handshake",
+            5: "Writing the request headers and body",
+            6: "Waiting for the server to send the response status and headers",
+            7: "Reading the response body",
+            8: "Parsing the response into the SendResponse",
+            9: "Waiting between attempts before a retry"
+        }
+        return switcher.get(self.value, "Validating the message and the credentials")
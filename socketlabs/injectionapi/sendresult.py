@@ -123,6 +123,9 @@ class SendResult(Enum):
     """ Metadata and tags exceed 12.5KB """
     MetadataOrTagsAreTooLarge = 38
 
+    """ The circuit breaker is open, the message was not sent """
+    CircuitOpen = 39
+
     def __str__(self):
         """
         String representation of the SendResult Enum
@@ -175,7 +178,8 @@ class SendResult(Enum):
                 "Invalid Custom Headers were found in the message",
             37: "SDK Validation Error : "
                 "Message contains invalid metadata",
-            38: "Metadata and tags exceed 12.5KB"
+            38: "Metadata and tags exceed 12.5KB",
+            39: "The circuit breaker is open, the message was not sent"
         }
         return switcher.get(self.value, "An error has occurred that was unforeseen")
 
@@ -2,20 +2,45 @@
 SocketLabsClient is a wrapper for the SocketLabs Injection API that makes 
 it easy to send messages and parse responses.
 """
+import logging
+import socket
+import threading
+import time
+from concurrent.futures import Future, wait as wait_for_futures
+from datetime import timedelta
+from http.client import HTTPException
+
+from .core.connectionpool import ConnectionPool
 from .core.httpendpoint import HttpEndpoint
 from .core.httprequest import HttpRequest
-from .core.injectionrequestfactory import InjectionRequestFactory
+from .core.injectionrequestserializer import InjectionRequestSerializer
+from .core.requestbody import RequestBody
 from .core.injectionresponseparser import InjectionResponseParser
-from .core.sendvalidator import SendValidator
+from .core.sendvalidator import SendValidator, maximumRecipientsPerMessage, validate_recipient_list, \
+    get_full_recipient_count
 from .core.retryhandler import RetryHandler
+from .core.sendexecutor import SendExecutor, SendQueueFullException
 from .retrysettings import RetrySettings
 from .message.basicmessage import BasicMessage
 from .message.bulkmessage import BulkMessage
+from .metrics.metricsobserver import MetricsObserver
+from .metrics.metricsregistry import MetricsRegistry
+from .bulkcampaignresponse import BulkCampaignResponse
+from .compressionsettings import CompressionSettings
+from .preparedbulkmessage import PreparedBulkMessage
+from .circuitbreaker import CircuitBreaker, CircuitOpenException
 from .proxy import Proxy
+from .ratelimiter import RateLimiter
+from .sendevent import SendEvent
+from .sendobserver import SendObserver, notify_send_start, notify_send_complete
+from .sendphase import SendPhase
+from .sendresponse import SendResponse
 from .sendresult import SendResult
 from .core.apikeyparser import ApiKeyParser
 from .core.apikeyparseresult import ApiKeyParseResult
 
+logger = logging.getLogger(__name__)
+
 
 class SocketLabsClient(object):
     """
@@ -23,6 +48,13 @@ class SocketLabsClient(object):
     it easy to send messages and parse responses.
     """
 
+    RequestErrors = (
+        OSError,
+        HTTPException,
+        ValueError
+    )
+    """ Errors of a request or its response, reported as UnknownError by send_bulk_campaign and send_many """
+
     def __init__(self, server_id: int, api_key: str, proxy: Proxy = None):
         """
         Creates a new instance of the SocketLabsClient.
@@ -37,8 +69,33 @@ class SocketLabsClient(object):
         self._api_key = api_key
         self._http_proxy = proxy
         self._request_timeout = 120
+        self._connect_timeout = None
+        self._read_timeout = None
         self._number_of_retries = 0
+        self._send_deadline = None
         self._http_endpoint = "https://inject.socketlabs.com/api/v1/email"
+        self._connection_pool = ConnectionPool()
+        self._send_executor = SendExecutor()
+        self._compression = None
+        self._rate_limiter = None
+        self._circuit_breaker = None
+        self._observers = []
+        self._metrics = None
+        self._metrics_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Wait for queued asynchronous sends, including their retries, to finish, then close
+        the keep-alive connections held by the client's connection pool.
+        """
+        self._send_executor.shutdown(wait=True)
+        self._connection_pool.close()
 
     @property
     def endpoint(self):
@@ -85,6 +142,196 @@ class SocketLabsClient(object):
         """
         self._request_timeout = timeout
 
+    @property
+    def connect_timeout(self):
+        """
+        The timeout in seconds for opening a connection to the Injection API, including the
+        proxy tunnel and the TLS handshake. Falls back to the request_timeout when not set.
+        :return the connect timeout, or None to use the request_timeout
+        :rtype float
+        """
+        return self._connect_timeout
+
+    @connect_timeout.setter
+    def connect_timeout(self, timeout: float):
+        """
+        Set the timeout in seconds for opening a connection to the Injection API
+        :param timeout: the connect timeout, or None to use the request_timeout
+        :type timeout: float
+        """
+        self._connect_timeout = timeout
+
+    @property
+    def read_timeout(self):
+        """
+        The timeout in seconds for sending the request and waiting on the response once
+        connected. Falls back to the request_timeout when not set.
+        :return the read timeout, or None to use the request_timeout
+        :rtype float
+        """
+        return self._read_timeout
+
+    @read_timeout.setter
+    def read_timeout(self, timeout: float):
+        """
+        Set the timeout in seconds for sending the request and waiting on the response
+        :param timeout: the read timeout, or None to use the request_timeout
+        :type timeout: float
+        """
+        self._read_timeout = timeout
+
+    @property
+    def connection_pool(self):
+        """
+        The pool of keep-alive connections used for requests to the Injection API
+        :return the connection pool
+        :rtype ConnectionPool
+        """
+        return self._connection_pool
+
+    @connection_pool.setter
+    def connection_pool(self, pool: ConnectionPool):
+        """
+        Set the pool of keep-alive connections used for requests to the Injection API.
+        The previous pool is closed.
+        :param pool: the connection pool
+        :type pool: ConnectionPool
+        """
+        previous = self._connection_pool
+        self._connection_pool = pool
+        if previous is not None and previous is not pool:
+            previous.close()
+
+    @property
+    def send_executor(self):
+        """
+        The bounded worker pool that performs send_async requests
+        :return the send executor
+        :rtype SendExecutor
+        """
+        return self._send_executor
+
+    @send_executor.setter
+    def send_executor(self, executor: SendExecutor):
+        """
+        Set the bounded worker pool that performs send_async requests.
+        The previous executor is shut down once its queued sends, including their retries, complete.
+        :param executor: the send executor
+        :type executor: SendExecutor
+        """
+        previous = self._send_executor
+        self._send_executor = executor
+        if previous is not None and previous is not executor:
+            previous.shutdown(wait=False)
+
+    @property
+    def compression(self):
+        """
+        The settings for compressing request bodies, or None to send them uncompressed
+        :return the compression settings
+        :rtype CompressionSettings
+        """
+        return self._compression
+
+    @compression.setter
+    def compression(self, settings: CompressionSettings):
+        """
+        Set the settings for compressing request bodies, or None to send them uncompressed
+        :param settings: the compression settings
+        :type settings: CompressionSettings
+        """
+        self._compression = settings
+
+    @property
+    def rate_limiter(self):
+        """
+        The limiter applied to the rate of messages and recipients sent, or None for no limit
+        :return the rate limiter
+        :rtype RateLimiter
+        """
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, limiter: RateLimiter):
+        """
+        Set the limiter applied to the rate of messages and recipients sent, or None for no limit.
+        The same limiter can be set on several clients to share one rate between them.
+        :param limiter: the rate limiter
+        :type limiter: RateLimiter
+        """
+        self._rate_limiter = limiter
+
+    @property
+    def circuit_breaker(self):
+        """
+        The circuit breaker guarding the Injection API endpoint, or None to always send
+        :return the circuit breaker
+        :rtype CircuitBreaker
+        """
+        return self._circuit_breaker
+
+    @circuit_breaker.setter
+    def circuit_breaker(self, breaker: CircuitBreaker):
+        """
+        Set the circuit breaker guarding the Injection API endpoint, or None to always send.
+        While the breaker is open, sends return SendResult.CircuitOpen without being attempted.
+        :param breaker: the circuit breaker
+        :type breaker: CircuitBreaker
+        """
+        self._circuit_breaker = breaker
+
+    @property
+    def observers(self):
+        """
+        Get the SendObserver objects that receive a SendEvent for every request the client sends
+        :return the list of observers
+        :rtype list
+        """
+        return list(self._observers)
+
+    def add_observer(self, observer: SendObserver):
+        """
+        Add a SendObserver, which receives a SendEvent for every request the client sends.
+        :param observer: the observer
+        :type observer: SendObserver
+        """
+        # replaced rather than appended to, so sends in progress keep iterating the list they started with
+        self._observers = self._observers + [observer]
+
+    def remove_observer(self, observer: SendObserver):
+        """
+        Remove a SendObserver
+        :param observer: the observer
+        :type observer: SendObserver
+        """
+        self._observers = [o for o in self._observers if o is not observer]
+
+    @property
+    def metrics(self):
+        """
+        Get the metrics of the client: its sends by SendResult, retries, bytes and latency, the sends
+        in flight and queued, and the usage of its connection pool. They are kept from the first
+        time this is read; to_text() of the registry exports them in the Prometheus text format.
+        :return the metrics registry
+        :rtype MetricsRegistry
+        """
+        if self._metrics is None:
+            with self._metrics_lock:
+                if self._metrics is None:
+                    registry = MetricsRegistry()
+                    self.add_observer(MetricsObserver(registry))
+                    registry.gauge("socketlabs_send_queue_pending", "Asynchronous sends queued, in flight or "
+                                   "waiting to be retried", function=lambda: self._send_executor.pending_count)
+                    registry.gauge("socketlabs_connection_pool_in_use", "Connections checked out of the pool",
+                                   function=lambda: self._connection_pool.in_use_count)
+                    registry.gauge("socketlabs_connection_pool_idle", "Idle keep-alive connections in the pool",
+                                   function=lambda: self._connection_pool.idle_count)
+                    registry.gauge("socketlabs_connection_pool_max_size",
+                                   "Connections the pool opens at most, in use or idle",
+                                   function=lambda: self._connection_pool.max_size)
+                    self._metrics = registry
+        return self._metrics
+
     @property
     def number_of_retries(self):
         return self._number_of_retries
@@ -93,6 +340,35 @@ class SocketLabsClient(object):
     def number_of_retries(self, retries: int):
         self._number_of_retries = retries
 
+    @property
+    def send_deadline(self):
+        """
+        The longest time in seconds a send may take across all its attempts, including the
+        waits between them. A retry that could not start before the deadline is not made,
+        and the connect and read timeouts of each attempt are cut to the time remaining.
+        :return the deadline in seconds, or None for no deadline
+        :rtype float
+        """
+        return self._send_deadline
+
+    @send_deadline.setter
+    def send_deadline(self, seconds: float):
+        """
+        Set the longest time in seconds a send may take across all its attempts, or None for no deadline
+        :param seconds: the deadline in seconds
+        :type seconds: float
+        """
+        self._send_deadline = seconds
+
+    def __build_retry_settings(self):
+        """
+        Build the RetrySettings for a send
+        :return the retry settings
+        :rtype RetrySettings
+        """
+        deadline = timedelta(seconds=self._send_deadline) if self._send_deadline is not None else None
+        return RetrySettings(self.number_of_retries, deadline)
+
     def __build_http_request(self, authentication: str):
         """
         Build the HttpRequest. Will add the proxy, if set
@@ -102,15 +378,221 @@ class SocketLabsClient(object):
         :rtype HttpRequest
         """
         endpoint = HttpEndpoint(self.endpoint)
-        req = HttpRequest(HttpRequest.HttpRequestMethod.POST, endpoint, self.request_timeout, authentication)
+        req = HttpRequest(HttpRequest.HttpRequestMethod.POST, endpoint, self.request_timeout, authentication,
+                          self._connection_pool, self._send_executor, self._circuit_breaker)
+        req.connect_timeout = self._connect_timeout
+        req.read_timeout = self._read_timeout
         if self._http_proxy is not None:
             req.proxy = self._http_proxy
         return req
 
+    def __build_serializer_and_http_request(self):
+        """
+        Build the InjectionRequestSerializer and HttpRequest for a send. When the API key is
+        in the bearer token format it is sent in the Authorization header, otherwise in the body.
+        :return the request serializer and the HttpRequest
+        :rtype tuple
+        """
+        api_key_parser = ApiKeyParser()
+        parse_result = api_key_parser.parse(self._api_key)
+
+        if parse_result == ApiKeyParseResult.Success:
+            return InjectionRequestSerializer(self._server_id, ""), self.__build_http_request(self._api_key)
+
+        return InjectionRequestSerializer(self._server_id, self._api_key), self.__build_http_request("")
+
+    def __compress(self, body: RequestBody):
+        """
+        Compress a request body when compression is enabled and the body is over the threshold.
+        The body is compressed once, before the first attempt, and retries reuse it.
+        :param body: the serialized injection request
+        :type body: RequestBody
+        :return the body to send
+        :rtype RequestBody
+        """
+        compression = self._compression
+        if compression is None or not compression.should_compress(body):
+            return body
+        return compression.compress(body)
+
+    def __throttle(self, messages: int, recipients: int, event: SendEvent = None):
+        """
+        Wait until the rate limiter, if set, lets a send go ahead
+        :param messages: the number of messages in the send
+        :type messages: int
+        :param recipients: the number of recipients in the send
+        :type recipients: int
+        :param event: the event the wait is added to, if any
+        :type event: SendEvent
+        """
+        if self._rate_limiter is not None:
+            started = time.perf_counter()
+            self._rate_limiter.acquire(messages, recipients)
+            self.__record(event, SendPhase.Throttle, started)
+
+    def __start_event(self, message, recipient_count: int = None, message_count: int = 1):
+        """
+        Create the SendEvent of a send and pass it to the observers' on_send_start, when there are observers
+        :param message: the message sent, if it is known
+        :type message: object
+        :param recipient_count: the number of recipients, counted from the message when None
+        :type recipient_count: int
+        :param message_count: the number of messages in the request
+        :type message_count: int
+        :return the event, or None when there are no observers
+        :rtype SendEvent
+        """
+        observers = self._observers
+        if not observers:
+            return None
+        if recipient_count is None:
+            recipient_count = self.__count_recipients(message)
+        event = SendEvent(message, message_count, recipient_count)
+        notify_send_start(observers, event)
+        return event
+
+    def __complete_event(self, event: SendEvent, response=None, exception: Exception = None):
+        """
+        Record the outcome of a send and pass its event to the observers' on_send_complete
+        :param event: the event of the send, if any
+        :type event: SendEvent
+        :param response: the SendResponse, or the list of SendResponse of a batch
+        :type response: SendResponse, list
+        :param exception: the exception the send raised, if any
+        :type exception: Exception
+        :return the response
+        :rtype SendResponse, list
+        """
+        if event is not None:
+            event.complete(response, exception)
+            notify_send_complete(self._observers, event)
+        return response
+
+    @staticmethod
+    def __record(event: SendEvent, phase: SendPhase, started: float):
+        """
+        Add the time since started to a phase of the event, if any
+        :param event: the event of the send
+        :type event: SendEvent
+        :param phase: the phase
+        :type phase: SendPhase
+        :param started: the time.perf_counter() value the phase started at
+        :type started: float
+        """
+        if event is not None:
+            event.add_timing(phase, time.perf_counter() - started)
+
+    @staticmethod
+    def __count_recipients(message):
+        """
+        Count the recipients of a BasicMessage or BulkMessage
+        :param message: the message
+        :type message: object
+        :return the number of recipients
+        :rtype int
+        """
+        if isinstance(message, (BulkMessage, PreparedBulkMessage)):
+            return len(message.to_recipient) if message.to_recipient is not None else 0
+        if isinstance(message, BasicMessage):
+            return get_full_recipient_count(message)
+        return 0
+
+    def __send_injection_request(self, http_request: HttpRequest, body, event: SendEvent = None):
+        """
+        Send a generated injection request, with retries, and parse the response
+        :param http_request: the HttpRequest to send with
+        :type http_request: HttpRequest
+        :param body: the serialized injection request to send
+        :type body: RequestBody
+        :param event: the event of the send, completed when the response is parsed, if any
+        :type event: SendEvent
+        :return the SendResponse from the request
+        :rtype SendResponse
+        """
+        try:
+            response = self.__exchange(http_request, body, event)
+            if response is None:
+                return self.__complete_event(event, SendResponse(SendResult.CircuitOpen))
+
+            started = time.perf_counter()
+            data = response.read().decode("utf-8")
+            response_code = response.status
+            result = InjectionResponseParser.parse(data, response_code)
+            self.__record(event, SendPhase.Parse, started)
+
+        except Exception as e:
+            self.__complete_event(event, exception=e)
+            raise
+
+        return self.__complete_event(event, result)
+
+    def __exchange(self, http_request: HttpRequest, body, event: SendEvent = None):
+        """
+        Compress the body and send it, with retries
+        :param http_request: the HttpRequest to send with
+        :type http_request: HttpRequest
+        :param body: the serialized injection request to send
+        :type body: RequestBody
+        :param event: the event the timings and sizes are added to, if any
+        :type event: SendEvent
+        :return the response, or None when the circuit breaker is open
+        :rtype HttpResponse
+        """
+        started = time.perf_counter()
+        body = self.__compress(body)
+        self.__record(event, SendPhase.Compress, started)
+        if event is not None:
+            event.request_bytes = len(body)
+
+        retry_handler = RetryHandler(http_request, self.__build_retry_settings())
+        try:
+            response = retry_handler.send(body, event)
+        except CircuitOpenException:
+            return None
+
+        if event is not None:
+            event.status_code = response.status
+            event.response_bytes = len(response.read())
+        return response
+
+    def __send_batched_injection_request(self, http_request: HttpRequest, body, message_count: int,
+                                         event: SendEvent = None):
+        """
+        Send a generated injection request holding several messages, with retries,
+        and parse the response into one SendResponse per message
+        :param http_request: the HttpRequest to send with
+        :type http_request: HttpRequest
+        :param body: the serialized injection request to send
+        :type body: RequestBody
+        :param message_count: the number of messages in the request
+        :type message_count: int
+        :param event: the event of the send, completed when the response is parsed, if any
+        :type event: SendEvent
+        :return the list of SendResponse, in message order
+        :rtype list
+        """
+        try:
+            response = self.__exchange(http_request, body, event)
+            if response is None:
+                circuit_open = [SendResponse(SendResult.CircuitOpen) for _ in range(message_count)]
+                return self.__complete_event(event, circuit_open)
+
+            started = time.perf_counter()
+            data = response.read().decode("utf-8")
+            response_code = response.status
+            results = InjectionResponseParser.parse_many(data, response_code, message_count)
+            self.__record(event, SendPhase.Parse, started)
+
+        except Exception as e:
+            self.__complete_event(event, exception=e)
+            raise
+
+        return self.__complete_event(event, results)
+
     def send(self, message):
         """
-        Sends a BasicMessage message and returns the response from the Injection API.
-        :param message: A BasicMessage object to be sent.
+        Sends a BasicMessage, BulkMessage or PreparedBulkMessage message and returns the response from the Injection API.
+        :param message: A BasicMessage, BulkMessage or PreparedBulkMessage object to be sent.
         :type message: object
         :return the SendResponse from the request
         :rtype SendResponse
@@ -119,8 +601,10 @@ class SocketLabsClient(object):
             return self.__send_basic_message(message)
         elif isinstance(message, BulkMessage):
             return self.__send_bulk_message(message)
+        elif isinstance(message, PreparedBulkMessage):
+            return self.__send_prepared_bulk_message(message)
         else:
-            raise Exception('Message type was not BasicMessage, BulkMessage. Send Failed')
+            raise Exception('Message type was not BasicMessage, BulkMessage, PreparedBulkMessage. Send Failed')
 
     def __send_basic_message(self, message: BasicMessage):
         """
@@ -130,30 +614,20 @@ class SocketLabsClient(object):
         :return the SendResponse from the request
         :rtype SendResponse
         """
+        event = self.__start_event(message)
+        started = time.perf_counter()
         resp = self.__validate_basic_message(message)
+        self.__record(event, SendPhase.Validate, started)
         if not resp.result == SendResult.Success:
-            return resp
-
-        api_key_parser = ApiKeyParser()
-        parse_result = api_key_parser.parse(self._api_key)
-
-        req_factory = InjectionRequestFactory(self._server_id, self._api_key)
-        http_request = self.__build_http_request("")
-
-        if parse_result == ApiKeyParseResult.Success:
-            req_factory = InjectionRequestFactory(self._server_id, "")
-            http_request = self.__build_http_request(self._api_key)
+            return self.__complete_event(event, resp)
 
-        body = req_factory.generate_request(message)
+        started = time.perf_counter()
+        serializer, http_request = self.__build_serializer_and_http_request()
+        body = serializer.serialize(message)
+        self.__record(event, SendPhase.Serialize, started)
 
-        retry_handler = RetryHandler(http_request, RetrySettings(self.number_of_retries))
-        response = retry_handler.send(body)
-
-        data = response.read().decode("utf-8")
-        response_code = response.status
-        result = InjectionResponseParser.parse(data, response_code)
-
-        return result
+        self.__throttle(1, self.__count_recipients(message), event)
+        return self.__send_injection_request(http_request, body, event)
 
     def __send_bulk_message(self, message: BulkMessage):
         """
@@ -163,119 +637,386 @@ class SocketLabsClient(object):
         :return the SendResponse from the request
         :rtype SendResponse
         """
+        event = self.__start_event(message)
+        started = time.perf_counter()
         resp = self.__validate_bulk_message(message)
+        self.__record(event, SendPhase.Validate, started)
         if not resp.result == SendResult.Success:
-            return resp
+            return self.__complete_event(event, resp)
 
-        api_key_parser = ApiKeyParser()
-        parse_result = api_key_parser.parse(self._api_key)
+        started = time.perf_counter()
+        serializer, http_request = self.__build_serializer_and_http_request()
+        body = serializer.serialize(message)
+        self.__record(event, SendPhase.Serialize, started)
 
-        req_factory = InjectionRequestFactory(self._server_id, self._api_key)
-        http_request = self.__build_http_request("")
-
-        if parse_result == ApiKeyParseResult.Success:
-            req_factory = InjectionRequestFactory(self._server_id, "")
-            http_request = self.__build_http_request(self._api_key)
+        self.__throttle(1, self.__count_recipients(message), event)
+        return self.__send_injection_request(http_request, body, event)
 
-        body = req_factory.generate_request(message)
-
-        retry_handler = RetryHandler(http_request, RetrySettings(self.number_of_retries))
-        response = retry_handler.send(body)
+    def __send_prepared_bulk_message(self, message: PreparedBulkMessage):
+        """
+        Sends a PreparedBulkMessage message and returns the response from the Injection API.
+        :param message: A PreparedBulkMessage object to be sent.
+        :type message: PreparedBulkMessage
+        :return the SendResponse from the request
+        :rtype SendResponse
+        """
+        event = self.__start_event(message)
+        started = time.perf_counter()
+        resp = self.__validate_prepared_bulk_message(message)
+        self.__record(event, SendPhase.Validate, started)
+        if not resp.result == SendResult.Success:
+            return self.__complete_event(event, resp)
 
-        data = response.read().decode("utf-8")
-        response_code = response.status
-        result = InjectionResponseParser.parse(data, response_code)
+        started = time.perf_counter()
+        serializer, http_request = self.__build_serializer_and_http_request()
+        body = serializer.serialize_prepared(message)
+        self.__record(event, SendPhase.Serialize, started)
 
-        return result
+        self.__throttle(1, self.__count_recipients(message), event)
+        return self.__send_injection_request(http_request, body, event)
 
-    def send_async(self, message: BasicMessage, on_success, on_error):
+    def serialize_message(self, message):
         """
-        Send an BasicMessage message asynchronously
-        :param message: a BasicMessage object to be sent
-        :type message: BasicMessage
-        :param on_success: success callback method
-        :type on_success: object
-        :param on_error: error callback method
-        :type on_error: object
+        Validate a BasicMessage or BulkMessage message and serialize it, without the server id
+        and API key, so it can be stored and sent later with send_serialized_message.
+        :param message: a BasicMessage or BulkMessage object
+        :type message: object
+        :return the SendResponse of the validation, and the serialized message or None when it is invalid
+        :rtype tuple
         """
         if isinstance(message, BasicMessage):
-            self.__send_basic_message_async(message, on_success, on_error)
+            resp = self.__validate_basic_message(message)
         elif isinstance(message, BulkMessage):
-            self.__send_bulk_message_async(message, on_success, on_error)
+            resp = self.__validate_bulk_message(message)
         else:
             raise Exception('Message type was not BasicMessage, BulkMessage. Send Failed')
+        if not resp.result == SendResult.Success:
+            return resp, None
 
-    def __send_basic_message_async(self, message: BasicMessage, on_success, on_error):
+        serializer, _ = self.__build_serializer_and_http_request()
+        return resp, serializer.serialize_message(message)
+
+    def send_serialized_message(self, message: bytes, recipients: int = 0):
         """
-        Send an BasicMessage message asynchronously
-        :param message: a BasicMessage object to be sent
-        :type message: BasicMessage
-        :param on_success: success callback method
-        :type on_success: object
-        :param on_error: error callback method
-        :type on_error: object
+        Sends a message serialized with serialize_message and returns the response from the Injection API.
+        :param message: the serialized message
+        :type message: bytes
+        :param recipients: the number of recipients of the message, counted by the rate limiter
+        :type recipients: int
+        :return the SendResponse from the request
+        :rtype SendResponse
         """
-        resp = self.__validate_basic_message(message)
+        event = self.__start_event(None, recipients)
+        started = time.perf_counter()
+        serializer, http_request = self.__build_serializer_and_http_request()
+        body = serializer.build_request(message)
+        self.__record(event, SendPhase.Serialize, started)
+
+        self.__throttle(1, recipients, event)
+        return self.__send_injection_request(http_request, body, event)
+
+    def send_bulk_campaign(self, message, recipients=None):
+        """
+        Sends a BulkMessage or PreparedBulkMessage with any number of recipients. The To recipients
+        are split into chunks of at most maximumRecipientsPerMessage, the shared parts of the message
+        are serialized once, and the chunks are sent concurrently on the client's send executor.
+        The recipients can instead be read from any iterable, such as a generator, a CsvRecipientSource
+        or a CursorRecipientSource. They are read one chunk at a time as the sends make progress,
+        so the whole list is never held in memory.
+        :param message: A BulkMessage or PreparedBulkMessage object to be sent.
+        :type message: BulkMessage, PreparedBulkMessage
+        :param recipients: the BulkRecipients or email addresses to send to, instead of the message's To recipients
+        :type recipients: iterable
+        :return the aggregated response, with one SendResponse per chunk
+        :rtype BulkCampaignResponse
+        """
+        if not isinstance(message, (BulkMessage, PreparedBulkMessage)):
+            raise Exception('Message type was not BulkMessage, PreparedBulkMessage. Send Failed')
+
+        resp = SendValidator.validate_credentials(self._server_id, self._api_key)
+        if resp.result == SendResult.Success:
+            if recipients is not None:
+                # the recipients are validated chunk by chunk as they are read
+                resp = SendValidator.validate_bulk_campaign_content(message)
+            elif isinstance(message, PreparedBulkMessage):
+                resp = SendValidator.validate_prepared_bulk_campaign(message)
+            else:
+                resp = SendValidator.validate_bulk_campaign(message)
         if not resp.result == SendResult.Success:
-            return resp
+            return BulkCampaignResponse([resp])
 
-        req_factory = InjectionRequestFactory(self._server_id, self._api_key)
-        body = req_factory.generate_request(message)
+        serializer, http_request = self.__build_serializer_and_http_request()
+        executor = self._send_executor
+        in_flight = threading.BoundedSemaphore(executor.max_workers * 2)
+        results = []
 
-        retry_handler = RetryHandler(self.__build_http_request(), RetrySettings(self.number_of_retries))
+        def send_chunk(chunk_body, event):
+            try:
+                return self.__send_injection_request(http_request, chunk_body, event)
+            except socket.timeout:
+                return SendResponse(SendResult.Timeout)
+            except self.RequestErrors:
+                logger.exception("The request of a chunk of the bulk campaign failed")
+                return SendResponse(SendResult.UnknownError)
 
-        def on_success_callback(response):
-            response = retry_handler.send(body)
+        chunks = serializer.serialize_bulk_chunks(message, maximumRecipientsPerMessage, recipients)
+        try:
+            while True:
+                started = time.perf_counter()
+                chunk, body = next(chunks, (None, None))
+                if chunk is None:
+                    break
+                event = self.__start_event(message, len(chunk))
+                self.__record(event, SendPhase.Serialize, started)
 
-            data = response.read().decode("utf-8")
-            response_code = response.status
-            result = InjectionResponseParser.parse(data, response_code)
+                started = time.perf_counter()
+                chunk_resp = validate_recipient_list(chunk)
+                self.__record(event, SendPhase.Validate, started)
+                if not chunk_resp.result == SendResult.Success:
+                    results.append(self.__complete_event(event, chunk_resp))
+                    continue
+                self.__throttle(1, len(chunk), event)
+                results.append(self.__submit_request(executor, in_flight, event, send_chunk, body, event))
+        except Exception:
+            # let the chunks already submitted finish before giving up on the campaign
+            wait_for_futures([r for r in results if isinstance(r, Future)])
+            raise
 
-            on_success(result)
+        return BulkCampaignResponse([r if isinstance(r, SendResponse) else r.result() for r in results])
 
-        def on_error_callback(exception):
-            on_error(exception)
+    def send_many(self, messages: list, max_messages_per_request: int = 50,
+                  max_bytes_per_request: int = 5 * 1024 * 1024):
+        """
+        Sends several independent BasicMessage messages, packing as many as the budgets
+        allow into each request to the Injection API. The requests are sent concurrently
+        on the client's send executor.
+        :param messages: the BasicMessage objects to be sent
+        :type messages: list
+        :param max_messages_per_request: the maximum number of messages in a request
+        :type max_messages_per_request: int
+        :param max_bytes_per_request: the maximum size of a request body in bytes
+        :type max_bytes_per_request: int
+        :return the SendResponse of each message, in the order the messages were given
+        :rtype list
+        """
+        for message in messages:
+            if not isinstance(message, BasicMessage):
+                raise Exception('Message type was not BasicMessage. Send Failed')
+
+        responses = [None] * len(messages)
+        valid = []
+        for index, message in enumerate(messages):
+            resp = self.__validate_basic_message(message)
+            if resp.result == SendResult.Success:
+                valid.append(index)
+            else:
+                responses[index] = resp
+
+        serializer, http_request = self.__build_serializer_and_http_request()
+        executor = self._send_executor
+        in_flight = threading.BoundedSemaphore(executor.max_workers * 2)
+        results = []
+
+        def send_batch(batch_body, batch_size, event):
+            try:
+                return self.__send_batched_injection_request(http_request, batch_body, batch_size, event)
+            except socket.timeout:
+                return [SendResponse(SendResult.Timeout) for _ in range(batch_size)]
+            except self.RequestErrors:
+                logger.exception("The request of a batch of {0} messages failed".format(batch_size))
+                return [SendResponse(SendResult.UnknownError) for _ in range(batch_size)]
+
+        batches = serializer.serialize_batches([messages[i] for i in valid],
+                                               max_messages_per_request, max_bytes_per_request)
+        try:
+            while True:
+                started = time.perf_counter()
+                positions, body = next(batches, (None, None))
+                if positions is None:
+                    break
+                recipient_count = sum(get_full_recipient_count(messages[valid[p]]) for p in positions)
+                event = self.__start_event([messages[valid[p]] for p in positions], recipient_count, len(positions))
+                self.__record(event, SendPhase.Serialize, started)
+                self.__throttle(len(positions), recipient_count, event)
+                future = self.__submit_request(executor, in_flight, event, send_batch, body, len(positions), event)
+                results.append(([valid[p] for p in positions], future))
+        except Exception:
+            # let the batches already submitted finish before giving up on the messages
+            wait_for_futures([future for _, future in results])
+            raise
 
-        retry_handler.send_async(body, on_success_callback, on_error_callback)
+        for indexes, future in results:
+            for index, resp in zip(indexes, future.result()):
+                responses[index] = resp
 
-    def __send_bulk_message_async(self, message: BulkMessage, on_success, on_error):
+        return responses
+
+    def __submit_request(self, executor: SendExecutor, in_flight: threading.BoundedSemaphore, event: SendEvent,
+                         fn, *args):
         """
-        Send an BulkMessage message asynchronously
-        :param message: a BulkMessage object to be sent
-        :type message: BulkMessage
-        :param on_success: success callback method
+        Submit a request of send_bulk_campaign or send_many to the send executor. The request holds
+        a slot of the executor, so it counts as pending and close() waits for it, and a slot of
+        in_flight, which bounds how far the caller reads ahead of the requests sent. Both are
+        released once fn returns, or when the request cannot be submitted.
+        :param executor: the send executor
+        :type executor: SendExecutor
+        :param in_flight: the slots of the requests of the call
+        :type in_flight: threading.BoundedSemaphore
+        :param event: the event of the request, completed when it cannot be submitted
+        :type event: SendEvent
+        :param fn: the callable sending the request
+        :type fn: method
+        :return the future of the callable
+        :rtype Future
+        """
+        in_flight.acquire()
+        # the caller waits for the request anyway, so it waits for a slot whatever the backpressure policy
+        executor.reserve(block=True)
+
+        def send():
+            try:
+                return fn(*args)
+            finally:
+                executor.release()
+                in_flight.release()
+
+        try:
+            return executor.submit(send)
+        except Exception as e:
+            executor.release()
+            in_flight.release()
+            self.__complete_event(event, exception=e)
+            raise
+
+    def send_async(self, message, on_success=None, on_error=None):
+        """
+        Send a BasicMessage, BulkMessage or PreparedBulkMessage message asynchronously on the client's send executor.
+        When the send queue is full the executor's BackpressurePolicy applies. When the rate
+        limiter holds the send back, or the send is retried, it waits on the executor's
+        scheduler rather than in the caller or on a worker thread. The callbacks run once the
+        send has given back its queue slot, so they may queue further sends.
+        :param message: a BasicMessage, BulkMessage or PreparedBulkMessage object to be sent
+        :type message: object
+        :param on_success: success callback method, called with the SendResponse
         :type on_success: object
-        :param on_error: error callback method
+        :param on_error: error callback method, called with the Exception
         :type on_error: object
+        :return the Future of the SendResponse
+        :rtype Future
         """
-        resp = self.__validate_bulk_message(message)
+        if not isinstance(message, (BasicMessage, BulkMessage, PreparedBulkMessage)):
+            raise Exception('Message type was not BasicMessage, BulkMessage, PreparedBulkMessage. Send Failed')
+
+        future = Future()
+        future.set_running_or_notify_cancel()
+
+        def on_done(done: Future):
+            if done.exception() is not None:
+                if on_error is not None:
+                    on_error(done.exception())
+            elif on_success is not None:
+                on_success(done.result())
+
+        future.add_done_callback(on_done)
+
+        event = self.__start_event(message)
+        started = time.perf_counter()
+        if isinstance(message, BasicMessage):
+            resp = self.__validate_basic_message(message)
+        elif isinstance(message, BulkMessage):
+            resp = self.__validate_bulk_message(message)
+        else:
+            resp = self.__validate_prepared_bulk_message(message)
+        self.__record(event, SendPhase.Validate, started)
         if not resp.result == SendResult.Success:
-            return resp
+            future.set_result(self.__complete_event(event, resp))
+            return future
 
-        req_factory = InjectionRequestFactory(self._server_id, self._api_key)
-        body = req_factory.generate_request(message)
+        executor = self._send_executor
+        try:
+            reserved = executor.reserve()
+        except Exception as e:
+            # the BackpressurePolicy.Raise policy raises to the caller, the send is over
+            self.__complete_event(event, exception=e)
+            raise
+        if not reserved:
+            exception = SendQueueFullException(
+                "The send queue is full ({0} sends queued or in flight)".format(executor.max_queue_size))
+            self.__complete_event(event, exception=exception)
+            future.set_exception(exception)
+            return future
 
-        retry_handler = RetryHandler(self.__build_http_request(), RetrySettings(self.number_of_retries))
+        try:
+            started = time.perf_counter()
+            serializer, http_request = self.__build_serializer_and_http_request()
+            if isinstance(message, PreparedBulkMessage):
+                body = serializer.serialize_prepared(message)
+            else:
+                body = serializer.serialize(message)
+            self.__record(event, SendPhase.Serialize, started)
 
-        def on_success_callback(response):
-            response = retry_handler.send(body)
+            started = time.perf_counter()
+            body = self.__compress(body)
+            self.__record(event, SendPhase.Compress, started)
+            if event is not None:
+                event.request_bytes = len(body)
 
-            data = response.read().decode("utf-8")
-            response_code = response.status
-            result = InjectionResponseParser.parse(data, response_code)
+        except Exception as e:
+            executor.release()
+            self.__complete_event(event, exception=e)
+            raise
+
+        retry_handler = RetryHandler(http_request, self.__build_retry_settings(), executor)
 
-            on_success(result)
+        def complete(response=None, exception: Exception = None):
+            # the queue slot is released before the future completes, so a done-callback can
+            # queue another send under BackpressurePolicy.Block without waiting on its own slot
+            try:
+                self.__complete_event(event, response, exception)
+            finally:
+                executor.release()
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(response)
+
+        def on_success_callback(response):
+            try:
+                started_parse = time.perf_counter()
+                data = response.read().decode("utf-8")
+                response_code = response.status
+                result = InjectionResponseParser.parse(data, response_code)
+                self.__record(event, SendPhase.Parse, started_parse)
+            except Exception as e:
+                complete(exception=e)
+                return
+            if event is not None:
+                event.status_code = response_code
+                event.response_bytes = len(response.read())
+            complete(result)
 
         def on_error_callback(exception):
-            on_error(exception)
+            if isinstance(exception, CircuitOpenException):
+                complete(SendResponse(SendResult.CircuitOpen))
+            else:
+                complete(exception=exception)
 
-        retry_handler.send_async(body, on_success_callback, on_error_callback)
+        wait = 0
+        if self._rate_limiter is not None:
+            wait = self._rate_limiter.reserve(1, self.__count_recipients(message))
+            if event is not None:
+                event.add_timing(SendPhase.Throttle, wait, time.perf_counter() + wait)
 
-        """
-        request = self.__build_http_request()
-        retry_handler = RetryHandler(request, RetrySettings(self.number_of_retries))
-        retry_handler.send_async(body, on_success, on_error)
-        """
+        if wait > 0:
+            # start the send once the rate limiter lets it go ahead
+            try:
+                executor.schedule(wait, retry_handler.send_async, body, on_success_callback, on_error_callback,
+                                  event)
+            except Exception as e:
+                on_error_callback(e)
+        else:
+            retry_handler.send_async(body, on_success_callback, on_error_callback, event)
+        return future
 
     def __validate_basic_message(self, message: BasicMessage):
         """
@@ -300,3 +1041,15 @@ class SocketLabsClient(object):
             return resp
 
         return SendValidator.validate_message(message)
+
+    def __validate_prepared_bulk_message(self, message: PreparedBulkMessage):
+        """
+        Validate a PreparedBulkMessage message. The content was validated when it was prepared.
+        :param message: a PreparedBulkMessage object to be sent
+        :type message: PreparedBulkMessage
+        """
+        resp = SendValidator.validate_credentials(self._server_id, self._api_key)
+        if not resp.result == SendResult.Success:
+            return resp
+
+        return SendValidator.validate_prepared_message(message)
@@ -0,0 +1,102 @@
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+
+class MockInjectionServer(ThreadingMixIn, HTTPServer):
+    """
+    Local stand-in for the Injection API. Records every request it receives,
+    decompressing compressed bodies, and answers with a successful injection response.
+    """
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, status: int = 200, response: dict = None, replies: list = None, delay: float = 0):
+        self.status = status
+        self.delay = delay
+        self.replies = list(replies) if replies is not None else []
+        self.response = response if response is not None else {
+            "ErrorCode": "Success",
+            "MessageResults": [],
+            "TransactionReceipt": None
+        }
+        self.requests = []
+        self.connection_count = 0
+        self._lock = threading.Lock()
+        super().__init__(("127.0.0.1", 0), MockInjectionRequestHandler)
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def endpoint(self):
+        return "http://127.0.0.1:{0}/api/v1/email".format(self.server_address[1])
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+        self.server_close()
+
+    def record(self, headers, body):
+        with self._lock:
+            self.requests.append((headers, body))
+
+    def next_reply(self):
+        """
+        Get the status and extra headers of the next reply: the queued replies first, then the default status.
+        A status of None closes the connection without replying.
+        """
+        with self._lock:
+            if self.replies:
+                return self.replies.pop(0)
+        return self.status, {}
+
+    def handle_error(self, request, client_address):
+        # clients that timed out close the connection before the reply is written
+        pass
+
+    def connected(self):
+        with self._lock:
+            self.connection_count += 1
+
+
+class MockInjectionRequestHandler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connected()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        encoding = self.headers.get("Content-Encoding")
+        if encoding == "gzip":
+            body = zlib.decompress(body, 31)
+        elif encoding == "deflate":
+            body = zlib.decompress(body, 15)
+        self.server.record(dict(self.headers), body)
+
+        status, headers = self.server.next_reply()
+        if status is None:
+            # drop the connection after reading the request, without answering
+            self.close_connection = True
+            return
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        payload = json.dumps(self.server.response).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
@@ -2,6 +2,8 @@ import random
 import string
 import sys
 
+from socketlabs.injectionapi import SocketLabsClient
+from socketlabs.injectionapi.message.basicmessage import BasicMessage
 from socketlabs.injectionapi.message.bulkrecipient import BulkRecipient
 from socketlabs.injectionapi.message.emailaddress import EmailAddress
 
@@ -48,3 +50,17 @@ class RandomHelper(object):
         for _ in range(count):
             recipients.append(BulkRecipient(self.random_email_string()))
         return recipients
+
+    def random_basic_message(self, recipient_count: int = 1):
+        message = BasicMessage()
+        message.subject = self.random_string(10)
+        message.html_body = self.random_string(10)
+        message.from_email_address = self.random_email_address()
+        message.to_email_address = self.random_list_of_email_addresses(recipient_count)
+        return message
+
+    def random_client(self, server=None, client_class=SocketLabsClient):
+        client = client_class(self.random_server_id(), self.random_string(20))
+        if server is not None:
+            client.endpoint = server.endpoint
+        return client
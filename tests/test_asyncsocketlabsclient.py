@@ -0,0 +1,192 @@
+import asyncio
+import json
+import socket
+import threading
+import unittest
+
+from socketlabs.injectionapi import AsyncSocketLabsClient
+from socketlabs.injectionapi.core.asyncconnectionpool import AsyncConnectionPool
+from socketlabs.injectionapi.core.asynchttprequest import AsyncConnection
+from socketlabs.injectionapi.core.requestbody import RequestBody
+from socketlabs.injectionapi.message.basicmessage import BasicMessage
+from socketlabs.injectionapi.sendresult import SendResult
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class TestAsyncSocketLabsClient(unittest.TestCase):
+    """
+    Testing the AsyncSocketLabsClient against a local stand-in server
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+
+    def test_send_ReturnsSuccess_AndReusesConnection_WhenSendingConsecutiveMessages(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            messages = [self.random_helper.random_basic_message(2) for _ in range(3)]
+
+            async def send_all():
+                async with self.random_helper.random_client(server, AsyncSocketLabsClient) as client:
+                    return [await client.send(message) for message in messages]
+
+            # Act
+            responses = asyncio.run(send_all())
+
+            # Assert
+            for response in responses:
+                self.assertEqual(SendResult.Success, response.result)
+            self.assertEqual(3, len(server.requests))
+            self.assertEqual(1, server.connection_count)
+            sent = json.loads(server.requests[0][1].decode("utf-8"))
+            self.assertEqual(messages[0].subject, sent["messages"][0]["subject"])
+
+    def test_send_ReturnsSuccess_WhenSendingConcurrently(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            messages = [self.random_helper.random_basic_message(2) for _ in range(20)]
+
+            async def send_all():
+                async with self.random_helper.random_client(server, AsyncSocketLabsClient) as client:
+                    return await asyncio.gather(*[client.send(message) for message in messages])
+
+            # Act
+            responses = asyncio.run(send_all())
+
+            # Assert
+            self.assertEqual(20, len(responses))
+            for response in responses:
+                self.assertEqual(SendResult.Success, response.result)
+            self.assertEqual(20, len(server.requests))
+
+    def test_send_ReturnsValidationResult_WhenMessageIsInvalid(self):
+        # Arrange
+        client = self.random_helper.random_client(client_class=AsyncSocketLabsClient)
+        message = BasicMessage()
+
+        # Act
+        response = asyncio.run(client.send(message))
+
+        # Assert
+        self.assertEqual(SendResult.MessageValidationEmptySubject, response.result)
+
+    def test_send_DoesNotResend_WhenReusedConnectionClosesAfterRequest(self):
+        with MockInjectionServer(replies=[(200, {}), (None, {})]) as server:
+            # Arrange
+            async def send_twice():
+                async with self.random_helper.random_client(server, AsyncSocketLabsClient) as client:
+                    await client.send(self.random_helper.random_basic_message(2))
+                    await client.send(self.random_helper.random_basic_message(2))
+
+            # Act / Assert
+            with self.assertRaises(ConnectionError):
+                asyncio.run(send_twice())
+            self.assertEqual(2, len(server.requests))
+
+    def test_send_OpensAtMostMaxSizeConnections_WhenSendingConcurrently(self):
+        with MockInjectionServer(delay=0.05) as server:
+            # Arrange
+            messages = [self.random_helper.random_basic_message(2) for _ in range(10)]
+            in_use = []
+
+            async def send_all():
+                async with self.random_helper.random_client(server, AsyncSocketLabsClient) as client:
+                    client.connection_pool = AsyncConnectionPool(max_size=2)
+
+                    async def send(message):
+                        response = await client.send(message)
+                        in_use.append(client.connection_pool.in_use_count + client.connection_pool.idle_count)
+                        return response
+
+                    return await asyncio.gather(*[send(message) for message in messages])
+
+            # Act
+            responses = asyncio.run(send_all())
+
+            # Assert
+            for response in responses:
+                self.assertEqual(SendResult.Success, response.result)
+            self.assertEqual(10, len(server.requests))
+            self.assertEqual(2, server.connection_count)
+            self.assertLessEqual(max(in_use), 2)
+
+    def test_acquire_WaitsForRelease_WhenMaxSizeIsInUse(self):
+        # Arrange
+        pool = AsyncConnectionPool(max_size=1)
+        key = ("https", "example.com", 443, None, None)
+
+        async def new_connection():
+            return FakeAsyncConnection()
+
+        async def acquire_all():
+            connection, _ = await pool.acquire(key, new_connection)
+            with self.assertRaises(socket.timeout):
+                await pool.acquire(key, new_connection, 0.05)
+            waiting = asyncio.ensure_future(pool.acquire(key, new_connection, 5))
+            await asyncio.sleep(0)
+            pool.release(key, connection)
+            return connection, await waiting
+
+        # Act
+        connection, (second, reused) = asyncio.run(acquire_all())
+
+        # Assert
+        self.assertIs(connection, second)
+        self.assertTrue(reused)
+        self.assertEqual(1, pool.in_use_count)
+
+    def test_write_request_ReadsStreamedSegmentOffEventLoop(self):
+        # Arrange
+        stream = RecordingStream([b"abc", b"def"])
+        body = RequestBody([b"{", stream, b"}"])
+        writer = FakeStreamWriter()
+        connection = AsyncConnection(None, writer)
+
+        async def write():
+            await connection.write_request("POST", "example.com", "/", body, {})
+            return threading.get_ident()
+
+        # Act
+        loop_thread = asyncio.run(write())
+
+        # Assert
+        self.assertTrue(writer.data.endswith(b"\r\n\r\n{abcdef}"))
+        self.assertEqual(2, len(stream.threads))
+        self.assertNotIn(loop_thread, stream.threads)
+
+
+class FakeAsyncConnection(object):
+
+    def is_healthy(self):
+        return True
+
+    def close(self):
+        pass
+
+
+class FakeStreamWriter(object):
+
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data: bytes):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+
+class RecordingStream(object):
+
+    def __init__(self, chunks: list):
+        self.chunks = chunks
+        self.threads = []
+
+    def __len__(self):
+        return sum(len(chunk) for chunk in self.chunks)
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.threads.append(threading.get_ident())
+            yield chunk
@@ -0,0 +1,100 @@
+import base64
+import json
+import os
+import tempfile
+import unittest
+
+from socketlabs.injectionapi.core.injectionrequestserializer import InjectionRequestSerializer
+from socketlabs.injectionapi.message.attachment import Attachment
+from socketlabs.injectionapi.message.attachmentcache import AttachmentCache
+from socketlabs.injectionapi.message.basicmessage import BasicMessage
+from tests.random_helper import RandomHelper
+
+
+class TestAttachmentCache(unittest.TestCase):
+    """
+    Testing the AttachmentCache shared by file attachments
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+        self.file_paths = []
+
+    def tearDown(self):
+        for file_path in self.file_paths:
+            os.remove(file_path)
+
+    def create_file(self, data: bytes):
+        handle, file_path = tempfile.mkstemp(suffix=".png")
+        with os.fdopen(handle, "wb") as f:
+            f.write(data)
+        self.file_paths.append(file_path)
+        return file_path
+
+    def test_attachment_SharesEncodedContent_WhenFileIsCached(self):
+        # Arrange
+        data = os.urandom(1000)
+        file_path = self.create_file(data)
+        cache = AttachmentCache()
+
+        # Act
+        first = Attachment(file_path=file_path, cache=cache)
+        second = Attachment(file_path=file_path, cache=cache)
+
+        # Assert
+        self.assertIs(first.content_json, second.content_json)
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(base64.b64encode(data).decode("ascii"), second.content)
+        self.assertEqual("image/png", second.mime_type)
+
+    def test_get_content_ReadsFileAgain_WhenFileChanged(self):
+        # Arrange
+        file_path = self.create_file(b"first")
+        cache = AttachmentCache()
+        cache.get_content(file_path)
+        with open(file_path, "wb") as f:
+            f.write(b"second content")
+
+        # Act
+        content = cache.get_content(file_path)
+
+        # Assert
+        self.assertEqual(base64.b64decode(content[1:-1]), b"second content")
+        self.assertEqual(2, cache.misses)
+
+    def test_get_content_EvictsLeastRecentlyUsed_WhenOverBudget(self):
+        # Arrange
+        file_paths = [self.create_file(os.urandom(300)) for _ in range(3)]
+        cache = AttachmentCache(max_bytes=900)
+        cache.get_content(file_paths[0])
+        cache.get_content(file_paths[1])
+        cache.get_content(file_paths[0])
+
+        # Act
+        cache.get_content(file_paths[2])
+
+        # Assert
+        self.assertEqual(2, cache.count)
+        self.assertLessEqual(cache.size, cache.max_bytes)
+        cache.get_content(file_paths[0])
+        self.assertEqual(2, cache.hits)
+        cache.get_content(file_paths[1])
+        self.assertEqual(4, cache.misses)
+
+    def test_serialize_WritesCachedContent(self):
+        # Arrange
+        data = os.urandom(100)
+        file_path = self.create_file(data)
+        message = BasicMessage()
+        message.subject = self.random_helper.random_string(10)
+        message.from_email_address = self.random_helper.random_email_address()
+        message.add_attachment(Attachment(file_path=file_path, cache=AttachmentCache()))
+
+        # Act
+        body = InjectionRequestSerializer(self.random_helper.random_server_id(), "").serialize(message)
+
+        # Assert
+        self.assertIn(message.attachments[0].content_json, body.segments)
+        sent = json.loads(body.to_bytes().decode("utf-8"))["messages"][0]["attachments"][0]
+        self.assertEqual(data, base64.b64decode(sent["content"]))
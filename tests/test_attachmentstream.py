@@ -0,0 +1,87 @@
+import base64
+import json
+import os
+import tempfile
+import unittest
+
+from socketlabs.injectionapi.message.attachment import Attachment
+from socketlabs.injectionapi.message.attachmentstream import AttachmentStream
+from socketlabs.injectionapi.message.basicmessage import BasicMessage
+from socketlabs.injectionapi.sendresult import SendResult
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class TestAttachmentStream(unittest.TestCase):
+    """
+    Testing file attachments streamed into the request body
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+        self.data = os.urandom(AttachmentStream.ChunkSize * 6 + 100)
+        handle, self.file_path = tempfile.mkstemp(suffix=".pdf")
+        with os.fdopen(handle, "wb") as f:
+            f.write(self.data)
+
+    def tearDown(self):
+        os.remove(self.file_path)
+
+    def build_message(self, attachment: Attachment):
+        message = BasicMessage()
+        message.subject = self.random_helper.random_string(10)
+        message.html_body = self.random_helper.random_string(10)
+        message.from_email_address = self.random_helper.random_email_address()
+        message.to_email_address = self.random_helper.random_list_of_email_addresses(1)
+        message.add_attachment(attachment)
+        return message
+
+    def test_attachment_DoesNotReadFile_WhenStreamed(self):
+        # Act
+        attachment = Attachment(file_path=self.file_path, stream=True)
+
+        # Assert
+        self.assertIsNotNone(attachment.content_stream)
+        self.assertIsNone(attachment._content)
+        self.assertEqual("application/pdf", attachment.mime_type)
+        self.assertEqual(os.path.basename(self.file_path), attachment.name)
+        self.assertEqual(base64.b64encode(self.data).decode("ascii"), attachment.content)
+
+    def test_stream_EncodesSameContentAsReadFile(self):
+        # Arrange
+        stream = AttachmentStream(self.file_path)
+
+        # Act
+        chunks = list(stream)
+
+        # Assert
+        self.assertEqual(7, len(chunks))
+        self.assertEqual(len(stream), sum(len(chunk) for chunk in chunks))
+        self.assertEqual(Attachment(file_path=self.file_path).content.encode("ascii"), b"".join(chunks))
+
+    def test_stream_Raises_WhenFileChangedSize(self):
+        # Arrange
+        stream = AttachmentStream(self.file_path)
+        with open(self.file_path, "ab") as f:
+            f.write(b"more")
+
+        # Act / Assert
+        with self.assertRaises(Exception):
+            list(stream)
+
+    def test_send_StreamsAttachmentIntoRequestBody(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            message = self.build_message(Attachment(file_path=self.file_path, stream=True))
+
+            # Act
+            response = client.send(message)
+            client.close()
+
+            # Assert
+            self.assertEqual(SendResult.Success, response.result)
+            headers, body = server.requests[0]
+            sent = json.loads(body.decode("utf-8"))["messages"][0]["attachments"][0]
+            self.assertEqual(self.data, base64.b64decode(sent["content"]))
+            self.assertEqual(len(body), int(headers["Content-Length"]))
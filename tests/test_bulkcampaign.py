@@ -0,0 +1,109 @@
+import json
+import unittest
+
+from socketlabs.injectionapi import SocketLabsClient
+from socketlabs.injectionapi.message.bulkmessage import BulkMessage
+from socketlabs.injectionapi.message.bulkrecipient import BulkRecipient
+from socketlabs.injectionapi.sendresult import SendResult
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class TestBulkCampaign(unittest.TestCase):
+    """
+    Testing SocketLabsClient.send_bulk_campaign against a local stand-in server
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+
+    def build_message(self, recipient_count: int):
+        message = BulkMessage()
+        message.subject = self.random_helper.random_string(10)
+        message.html_body = "<p>%%Name%%</p>"
+        message.from_email_address = self.random_helper.random_email_address()
+        message.add_global_merge_data("Campaign", "Spring")
+        for index in range(recipient_count):
+            message.add_to_recipient(BulkRecipient(self.random_helper.random_email_string(),
+                                                   merge_data={"Name": str(index)}))
+        return message
+
+    def test_send_bulk_campaign_SplitsRecipientsIntoChunksOfFifty(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            message = self.build_message(120)
+
+            # Act
+            response = client.send_bulk_campaign(message)
+            client.close()
+
+            # Assert
+            self.assertEqual(SendResult.Success, response.result)
+            self.assertEqual(3, len(response.chunk_responses))
+            sent = [json.loads(body.decode("utf-8"))["messages"][0] for _, body in server.requests]
+            self.assertEqual([50, 50, 20], sorted((len(m["mergeData"]["perMessage"]) for m in sent), reverse=True))
+            names = sorted(int(field["value"]) for m in sent
+                           for row in m["mergeData"]["perMessage"] for field in row if field["field"] == "Name")
+            self.assertEqual(list(range(120)), names)
+            for m in sent:
+                self.assertEqual(message.subject, m["subject"])
+                self.assertEqual([{"field": "Campaign", "value": "Spring"}], m["mergeData"]["global"])
+
+    def test_send_bulk_campaign_ReturnsChunkValidationResult_WhenChunkHasInvalidRecipient(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            message = self.build_message(100)
+            message.to_recipient[75].email_address = "invalid"
+
+            # Act
+            response = client.send_bulk_campaign(message)
+            client.close()
+
+            # Assert
+            self.assertEqual(SendResult.RecipientValidationInvalidRecipients, response.result)
+            self.assertEqual(SendResult.Success, response.chunk_responses[0].result)
+            self.assertEqual(SendResult.RecipientValidationInvalidRecipients, response.chunk_responses[1].result)
+            self.assertEqual(1, len(response.address_results))
+            self.assertEqual(1, len(server.requests))
+
+    def test_send_bulk_campaign_ReturnsAndLogsUnknownError_WhenChunkRequestFails(self):
+        with MockInjectionServer(replies=[(None, {})]) as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+
+            # Act
+            with self.assertLogs("socketlabs.injectionapi.socketlabsclient", level="ERROR") as logs:
+                response = client.send_bulk_campaign(self.build_message(10))
+            client.close()
+
+            # Assert
+            self.assertEqual(SendResult.UnknownError, response.result)
+            self.assertEqual(1, len(logs.records))
+            self.assertIsNotNone(logs.records[0].exc_info)
+
+    def test_send_bulk_campaign_ReturnsMissingTo_WhenMessageHasNoRecipients(self):
+        # Arrange
+        client = self.random_helper.random_client()
+
+        # Act
+        response = client.send_bulk_campaign(self.build_message(0))
+        client.close()
+
+        # Assert
+        self.assertEqual(SendResult.RecipientValidationMissingTo, response.result)
+
+    def test_send_bulk_campaign_RaisesException_AndReleasesSlots_WhenClientIsClosed(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            metrics = client.metrics
+            client.close()
+
+            # Act / Assert
+            with self.assertRaises(RuntimeError):
+                client.send_bulk_campaign(self.build_message(120))
+            self.assertEqual(0, client.send_executor.pending_count)
+            self.assertEqual(0, metrics.get("socketlabs_sends_in_flight").get())
+            self.assertEqual(0, len(server.requests))
@@ -0,0 +1,190 @@
+import time
+import unittest
+
+from socketlabs.injectionapi import SocketLabsClient
+from socketlabs.injectionapi.circuitbreaker import CircuitBreaker
+from socketlabs.injectionapi.circuitstate import CircuitState
+from socketlabs.injectionapi.clienttimeoutexception import ClientTimeoutException
+from socketlabs.injectionapi.core.connectionpool import ConnectionPool
+from socketlabs.injectionapi.core.httpendpoint import HttpEndpoint
+from socketlabs.injectionapi.core.httprequest import HttpRequest
+from socketlabs.injectionapi.core.requestbody import RequestBody
+from socketlabs.injectionapi.sendresult import SendResult
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class UnreadableSegment(object):
+    """
+    A request body segment that raises the given exception when it is read
+    """
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+    def __len__(self):
+        return 10
+
+    def __iter__(self):
+        raise self.exception
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """
+    Testing the CircuitBreaker and its use by the SocketLabsClient
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+        self.changes = []
+
+    def on_state_change(self, previous, current):
+        self.changes.append((previous, current))
+
+    def test_breaker_Opens_WhenFailureRateReachesThreshold(self):
+        # Arrange
+        breaker = CircuitBreaker(failure_rate_threshold=0.5, minimum_requests=4, on_state_change=self.on_state_change)
+
+        # Act
+        for failed in (False, True, False, True):
+            self.assertTrue(breaker.allow_request())
+            breaker.record_failure() if failed else breaker.record_success()
+
+        # Assert
+        self.assertEqual(CircuitState.Open, breaker.state)
+        self.assertFalse(breaker.allow_request())
+        self.assertEqual([(CircuitState.Closed, CircuitState.Open)], self.changes)
+
+    def test_breaker_StaysClosed_UntilMinimumRequests(self):
+        # Arrange
+        breaker = CircuitBreaker(minimum_requests=5)
+
+        # Act
+        for _ in range(4):
+            breaker.allow_request()
+            breaker.record_failure()
+
+        # Assert
+        self.assertEqual(CircuitState.Closed, breaker.state)
+
+    def test_breaker_AllowsOneTrial_AfterCoolDown_ThenCloses(self):
+        # Arrange
+        breaker = CircuitBreaker(minimum_requests=1, cool_down=0.1, on_state_change=self.on_state_change)
+        breaker.allow_request()
+        breaker.record_failure()
+        time.sleep(0.15)
+
+        # Act
+        first = breaker.allow_request()
+        second = breaker.allow_request()
+        breaker.record_success()
+
+        # Assert
+        self.assertTrue(first)
+        self.assertFalse(second)
+        self.assertEqual(CircuitState.Closed, breaker.state)
+        self.assertEqual([(CircuitState.Closed, CircuitState.Open),
+                          (CircuitState.Open, CircuitState.HalfOpen),
+                          (CircuitState.HalfOpen, CircuitState.Closed)], self.changes)
+
+    def test_breaker_Reopens_WhenTrialFails(self):
+        # Arrange
+        breaker = CircuitBreaker(minimum_requests=1, cool_down=0.05)
+        breaker.allow_request()
+        breaker.record_failure()
+        time.sleep(0.1)
+
+        # Act
+        breaker.allow_request()
+        breaker.record_failure()
+
+        # Assert
+        self.assertEqual(CircuitState.Open, breaker.state)
+        self.assertFalse(breaker.allow_request())
+
+    def test_record_exception_CountsOnlyTransportErrors(self):
+        # Arrange
+        breaker = CircuitBreaker(minimum_requests=1)
+
+        # Act
+        breaker.allow_request()
+        breaker.record_exception(ValueError("not a transport error"))
+        state = breaker.state
+        breaker.allow_request()
+        breaker.record_exception(ConnectionResetError())
+
+        # Assert
+        self.assertEqual(CircuitState.Closed, state)
+        self.assertEqual(CircuitState.Open, breaker.state)
+
+    def test_record_exception_DoesNotCount_ClientTimeout(self):
+        # Arrange
+        breaker = CircuitBreaker(minimum_requests=1)
+
+        # Act
+        breaker.allow_request()
+        breaker.record_exception(ClientTimeoutException("No connection of the pool became available in time"))
+
+        # Assert
+        self.assertEqual(CircuitState.Closed, breaker.state)
+
+    def test_send_DoesNotOpenBreaker_WhenPoolIsSaturated(self):
+        with MockInjectionServer(delay=0.5) as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            client.connection_pool = ConnectionPool(max_size=1)
+            client.connect_timeout = 0.05
+            client.circuit_breaker = CircuitBreaker(minimum_requests=2, cool_down=60)
+
+            # Act
+            futures = [client.send_async(self.random_helper.random_basic_message()) for _ in range(4)]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result(timeout=5).result)
+                except ClientTimeoutException:
+                    results.append(None)
+            client.close()
+
+            # Assert
+            self.assertIn(SendResult.Success, results)
+            self.assertIn(None, results)
+            self.assertEqual(CircuitState.Closed, client.circuit_breaker.state)
+            self.assertEqual(1, len(server.requests))
+
+    def test_send_request_ReleasesTrial_WhenRequestIsInterrupted(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            breaker = CircuitBreaker(minimum_requests=1, cool_down=0.05)
+            breaker.allow_request()
+            breaker.record_failure()
+            time.sleep(0.1)
+            request = HttpRequest(HttpRequest.HttpRequestMethod.POST, HttpEndpoint(server.endpoint), 10,
+                                  self.random_helper.random_string(20), circuit_breaker=breaker)
+
+            # Act
+            for exception in [KeyboardInterrupt(), ValueError("unreadable body")]:
+                with self.assertRaises(type(exception)):
+                    request.send_request(RequestBody([UnreadableSegment(exception)]))
+
+            # Assert
+            self.assertEqual(CircuitState.HalfOpen, breaker.state)
+            self.assertTrue(breaker.allow_request())
+
+    def test_send_ReturnsCircuitOpen_WithoutSending_WhenEndpointIsFailing(self):
+        with MockInjectionServer(status=503) as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            client.circuit_breaker = CircuitBreaker(minimum_requests=2, cool_down=60)
+
+            # Act
+            responses = [client.send(self.random_helper.random_basic_message()) for _ in range(2)]
+            rejected = client.send(self.random_helper.random_basic_message())
+            rejected_async = client.send_async(self.random_helper.random_basic_message()).result(timeout=5)
+            client.close()
+
+            # Assert
+            self.assertNotIn(SendResult.CircuitOpen, [r.result for r in responses])
+            self.assertEqual(SendResult.CircuitOpen, rejected.result)
+            self.assertEqual(SendResult.CircuitOpen, rejected_async.result)
+            self.assertEqual(2, len(server.requests))
@@ -0,0 +1,83 @@
+import json
+import unittest
+
+from socketlabs.injectionapi.compressionmethod import CompressionMethod
+from socketlabs.injectionapi.compressionsettings import CompressionSettings
+from socketlabs.injectionapi.core.injectionrequestserializer import InjectionRequestSerializer
+from socketlabs.injectionapi.message.basicmessage import BasicMessage
+from socketlabs.injectionapi.sendresult import SendResult
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class TestCompression(unittest.TestCase):
+    """
+    Testing compressed request bodies against a local stand-in server
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+
+    def build_message(self, html_size: int):
+        message = BasicMessage()
+        message.subject = self.random_helper.random_string(10)
+        message.html_body = "<p>Compressible body</p>" * (html_size // 24)
+        message.from_email_address = self.random_helper.random_email_address()
+        message.to_email_address = self.random_helper.random_list_of_email_addresses(1)
+        return message
+
+    def send(self, message, compression: CompressionSettings):
+        with MockInjectionServer() as server:
+            client = self.random_helper.random_client(server)
+            client.compression = compression
+            response = client.send(message)
+            client.close()
+            return response, server.requests[0]
+
+    def test_send_CompressesBody_WithGzip(self):
+        # Arrange
+        message = self.build_message(10000)
+
+        # Act
+        response, (headers, body) = self.send(message, CompressionSettings(CompressionMethod.Gzip))
+
+        # Assert
+        self.assertEqual(SendResult.Success, response.result)
+        self.assertEqual("gzip", headers["Content-Encoding"])
+        self.assertLess(int(headers["Content-Length"]), len(body))
+        self.assertEqual(message.html_body, json.loads(body.decode("utf-8"))["messages"][0]["htmlBody"])
+
+    def test_send_CompressesBody_WithDeflate(self):
+        # Arrange
+        message = self.build_message(10000)
+
+        # Act
+        response, (headers, body) = self.send(message, CompressionSettings(CompressionMethod.Deflate, level=9))
+
+        # Assert
+        self.assertEqual(SendResult.Success, response.result)
+        self.assertEqual("deflate", headers["Content-Encoding"])
+        self.assertEqual(message.html_body, json.loads(body.decode("utf-8"))["messages"][0]["htmlBody"])
+
+    def test_send_DoesNotCompressBody_WhenUnderThreshold(self):
+        # Arrange
+        message = self.build_message(100)
+
+        # Act
+        response, (headers, body) = self.send(message, CompressionSettings(threshold=4096))
+
+        # Assert
+        self.assertEqual(SendResult.Success, response.result)
+        self.assertNotIn("Content-Encoding", headers)
+        self.assertEqual(int(headers["Content-Length"]), len(body))
+
+    def test_compress_KeepsEncodingWithBody(self):
+        # Arrange
+        body = InjectionRequestSerializer(1, "").serialize(self.build_message(1000))
+
+        # Act
+        compressed = CompressionSettings(CompressionMethod.Deflate).compress(body)
+
+        # Assert
+        self.assertEqual("deflate", compressed.content_encoding)
+        self.assertEqual(len(compressed.to_bytes()), len(compressed))
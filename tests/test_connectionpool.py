@@ -0,0 +1,114 @@
+import socket
+import unittest
+
+from socketlabs.injectionapi.core.connectionpool import ConnectionPool
+from socketlabs.injectionapi.sendresult import SendResult
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class TestConnectionPool(unittest.TestCase):
+    """
+    Testing the ConnectionPool against a local stand-in server
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+
+    def test_send_ReusesConnection_WhenSendingConsecutiveMessages(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+
+            # Act
+            responses = [client.send(self.random_helper.random_basic_message(2)) for _ in range(3)]
+            client.close()
+
+            # Assert
+            for response in responses:
+                self.assertEqual(SendResult.Success, response.result)
+            self.assertEqual(3, len(server.requests))
+            self.assertEqual(1, server.connection_count)
+
+    def test_send_OpensNewConnection_WhenIdleTimeoutHasExpired(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            client.connection_pool = ConnectionPool(idle_timeout=0)
+
+            # Act
+            for _ in range(2):
+                client.send(self.random_helper.random_basic_message(2))
+            client.close()
+
+            # Assert
+            self.assertEqual(2, len(server.requests))
+            self.assertEqual(2, server.connection_count)
+
+    def test_close_ClosesIdleConnections(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            client.send(self.random_helper.random_basic_message(2))
+            self.assertEqual(1, client.connection_pool.idle_count)
+
+            # Act
+            client.close()
+
+            # Assert
+            self.assertEqual(0, client.connection_pool.idle_count)
+            self.assertEqual(0, client.connection_pool.in_use_count)
+
+    def test_send_ReplacesConnection_WhenIdleConnectionIsBroken(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            client.send(self.random_helper.random_basic_message(2))
+            for entries in client.connection_pool._idle.values():
+                for connection, _ in entries:
+                    connection.sock.close()
+                    connection.sock = None
+
+            # Act
+            response = client.send(self.random_helper.random_basic_message(2))
+            client.close()
+
+            # Assert
+            self.assertEqual(SendResult.Success, response.result)
+            self.assertEqual(2, server.connection_count)
+
+    def test_send_DoesNotResend_WhenReusedConnectionClosesAfterRequest(self):
+        with MockInjectionServer(replies=[(200, {}), (None, {})]) as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            client.send(self.random_helper.random_basic_message(2))
+
+            # Act / Assert
+            with self.assertRaises(ConnectionError):
+                client.send(self.random_helper.random_basic_message(2))
+            client.close()
+            self.assertEqual(2, len(server.requests))
+            self.assertEqual(0, client.connection_pool.in_use_count)
+
+    def test_acquire_WaitsForRelease_WhenMaxSizeIsInUse(self):
+        # Arrange
+        pool = ConnectionPool(max_size=1)
+        key = ("https", "example.com", 443, None, None)
+        connection, _ = pool.acquire(key, FakeConnection)
+
+        # Act / Assert
+        self.assertRaises(socket.timeout, pool.acquire, key, FakeConnection, 0.05)
+        pool.discard(connection)
+        second, reused = pool.acquire(key, FakeConnection, 0.05)
+        self.assertIsNot(connection, second)
+        self.assertFalse(reused)
+        self.assertEqual(1, pool.in_use_count)
+
+
+class FakeConnection(object):
+
+    def __init__(self):
+        self.sock = None
+
+    def close(self):
+        pass
@@ -0,0 +1,115 @@
+import json
+import unittest
+
+from socketlabs.injectionapi.core.injectionrequestfactory import InjectionRequestFactory
+from socketlabs.injectionapi.core.injectionrequestserializer import InjectionRequestSerializer
+from socketlabs.injectionapi.message.attachment import Attachment
+from socketlabs.injectionapi.message.basicmessage import BasicMessage
+from socketlabs.injectionapi.message.bulkmessage import BulkMessage
+from socketlabs.injectionapi.message.bulkrecipient import BulkRecipient
+from socketlabs.injectionapi.message.emailaddress import EmailAddress
+from tests.random_helper import RandomHelper
+
+
+class TestInjectionRequestSerializer(unittest.TestCase):
+    """
+    Testing the InjectionRequestSerializer against the InjectionRequestFactory output
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+        self.server_id = self.random_helper.random_server_id()
+        self.api_key = self.random_helper.random_string(20)
+
+    def build_attachment(self):
+        attachment = Attachment("file.txt", "text/plain", content=b"attachment \x00 content")
+        attachment.content_id = self.random_helper.random_string(10)
+        attachment.add_custom_header("X-Attachment", self.random_helper.random_string(10))
+        return attachment
+
+    def build_basic_message(self):
+        message = BasicMessage()
+        message.subject = "Subject with \"quotes\", accents é and ☃"
+        message.html_body = "<p>\n\tBody</p>"
+        message.plain_text_body = self.random_helper.random_string(10)
+        message.from_email_address = EmailAddress(self.random_helper.random_email_string(), "From Name")
+        message.reply_to_email_address = EmailAddress(self.random_helper.random_email_string())
+        message.to_email_address = self.random_helper.random_list_of_email_addresses(3)
+        message.add_cc_email_address(self.random_helper.random_email_string())
+        message.mailing_id = self.random_helper.random_string(10)
+        message.charset = "UTF-8"
+        message.add_custom_header("X-Header", self.random_helper.random_string(10))
+        message.add_metadata("key", self.random_helper.random_string(10))
+        message.tags = [self.random_helper.random_string(10)]
+        message.add_attachment(self.build_attachment())
+        return message
+
+    def build_bulk_message(self, recipient_count: int):
+        message = BulkMessage()
+        message.subject = self.random_helper.random_string(10)
+        message.html_body = "<p>%%Name%%</p>"
+        message.from_email_address = EmailAddress(self.random_helper.random_email_string())
+        message.add_global_merge_data("Campaign", "Spring")
+        message.add_metadata("key", self.random_helper.random_string(10))
+        message.add_attachment(self.build_attachment())
+        for index in range(recipient_count):
+            message.add_to_recipient(BulkRecipient(self.random_helper.random_email_string(),
+                                                   "Name {0}".format(index), {"Name": str(index)}))
+        return message
+
+    def factory_json(self, message):
+        request = InjectionRequestFactory(self.server_id, self.api_key).generate_request(message)
+        return json.loads(json.dumps(request.to_json()))
+
+    def test_serialize_MatchesFactory_ForBasicMessage(self):
+        # Arrange
+        message = self.build_basic_message()
+
+        # Act
+        body = InjectionRequestSerializer(self.server_id, self.api_key).serialize(message)
+
+        # Assert
+        self.assertEqual(self.factory_json(message), json.loads(body.to_bytes().decode("utf-8")))
+        self.assertEqual(len(body.to_bytes()), len(body))
+
+    def test_serialize_MatchesFactory_ForBulkMessage(self):
+        # Arrange
+        message = self.build_bulk_message(5)
+
+        # Act
+        body = InjectionRequestSerializer(self.server_id, self.api_key).serialize(message)
+
+        # Assert
+        self.assertEqual(self.factory_json(message), json.loads(body.to_bytes().decode("utf-8")))
+
+    def test_serialize_bulk_chunks_SharesInvariantSegmentsBetweenChunks(self):
+        # Arrange
+        message = self.build_bulk_message(5)
+        serializer = InjectionRequestSerializer(self.server_id, self.api_key)
+
+        # Act
+        chunks = list(serializer.serialize_bulk_chunks(message, 2))
+
+        # Assert
+        self.assertEqual([2, 2, 1], [len(chunk) for chunk, _ in chunks])
+        first, second = chunks[0][1].segments, chunks[1][1].segments
+        self.assertIs(first[0], second[0])
+        self.assertIs(first[-1], second[-1])
+        recipients = [row for _, body in chunks
+                      for row in json.loads(body.to_bytes().decode("utf-8"))["messages"][0]["mergeData"]["perMessage"]]
+        self.assertEqual(self.factory_json(message)["messages"][0]["mergeData"]["perMessage"], recipients)
+
+    def test_serialize_batches_KeepsEachBodyWithinByteBudget(self):
+        # Arrange
+        messages = [self.build_basic_message() for _ in range(6)]
+        serializer = InjectionRequestSerializer(self.server_id, self.api_key)
+        single_size = len(serializer.serialize(messages[0]))
+
+        # Act
+        batches = list(serializer.serialize_batches(messages, 50, single_size * 2))
+
+        # Assert
+        self.assertEqual(list(range(6)), [p for positions, _ in batches for p in positions])
+        for positions, body in batches:
+            self.assertLessEqual(len(body), single_size * 2)
+            self.assertEqual(len(positions), len(json.loads(body.to_bytes().decode("utf-8"))["messages"]))
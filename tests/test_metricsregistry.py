@@ -0,0 +1,116 @@
+import asyncio
+import unittest
+
+from socketlabs.injectionapi import AsyncSocketLabsClient
+from socketlabs.injectionapi.metrics.metricsregistry import MetricsRegistry
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """
+    Testing the MetricsRegistry, its text exposition and the metrics of the clients
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+
+    def test_to_text_WritesCountersAndGauges(self):
+        # Arrange
+        registry = MetricsRegistry()
+        sends = registry.counter("app_sends_total", "Sends by result", ("result",))
+        pending = registry.gauge("app_pending", "Pending\nsends")
+
+        # Act
+        sends.inc(labels={"result": "Success"})
+        sends.inc(2, {"result": 'Bad "quote"'})
+        pending.set(3)
+        pending.dec()
+        text = registry.to_text()
+
+        # Assert
+        self.assertIs(sends, registry.counter("app_sends_total", "Sends by result", ("result",)))
+        self.assertEqual(
+            "# HELP app_sends_total Sends by result\n"
+            "# TYPE app_sends_total counter\n"
+            'app_sends_total{result="Bad \\"quote\\""} 2\n'
+            'app_sends_total{result="Success"} 1\n'
+            "# HELP app_pending Pending\\nsends\n"
+            "# TYPE app_pending gauge\n"
+            "app_pending 2\n", text)
+
+    def test_histogram_CountsValuesInCumulativeBuckets(self):
+        # Arrange
+        registry = MetricsRegistry()
+        latency = registry.histogram("app_latency_seconds", "Latency", buckets=(0.1, 1))
+
+        # Act
+        for value in [0.05, 0.1, 0.5, 3]:
+            latency.observe(value)
+        text = registry.to_text()
+
+        # Assert
+        self.assertEqual(4, latency.get_count())
+        self.assertAlmostEqual(3.65, latency.get_sum())
+        self.assertIn('app_latency_seconds_bucket{le="0.1"} 2\n', text)
+        self.assertIn('app_latency_seconds_bucket{le="1.0"} 3\n', text)
+        self.assertIn('app_latency_seconds_bucket{le="+Inf"} 4\n', text)
+        self.assertIn("app_latency_seconds_count 4\n", text)
+
+    def test_counter_RaisesException_WhenRegisteredAsAnotherType(self):
+        # Arrange
+        registry = MetricsRegistry()
+        counter = registry.counter("app_sends_total", "Sends")
+
+        # Act / Assert
+        self.assertRaises(Exception, registry.gauge, "app_sends_total", "Sends")
+        self.assertRaises(AttributeError, counter.inc, -1)
+        self.assertRaises(AttributeError, registry.counter, "app sends", "Sends")
+
+    def test_metrics_CountsResultsAndRetries(self):
+        with MockInjectionServer(replies=[(429, {"Retry-After": "0"})]) as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            client.number_of_retries = 2
+            metrics = client.metrics
+            invalid = self.random_helper.random_basic_message(2)
+            invalid.subject = None
+
+            # Act
+            client.send(self.random_helper.random_basic_message(2))
+            client.send(self.random_helper.random_basic_message(2))
+            client.send(invalid)
+            client.close()
+
+            # Assert
+            self.assertIs(metrics, client.metrics)
+            self.assertEqual(2, metrics.get("socketlabs_sends_total").get({"result": "Success"}))
+            self.assertEqual(1, metrics.get("socketlabs_sends_total").get({"result": "MessageValidationEmptySubject"}))
+            self.assertEqual(4, metrics.get("socketlabs_recipients_total").get({"result": "Success"}))
+            self.assertEqual(3, metrics.get("socketlabs_attempts_total").get())
+            self.assertEqual(1, metrics.get("socketlabs_retries_total").get({"reason": 429}))
+            self.assertEqual(1, metrics.get("socketlabs_retried_sends_total").get({"result": "Success"}))
+            self.assertEqual(0, metrics.get("socketlabs_sends_in_flight").get())
+            self.assertEqual(3, metrics.get("socketlabs_send_duration_seconds").get_count())
+            # the retried request is counted once
+            self.assertEqual(sum(len(body) for _, body in server.requests[1:]),
+                             metrics.get("socketlabs_request_bytes_total").get())
+            text = metrics.to_text()
+            self.assertIn('socketlabs_phase_duration_seconds_count{phase="Wait"} 2\n', text)
+            self.assertIn("socketlabs_connection_pool_idle 0\n", text)
+
+    def test_metrics_ReportsPoolUsage_ForAsyncClient(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server, AsyncSocketLabsClient)
+            metrics = client.metrics
+
+            # Act
+            asyncio.run(client.send(self.random_helper.random_basic_message(2)))
+            idle = metrics.get("socketlabs_connection_pool_idle").get()
+            client.close()
+
+            # Assert
+            self.assertEqual(1, idle)
+            self.assertEqual(0, metrics.get("socketlabs_connection_pool_in_use").get())
+            self.assertEqual(1, metrics.get("socketlabs_sends_total").get({"result": "Success"}))
@@ -0,0 +1,131 @@
+import asyncio
+import unittest
+
+from socketlabs.injectionapi import AsyncSocketLabsClient, SocketLabsClient
+from socketlabs.injectionapi.opentelemetryobserver import OpenTelemetryObserver
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+try:
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+except ImportError:
+    TracerProvider = None
+
+
+@unittest.skipIf(TracerProvider is None, "opentelemetry-sdk is not installed")
+class TestOpenTelemetryObserver(unittest.TestCase):
+    """
+    Testing the spans and metrics of the OpenTelemetryObserver, with the in-memory exporters
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+        self.exporter = InMemorySpanExporter()
+        self.tracer_provider = TracerProvider()
+        self.tracer_provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        self.reader = InMemoryMetricReader()
+        self.observer = OpenTelemetryObserver(self.tracer_provider, MeterProvider(metric_readers=[self.reader]))
+
+    def build_client(self, server, client_class=SocketLabsClient):
+        client = self.random_helper.random_client(server, client_class)
+        client.add_observer(self.observer)
+        return client
+
+    def get_metrics(self):
+        points = {}
+        for resource_metrics in self.reader.get_metrics_data().resource_metrics:
+            for scope_metrics in resource_metrics.scope_metrics:
+                for metric in scope_metrics.metrics:
+                    for point in metric.data.data_points:
+                        points[(metric.name, point.attributes["socketlabs.result"])] = point
+        return points
+
+    def test_send_EmitsSendSpanWithPhaseSpans(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.build_client(server)
+
+            # Act
+            client.send(self.random_helper.random_basic_message(2))
+            client.close()
+
+            # Assert
+            spans = {span.name: span for span in self.exporter.get_finished_spans()}
+            send = spans["socketlabs.send"]
+            attempt = spans["socketlabs.attempt"]
+            self.assertIsNone(send.parent)
+            self.assertEqual("Success", send.attributes["socketlabs.result"])
+            self.assertEqual(2, send.attributes["socketlabs.recipient_count"])
+            self.assertEqual(200, send.attributes["http.response.status_code"])
+            self.assertEqual(len(server.requests[0][1]), send.attributes["socketlabs.request.bytes"])
+            self.assertEqual(send.context.span_id, attempt.parent.span_id)
+            for name in ["socketlabs.validate", "socketlabs.serialize", "socketlabs.parse"]:
+                self.assertEqual(send.context.span_id, spans[name].parent.span_id)
+            for name in ["socketlabs.connect", "socketlabs.write", "socketlabs.wait", "socketlabs.read"]:
+                self.assertEqual(attempt.context.span_id, spans[name].parent.span_id)
+            for span in spans.values():
+                self.assertEqual(send.context.trace_id, span.context.trace_id)
+                self.assertGreaterEqual(span.start_time, send.start_time)
+                self.assertLessEqual(span.end_time, send.end_time)
+
+    def test_send_EmitsSpanPerAttempt_WhenRetried(self):
+        with MockInjectionServer(replies=[(503, {"Retry-After": "0"})]) as server:
+            # Arrange
+            client = self.build_client(server)
+            client.number_of_retries = 1
+
+            # Act
+            client.send(self.random_helper.random_basic_message(2))
+            client.close()
+
+            # Assert
+            spans = self.exporter.get_finished_spans()
+            attempts = sorted((s for s in spans if s.name == "socketlabs.attempt"), key=lambda s: s.start_time)
+            self.assertEqual([503, 200], [a.attributes["http.response.status_code"] for a in attempts])
+            self.assertEqual([1, 2], [a.attributes["socketlabs.attempt"] for a in attempts])
+            self.assertEqual(2, len([s for s in spans if s.name == "socketlabs.connect"]))
+            self.assertEqual(1, len([s for s in spans if s.name == "socketlabs.backoff"]))
+
+    def test_send_RecordsMetricsByResult(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.build_client(server)
+            invalid = self.random_helper.random_basic_message(2)
+            invalid.subject = None
+
+            # Act
+            client.send(self.random_helper.random_basic_message(2))
+            client.send(self.random_helper.random_basic_message(2))
+            client.send(invalid)
+            client.close()
+
+            # Assert
+            points = self.get_metrics()
+            self.assertEqual(2, points[("socketlabs.messages.sent", "Success")].value)
+            self.assertEqual(4, points[("socketlabs.recipients.sent", "Success")].value)
+            self.assertEqual(sum(len(body) for _, body in server.requests),
+                             points[("socketlabs.request.bytes", "Success")].value)
+            self.assertEqual(2, points[("socketlabs.send.duration", "Success")].count)
+            self.assertEqual(1, points[("socketlabs.messages.sent", "MessageValidationEmptySubject")].value)
+
+    def test_send_async_ParentsSpanToCurrentSpan(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            tracer = self.tracer_provider.get_tracer(__name__)
+
+            async def send():
+                async with self.build_client(server, AsyncSocketLabsClient) as client:
+                    with tracer.start_as_current_span("caller") as caller:
+                        await client.send(self.random_helper.random_basic_message(2))
+                        return caller
+
+            # Act
+            caller = asyncio.run(send())
+
+            # Assert
+            send_span = [s for s in self.exporter.get_finished_spans() if s.name == "socketlabs.send"][0]
+            self.assertEqual(caller.context.span_id, send_span.parent.span_id)
@@ -0,0 +1,211 @@
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from socketlabs.injectionapi import SocketLabsClient
+from socketlabs.injectionapi.outbox import Outbox
+from socketlabs.injectionapi.outboxstate import OutboxState
+from socketlabs.injectionapi.sendresult import SendResult
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class TestOutbox(unittest.TestCase):
+    """
+    Testing the Outbox spool of messages on disk
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "outbox.db")
+        self.receipt = self.random_helper.random_string(10)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def build_server(self, replies: list = None):
+        return MockInjectionServer(replies=replies, response={
+            "ErrorCode": "Success",
+            "MessageResults": [],
+            "TransactionReceipt": self.receipt
+        })
+
+    def test_enqueue_SendsMessageAndRecordsReceipt(self):
+        with self.build_server() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            message = self.random_helper.random_basic_message()
+
+            # Act
+            with Outbox(client, self.path) as outbox:
+                entry_id = outbox.enqueue(message)
+                flushed = outbox.flush(timeout=10)
+                entry = outbox.get_entry(entry_id)
+            client.close()
+
+            # Assert
+            self.assertTrue(flushed)
+            self.assertEqual(OutboxState.Sent, entry.state)
+            self.assertEqual(SendResult.Success, entry.result)
+            self.assertEqual(self.receipt, entry.transaction_receipt)
+            self.assertEqual(1, entry.attempts)
+            sent = json.loads(server.requests[0][1].decode("utf-8"))
+            self.assertEqual(message.subject, sent["messages"][0]["subject"])
+            self.assertEqual(str(client._server_id), sent["serverId"])
+
+    def test_enqueue_KeepsMessageOnDisk_UntilOutboxIsStarted(self):
+        with self.build_server() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            outbox = Outbox(client, self.path)
+            entry_id = outbox.enqueue(self.random_helper.random_basic_message())
+            outbox.close()
+
+            # Act
+            with Outbox(client, self.path) as reopened:
+                reopened.flush(timeout=10)
+                entry = reopened.get_entry(entry_id)
+            client.close()
+
+            # Assert
+            self.assertEqual(OutboxState.Sent, entry.state)
+            self.assertEqual(1, len(server.requests))
+
+    def test_open_ResendsMessage_WhenSendWasInterrupted(self):
+        with self.build_server() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            outbox = Outbox(client, self.path)
+            entry_id = outbox.enqueue(self.random_helper.random_basic_message())
+            outbox.close()
+            with sqlite3.connect(self.path) as connection:
+                connection.execute("UPDATE outbox SET state = ?", (OutboxState.Sending.value,))
+
+            # Act
+            with Outbox(client, self.path) as reopened:
+                reopened.flush(timeout=10)
+                entry = reopened.get_entry(entry_id)
+            client.close()
+
+            # Assert
+            self.assertEqual(OutboxState.Sent, entry.state)
+
+    def test_worker_RetriesMessage_WhenServerIsUnavailable(self):
+        with self.build_server(replies=[(503, {}), (503, {})]) as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+
+            # Act
+            with Outbox(client, self.path, retry_interval=0.01, poll_interval=0.01) as outbox:
+                entry_id = outbox.enqueue(self.random_helper.random_basic_message())
+                outbox.flush(timeout=10)
+                entry = outbox.get_entry(entry_id)
+            client.close()
+
+            # Assert
+            self.assertEqual(OutboxState.Sent, entry.state)
+            self.assertEqual(3, entry.attempts)
+            self.assertEqual(3, len(server.requests))
+
+    def test_worker_MarksMessageFailed_AfterMaximumAttempts(self):
+        with self.build_server(replies=[(503, {})] * 2) as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+
+            # Act
+            with Outbox(client, self.path, max_attempts=2, retry_interval=0.01, poll_interval=0.01) as outbox:
+                entry_id = outbox.enqueue(self.random_helper.random_basic_message())
+                outbox.flush(timeout=10)
+                entry = outbox.get_entry(entry_id)
+            client.close()
+
+            # Assert
+            self.assertEqual(OutboxState.Failed, entry.state)
+            self.assertEqual(2, entry.attempts)
+
+    def test_enqueue_DoesNotStoreCredentials(self):
+        # Arrange
+        api_key = self.random_helper.random_string(20)
+        client = SocketLabsClient(self.random_helper.random_server_id(), api_key)
+        outbox = Outbox(client, self.path)
+
+        # Act
+        outbox.enqueue(self.random_helper.random_basic_message())
+        outbox.close()
+
+        # Assert
+        with sqlite3.connect(self.path) as connection:
+            stored = connection.execute("SELECT message FROM outbox").fetchone()[0]
+        self.assertNotIn(api_key.encode("utf-8"), stored)
+
+    def test_enqueue_Raises_WhenMessageIsInvalid(self):
+        # Arrange
+        client = self.random_helper.random_client()
+        outbox = Outbox(client, self.path)
+        message = self.random_helper.random_basic_message()
+        message.subject = None
+
+        # Act / Assert
+        with self.assertRaises(Exception):
+            outbox.enqueue(message)
+        self.assertEqual(0, outbox.pending_count)
+        outbox.close()
+
+    def test_worker_KeepsRunning_WhenDatabaseIsLocked(self):
+        self.assert_worker_survives(sqlite3.OperationalError("database is locked"),
+                                    sqlite3.OperationalError("database is locked"))
+
+    def test_worker_KeepsRunning_WhenDatabaseRaisesOtherError(self):
+        self.assert_worker_survives(sqlite3.DatabaseError("database disk image is malformed"),
+                                    sqlite3.IntegrityError("constraint failed"))
+
+    def assert_worker_survives(self, claim_error: Exception, deliver_error: Exception):
+        with self.build_server() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            outbox = Outbox(client, self.path, poll_interval=0.01)
+            claim = outbox._Outbox__claim
+            deliver = outbox._Outbox__deliver
+            failures = {"claim": claim_error, "deliver": deliver_error}
+
+            def fail_once(name, method):
+                def call(*args):
+                    error = failures.pop(name, None)
+                    if error is not None:
+                        raise error
+                    return method(*args)
+                return call
+
+            outbox._Outbox__claim = fail_once("claim", claim)
+            outbox._Outbox__deliver = fail_once("deliver", deliver)
+
+            # Act
+            with self.assertLogs("socketlabs.injectionapi.outbox", level="ERROR") as logs:
+                with outbox.start():
+                    entry_id = outbox.enqueue(self.random_helper.random_basic_message())
+                    outbox.flush(timeout=10)
+                    entry = outbox.get_entry(entry_id)
+            client.close()
+
+            # Assert
+            self.assertEqual(OutboxState.Sent, entry.state)
+            self.assertEqual(1, len(server.requests))
+            self.assertEqual(2, len(logs.records))
+
+    def test_close_ClosesWorkerConnections_WhenWorkersExit(self):
+        # Arrange
+        client = self.random_helper.random_client()
+        outbox = Outbox(client, self.path, poll_interval=0.01).start()
+        threads = list(outbox._threads)
+
+        # Act
+        outbox.close(wait=False)
+        for thread in threads:
+            thread.join(timeout=10)
+
+        # Assert
+        self.assertEqual({}, outbox._connections)
@@ -0,0 +1,97 @@
+import json
+import unittest
+
+from socketlabs.injectionapi import SocketLabsClient
+from socketlabs.injectionapi.core.injectionrequestserializer import InjectionRequestSerializer
+from socketlabs.injectionapi.message.bulkmessage import BulkMessage
+from socketlabs.injectionapi.message.bulkrecipient import BulkRecipient
+from socketlabs.injectionapi.preparedbulkmessage import PreparedBulkMessage
+from socketlabs.injectionapi.sendresult import SendResult
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class TestPreparedBulkMessage(unittest.TestCase):
+    """
+    Testing the PreparedBulkMessage template and its use by the SocketLabsClient
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+        self.server_id = self.random_helper.random_server_id()
+        self.api_key = self.random_helper.random_string(20)
+
+    def build_recipients(self, count: int):
+        return [BulkRecipient(self.random_helper.random_email_string(), merge_data={"Name": str(index)})
+                for index in range(count)]
+
+    def build_message(self, recipient_count: int):
+        message = BulkMessage()
+        message.subject = self.random_helper.random_string(10)
+        message.html_body = "<p>%%Name%%</p>"
+        message.from_email_address = self.random_helper.random_email_address()
+        message.add_global_merge_data("Campaign", "Spring")
+        message.add_metadata("key", self.random_helper.random_string(10))
+        message.to_recipient = self.build_recipients(recipient_count)
+        return message
+
+    def test_serialize_prepared_MatchesBulkMessage(self):
+        # Arrange
+        message = self.build_message(5)
+        serializer = InjectionRequestSerializer(self.server_id, self.api_key)
+
+        # Act
+        body = serializer.serialize_prepared(PreparedBulkMessage(message))
+
+        # Assert
+        self.assertEqual(serializer.serialize(message).to_bytes(), body.to_bytes())
+
+    def test_for_recipients_SharesSerializedContent(self):
+        # Arrange
+        prepared = PreparedBulkMessage(self.build_message(0))
+        recipients = self.build_recipients(3)
+        serializer = InjectionRequestSerializer(self.server_id, self.api_key)
+
+        # Act
+        first = serializer.serialize_prepared(prepared.for_recipients(recipients[:2]))
+        second = serializer.serialize_prepared(prepared.for_recipients(recipients[2:]))
+
+        # Assert
+        self.assertIs(prepared.head[0], prepared.for_recipients(recipients).head[0])
+        self.assertIn(prepared.head[-1], first.segments)
+        self.assertIn(prepared.head[-1], second.segments)
+        sent = json.loads(second.to_bytes().decode("utf-8"))["messages"][0]["mergeData"]["perMessage"]
+        self.assertEqual(1, len(sent))
+        self.assertIn({"field": "DeliveryAddress", "value": recipients[2].email_address}, sent[0])
+
+    def test_send_ReturnsValidationResult_WhenContentIsInvalid(self):
+        # Arrange
+        message = self.build_message(1)
+        message.subject = None
+        client = SocketLabsClient(self.server_id, self.api_key)
+
+        # Act
+        response = client.send(PreparedBulkMessage(message))
+
+        # Assert
+        self.assertEqual(SendResult.MessageValidationEmptySubject, response.result)
+
+    def test_send_SendsEachBatchOfRecipients(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = SocketLabsClient(self.server_id, self.api_key)
+            client.endpoint = server.endpoint
+            prepared = PreparedBulkMessage(self.build_message(0))
+            recipients = self.build_recipients(120)
+
+            # Act
+            responses = [client.send(prepared.for_recipients(recipients[start:start + 50]))
+                         for start in range(0, len(recipients), 50)]
+            campaign = client.send_bulk_campaign(prepared.for_recipients(recipients))
+            client.close()
+
+            # Assert
+            self.assertEqual([SendResult.Success] * 3, [r.result for r in responses])
+            self.assertEqual(SendResult.Success, campaign.result)
+            sent = [json.loads(body.decode("utf-8"))["messages"][0] for _, body in server.requests]
+            self.assertEqual(240, sum(len(m["mergeData"]["perMessage"]) for m in sent))
@@ -0,0 +1,90 @@
+import threading
+import time
+import unittest
+
+from socketlabs.injectionapi.ratelimiter import RateLimiter
+from socketlabs.injectionapi.sendresult import SendResult
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class TestRateLimiter(unittest.TestCase):
+    """
+    Testing the token-bucket RateLimiter
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+
+    def test_reserve_AllowsBurst_ThenSpacesSends(self):
+        # Arrange
+        limiter = RateLimiter(messages_per_second=10, message_burst=3)
+
+        # Act
+        waits = [limiter.reserve() for _ in range(5)]
+
+        # Assert
+        self.assertEqual([0.0, 0.0, 0.0], waits[:3])
+        self.assertAlmostEqual(0.1, waits[3], delta=0.02)
+        self.assertAlmostEqual(0.2, waits[4], delta=0.02)
+
+    def test_reserve_WaitsForSlowestBucket(self):
+        # Arrange
+        limiter = RateLimiter(messages_per_second=100, recipients_per_second=10, recipient_burst=10)
+
+        # Act
+        first = limiter.reserve(1, 10)
+        second = limiter.reserve(1, 5)
+
+        # Assert
+        self.assertEqual(0.0, first)
+        self.assertAlmostEqual(0.5, second, delta=0.05)
+
+    def test_reserve_SpacesReservationsFromManyThreads(self):
+        # Arrange
+        limiter = RateLimiter(messages_per_second=100, message_burst=1)
+        waits = []
+        lock = threading.Lock()
+
+        def reserve():
+            wait = limiter.reserve()
+            with lock:
+                waits.append(wait)
+
+        # Act
+        threads = [threading.Thread(target=reserve) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        self.assertAlmostEqual(0.19, max(waits), delta=0.05)
+        self.assertEqual(20, len(set(round(w, 3) for w in waits)))
+
+    def test_rate_limiter_Raises_WhenRateIsNotPositive(self):
+        with self.assertRaises(AttributeError):
+            RateLimiter(messages_per_second=0)
+
+    def test_send_and_send_async_ShareClientRateLimiter(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            limiter = RateLimiter(messages_per_second=20, message_burst=1)
+            clients = []
+            for _ in range(2):
+                client = self.random_helper.random_client(server)
+                client.rate_limiter = limiter
+                clients.append(client)
+
+            # Act
+            start = time.monotonic()
+            futures = [clients[0].send_async(self.random_helper.random_basic_message(2)) for _ in range(3)]
+            responses = [clients[1].send(self.random_helper.random_basic_message(2)) for _ in range(3)]
+            responses += [future.result() for future in futures]
+            elapsed = time.monotonic() - start
+            for client in clients:
+                client.close()
+
+            # Assert
+            self.assertEqual([SendResult.Success] * 6, [r.result for r in responses])
+            self.assertGreaterEqual(elapsed, 0.22)
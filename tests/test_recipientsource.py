@@ -0,0 +1,113 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from socketlabs.injectionapi.core.injectionrequestserializer import InjectionRequestSerializer
+from socketlabs.injectionapi.message.bulkmessage import BulkMessage
+from socketlabs.injectionapi.message.bulkrecipient import BulkRecipient
+from socketlabs.injectionapi.message.csvrecipientsource import CsvRecipientSource
+from socketlabs.injectionapi.message.cursorrecipientsource import CursorRecipientSource
+from socketlabs.injectionapi.sendresult import SendResult
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class TestRecipientSource(unittest.TestCase):
+    """
+    Testing recipients read lazily from iterables, CSV files and DB-API cursors
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+
+    def build_message(self):
+        message = BulkMessage()
+        message.subject = self.random_helper.random_string(10)
+        message.html_body = "<p>%%FirstName%%</p>"
+        message.from_email_address = self.random_helper.random_email_address()
+        return message
+
+    def test_csv_source_MapsColumnsToMergeFields(self):
+        # Arrange
+        handle, file_path = tempfile.mkstemp(suffix=".csv")
+        email = self.random_helper.random_email_string()
+        with os.fdopen(handle, "w", newline="") as f:
+            f.write("Email,Name,First,Color,Unused\n{0},Recipient One,One,Green,x\n".format(email))
+        source = CsvRecipientSource(file_path, email_column="Email", name_column="Name",
+                                    merge_fields={"First": "FirstName", "Color": "FavoriteColor"})
+
+        # Act
+        recipients = list(source)
+        os.remove(file_path)
+
+        # Assert
+        self.assertEqual(1, len(recipients))
+        self.assertEqual(email, recipients[0].email_address)
+        self.assertEqual("Recipient One", recipients[0].friendly_name)
+        self.assertEqual({"FirstName": "One", "FavoriteColor": "Green"}, recipients[0].merge_data)
+
+    def test_cursor_source_AddsOtherColumns_WhenMergeFieldsNotSet(self):
+        # Arrange
+        connection = sqlite3.connect(":memory:")
+        connection.execute("CREATE TABLE customers (email TEXT, first_name TEXT, visits INTEGER)")
+        rows = [(self.random_helper.random_email_string(), "Name {0}".format(i), i) for i in range(5)]
+        connection.executemany("INSERT INTO customers VALUES (?, ?, ?)", rows)
+        cursor = connection.execute("SELECT email, first_name, visits FROM customers ORDER BY visits")
+
+        # Act
+        recipients = list(CursorRecipientSource(cursor, fetch_size=2))
+        connection.close()
+
+        # Assert
+        self.assertEqual([row[0] for row in rows], [r.email_address for r in recipients])
+        self.assertEqual({"first_name": "Name 3", "visits": "3"}, recipients[3].merge_data)
+
+    def test_serialize_bulk_chunks_ReadsRecipientsOneChunkAtATime(self):
+        # Arrange
+        read = []
+
+        def recipients():
+            for index in range(1000):
+                read.append(index)
+                yield self.random_helper.random_email_string()
+
+        serializer = InjectionRequestSerializer(self.random_helper.random_server_id(), "")
+        chunks = serializer.serialize_bulk_chunks(self.build_message(), 50, recipients())
+
+        # Act
+        chunk, _ = next(chunks)
+
+        # Assert
+        self.assertEqual(50, len(chunk))
+        self.assertIsInstance(chunk[0], BulkRecipient)
+        self.assertLessEqual(len(read), 51)
+
+    def test_send_bulk_campaign_SendsRecipientsFromGenerator(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            recipients = (BulkRecipient(self.random_helper.random_email_string(), merge_data={"FirstName": str(i)})
+                          for i in range(120))
+
+            # Act
+            response = client.send_bulk_campaign(self.build_message(), recipients)
+            client.close()
+
+            # Assert
+            self.assertEqual(SendResult.Success, response.result)
+            self.assertEqual(3, len(response.chunk_responses))
+            sent = [json.loads(body.decode("utf-8"))["messages"][0] for _, body in server.requests]
+            self.assertEqual(120, sum(len(m["mergeData"]["perMessage"]) for m in sent))
+
+    def test_send_bulk_campaign_ReturnsMissingTo_WhenSourceIsEmpty(self):
+        # Arrange
+        client = self.random_helper.random_client()
+
+        # Act
+        response = client.send_bulk_campaign(self.build_message(), iter([]))
+        client.close()
+
+        # Assert
+        self.assertEqual(SendResult.RecipientValidationMissingTo, response.result)
@@ -0,0 +1,137 @@
+import json
+import unittest
+
+from socketlabs.injectionapi.core.injectionrequestserializer import InjectionRequestSerializer
+from socketlabs.injectionapi.message.bulkmessage import BulkMessage
+from socketlabs.injectionapi.message.bulkrecipient import BulkRecipient
+from socketlabs.injectionapi.message.recipienttable import RecipientTable
+from socketlabs.injectionapi.sendresult import SendResult
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class TestRecipientTable(unittest.TestCase):
+    """
+    Testing the columnar RecipientTable and its serialization
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+
+    def build_message(self):
+        message = BulkMessage()
+        message.subject = self.random_helper.random_string(10)
+        message.html_body = "<p>%%FirstName%%</p>"
+        message.from_email_address = self.random_helper.random_email_address()
+        return message
+
+    def build_recipients(self, count: int):
+        recipients = []
+        for index in range(count):
+            merge_data = {"FirstName": self.random_helper.random_string(10)}
+            if index % 2 == 0:
+                merge_data["FavoriteColor"] = self.random_helper.random_string(10)
+            name = self.random_helper.random_string(10) if index % 3 == 0 else None
+            recipients.append(BulkRecipient(self.random_helper.random_email_string(), name, merge_data))
+        return recipients
+
+    def test_serialize_MatchesBulkRecipientList(self):
+        # Arrange
+        recipients = self.build_recipients(7)
+        message = self.build_message()
+        message.to_recipient = recipients
+        table_message = self.build_message()
+        table_message.subject = message.subject
+        table_message.from_email_address = message.from_email_address
+        table_message.to_recipient = RecipientTable.from_recipients(recipients)
+        serializer = InjectionRequestSerializer(self.random_helper.random_server_id(), "")
+
+        # Act
+        body = serializer.serialize(table_message).to_bytes()
+
+        # Assert
+        self.assertIsInstance(table_message.to_recipient, RecipientTable)
+        self.assertEqual(serializer.serialize(message).to_bytes(), body)
+
+    def test_add_row_StoresFieldNamesOnce(self):
+        # Arrange
+        table = RecipientTable(["".join(["First", "Name"])])
+
+        # Act
+        table.add_row(self.random_helper.random_email_string(), values=["One"])
+        table.add_row(self.random_helper.random_email_string(), merge_data={"FavoriteColor": "Green"})
+        recipients = list(table)
+
+        # Assert
+        self.assertEqual(["FirstName", "FavoriteColor"], table.fields)
+        self.assertEqual(["One", None], table.column("FirstName"))
+        self.assertEqual({"FavoriteColor": "Green"}, recipients[1].merge_data)
+        self.assertIs(table.fields[0], list(recipients[0].merge_data)[0])
+        self.assertIs(table.fields[0], table[:1].fields[0])
+
+    def test_slice_DoesNotShareFields_WithTable(self):
+        # Arrange
+        table = RecipientTable(["FirstName"])
+        table.add_row(self.random_helper.random_email_string(), values=["One"])
+        table.add_row(self.random_helper.random_email_string(), values=["Two"])
+
+        # Act
+        part = table[:1]
+        part.add_row(self.random_helper.random_email_string(), merge_data={"FavoriteColor": "Green"})
+        recipients = list(table)
+
+        # Assert
+        self.assertEqual(["FirstName"], table.fields)
+        self.assertEqual(["FirstName", "FavoriteColor"], part.fields)
+        self.assertEqual([{"FirstName": "One"}, {"FirstName": "Two"}], [r.merge_data for r in recipients])
+
+    def test_add_to_recipient_AppendsToTable(self):
+        # Arrange
+        message = self.build_message()
+        message.to_recipient = RecipientTable()
+        email = self.random_helper.random_email_string()
+
+        # Act
+        message.add_to_recipient(email, "Recipient One", {"FirstName": "One"})
+
+        # Assert
+        self.assertEqual(1, len(message.to_recipient))
+        self.assertEqual(email, message.to_recipient[0].email_address)
+        self.assertEqual({"FirstName": "One"}, message.to_recipient[-1].merge_data)
+
+    def test_send_bulk_campaign_SendsTableInChunks(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            table = RecipientTable(["FirstName"])
+            for index in range(120):
+                table.add_row(self.random_helper.random_email_string(), values=[str(index)])
+            message = self.build_message()
+            message.to_recipient = table
+
+            # Act
+            response = client.send_bulk_campaign(message)
+            client.close()
+
+            # Assert
+            self.assertEqual(SendResult.Success, response.result)
+            self.assertEqual(3, len(response.chunk_responses))
+            sent = [json.loads(body.decode("utf-8"))["messages"][0] for _, body in server.requests]
+            per_message = [row for m in sent for row in m["mergeData"]["perMessage"]]
+            # the chunks are sent concurrently, so they can arrive in any order
+            values = sorted(int(f["value"]) for row in per_message for f in row if f["field"] == "FirstName")
+            self.assertEqual(list(range(120)), values)
+
+    def test_send_ReturnsInvalidRecipients_WhenTableHasInvalidAddress(self):
+        # Arrange
+        client = self.random_helper.random_client()
+        message = self.build_message()
+        message.to_recipient = RecipientTable()
+        message.to_recipient.add_row(self.random_helper.random_string(10))
+
+        # Act
+        response = client.send(message)
+        client.close()
+
+        # Assert
+        self.assertEqual(SendResult.RecipientValidationInvalidRecipients, response.result)
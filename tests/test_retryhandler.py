@@ -0,0 +1,168 @@
+import asyncio
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from socketlabs.injectionapi import AsyncSocketLabsClient
+from socketlabs.injectionapi.core.httpresponse import HttpResponse
+from socketlabs.injectionapi.core.retryhandler import RetryHandler, get_retry_after
+from socketlabs.injectionapi.core.sendexecutor import SendExecutor
+from socketlabs.injectionapi.retrysettings import RetrySettings
+from socketlabs.injectionapi.sendresult import SendResult
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class TestRetryHandler(unittest.TestCase):
+    """
+    Testing throttling responses and Retry-After handling in the RetryHandler
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+
+    def build_client(self, server, retries: int):
+        client = self.random_helper.random_client(server)
+        client.number_of_retries = retries
+        return client
+
+    def test_get_retry_after_ReturnsSeconds_WhenHeaderIsDelay(self):
+        # Arrange
+        response = HttpResponse(429, headers=[("Retry-After", "7")])
+
+        # Act
+        actual = get_retry_after(response)
+
+        # Assert
+        self.assertEqual(7.0, actual)
+
+    def test_get_retry_after_ReturnsSecondsUntilDate_WhenHeaderIsHttpDate(self):
+        # Arrange
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        response = HttpResponse(503, headers=[("Retry-After", format_datetime(retry_at, usegmt=True))])
+
+        # Act
+        actual = get_retry_after(response)
+
+        # Assert
+        self.assertAlmostEqual(30, actual, delta=2)
+
+    def test_get_retry_after_ReturnsNone_WhenHeaderIsMissingOrInvalid(self):
+        self.assertIsNone(get_retry_after(HttpResponse(429)))
+        self.assertIsNone(get_retry_after(HttpResponse(429, headers=[("Retry-After", "soon")])))
+
+    def test_can_retry_ReturnsFalse_WhenWaitPassesDeadline(self):
+        # Arrange
+        settings = RetrySettings(3, deadline=timedelta(seconds=10))
+
+        # Act / Assert
+        self.assertTrue(settings.can_retry(0, 2, 5))
+        self.assertFalse(settings.can_retry(0, 6, 5))
+        self.assertFalse(settings.can_retry(3, 0, 0))
+        self.assertFalse(settings.can_retry(0, 61, 0))
+
+    def test_send_WaitsForRetryAfter_WhenThrottled(self):
+        with MockInjectionServer(replies=[(429, {"Retry-After": "1"})]) as server:
+            # Arrange
+            client = self.build_client(server, 2)
+
+            # Act
+            start = time.monotonic()
+            response = client.send(self.random_helper.random_basic_message())
+            elapsed = time.monotonic() - start
+            client.close()
+
+            # Assert
+            self.assertEqual(SendResult.Success, response.result)
+            self.assertEqual(2, len(server.requests))
+            self.assertGreaterEqual(elapsed, 1)
+
+    def test_send_ReturnsOverQuota_WhenRetryAfterPassesDeadline(self):
+        with MockInjectionServer(replies=[(429, {"Retry-After": "30"})]) as server:
+            # Arrange
+            client = self.build_client(server, 2)
+            client.send_deadline = 5
+
+            # Act
+            response = client.send(self.random_helper.random_basic_message())
+            client.close()
+
+            # Assert
+            self.assertEqual(SendResult.OverQuota, response.result)
+            self.assertEqual(1, len(server.requests))
+
+    def test_send_ReturnsOverQuota_WhenThrottledWithoutRetries(self):
+        with MockInjectionServer(status=429) as server:
+            # Arrange
+            client = self.build_client(server, 0)
+
+            # Act
+            response = client.send(self.random_helper.random_basic_message())
+            client.close()
+
+            # Assert
+            self.assertEqual(SendResult.OverQuota, response.result)
+
+    def test_send_ReturnsInternalError_WhenServiceUnavailableWithoutRetries(self):
+        with MockInjectionServer(status=503) as server:
+            # Arrange
+            client = self.build_client(server, 0)
+
+            # Act
+            response = client.send(self.random_helper.random_basic_message())
+            client.close()
+
+            # Assert
+            self.assertEqual(SendResult.InternalError, response.result)
+
+    def test_send_async_StartsDeadline_WhenFirstAttemptStarts(self):
+        # Arrange
+        deadlines = []
+
+        class FakeHttpRequest(object):
+            def send_async_request(self, request, on_success_callback, on_error_callback, deadline=None, event=None):
+                deadlines.append(deadline)
+
+        retry_handler = RetryHandler(FakeHttpRequest(), RetrySettings(1, deadline=timedelta(seconds=10)))
+        time.sleep(0.5)
+
+        # Act
+        start = time.monotonic()
+        retry_handler.send_async(None, self.fail, self.fail)
+
+        # Assert
+        self.assertAlmostEqual(start + 10, deadlines[0], delta=0.2)
+
+    def test_send_async_Retries_WhenSendExecutorIsReplacedBeforeRetry(self):
+        with MockInjectionServer(replies=[(429, {"Retry-After": "1"})]) as server:
+            # Arrange
+            client = self.build_client(server, 1)
+            previous = client.send_executor
+
+            # Act
+            future = client.send_async(self.random_helper.random_basic_message())
+            time.sleep(0.5)
+            client.send_executor = SendExecutor()
+            response = future.result(timeout=10)
+            client.close()
+
+            # Assert
+            self.assertEqual(SendResult.Success, response.result)
+            self.assertEqual(2, len(server.requests))
+            self.assertEqual(0, previous.pending_count)
+
+    def test_async_send_RetriesAfterDelay_WhenThrottled(self):
+        with MockInjectionServer(replies=[(429, {"Retry-After": "0"}), (503, {})]) as server:
+            # Arrange
+            async def send():
+                async with self.random_helper.random_client(server, AsyncSocketLabsClient) as client:
+                    client.number_of_retries = 2
+                    return await client.send(self.random_helper.random_basic_message())
+
+            # Act
+            response = asyncio.run(send())
+
+            # Assert
+            self.assertEqual(SendResult.Success, response.result)
+            self.assertEqual(3, len(server.requests))
@@ -0,0 +1,81 @@
+import threading
+import time
+import unittest
+
+from socketlabs.injectionapi.core.retryscheduler import RetryScheduler
+from socketlabs.injectionapi.core.sendexecutor import SendExecutor
+from socketlabs.injectionapi.sendresult import SendResult
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class TestRetryScheduler(unittest.TestCase):
+    """
+    Testing the RetryScheduler and the scheduled retries of send_async
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+
+    def test_schedule_RunsCallablesInDueOrder(self):
+        # Arrange
+        scheduler = RetryScheduler()
+        ran = []
+        done = threading.Event()
+
+        # Act
+        scheduler.schedule(0.2, lambda: (ran.append("late"), done.set()))
+        scheduler.schedule(0.05, ran.append, "early")
+        scheduler.schedule(0, ran.append, "now")
+        done.wait(2)
+        scheduler.shutdown()
+
+        # Assert
+        self.assertEqual(["now", "early", "late"], ran)
+        self.assertEqual(0, scheduler.pending_count)
+
+    def test_schedule_Raises_AfterShutdown(self):
+        # Arrange
+        scheduler = RetryScheduler()
+        scheduler.shutdown()
+
+        # Act / Assert
+        with self.assertRaises(RuntimeError):
+            scheduler.schedule(0, print)
+
+    def test_send_async_DoesNotHoldWorker_WhileWaitingToRetry(self):
+        with MockInjectionServer(replies=[(503, {"Retry-After": "1"})]) as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            client.number_of_retries = 1
+            client.send_executor = SendExecutor(max_workers=1)
+
+            # Act
+            start = time.monotonic()
+            retried = client.send_async(self.random_helper.random_basic_message())
+            time.sleep(0.2)
+            other = client.send_async(self.random_helper.random_basic_message())
+            other_response = other.result(timeout=5)
+            other_elapsed = time.monotonic() - start
+            retried_response = retried.result(timeout=5)
+            client.close()
+
+            # Assert
+            self.assertEqual(SendResult.Success, other_response.result)
+            self.assertLess(other_elapsed, 0.9)
+            self.assertEqual(SendResult.Success, retried_response.result)
+            self.assertEqual(3, len(server.requests))
+
+    def test_close_WaitsForScheduledRetries(self):
+        with MockInjectionServer(replies=[(503, {"Retry-After": "0"})]) as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            client.number_of_retries = 1
+            future = client.send_async(self.random_helper.random_basic_message())
+
+            # Act
+            client.close()
+
+            # Assert
+            self.assertTrue(future.done())
+            self.assertEqual(SendResult.Success, future.result().result)
@@ -0,0 +1,102 @@
+import threading
+import unittest
+
+from socketlabs.injectionapi import SocketLabsClient
+from socketlabs.injectionapi.backpressurepolicy import BackpressurePolicy
+from socketlabs.injectionapi.core.sendexecutor import SendExecutor, SendQueueFullException
+from socketlabs.injectionapi.message.basicmessage import BasicMessage
+from socketlabs.injectionapi.sendresult import SendResult
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class TestSendExecutor(unittest.TestCase):
+    """
+    Testing SocketLabsClient.send_async on the bounded SendExecutor
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+
+    def test_send_async_ReturnsFutureOfSendResponse_AndCallsOnSuccess(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            client.send_executor = SendExecutor(max_workers=2, max_queue_size=10)
+            succeeded = []
+
+            # Act
+            messages = [self.random_helper.random_basic_message(2) for _ in range(10)]
+            futures = [client.send_async(message, succeeded.append, self.fail) for message in messages]
+            responses = [future.result(timeout=10) for future in futures]
+            client.close()
+
+            # Assert
+            for response in responses:
+                self.assertEqual(SendResult.Success, response.result)
+            self.assertEqual(10, len(succeeded))
+            self.assertEqual(10, len(server.requests))
+
+    def test_send_async_AllowsCallbackToQueueSend_WhenQueueIsFullAndPolicyIsBlock(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            client.send_executor = SendExecutor(1, 1, BackpressurePolicy.Block)
+            queued = threading.Event()
+            follow_ups = []
+
+            def on_success(response):
+                follow_ups.append(client.send_async(self.random_helper.random_basic_message()))
+                queued.set()
+
+            # Act
+            client.send_async(self.random_helper.random_basic_message(), on_success, self.fail)
+            follow_up_queued = queued.wait(timeout=10)
+
+            # Assert
+            self.assertTrue(follow_up_queued)
+            self.assertEqual(SendResult.Success, follow_ups[0].result(timeout=10).result)
+            client.close()
+            self.assertEqual(2, len(server.requests))
+
+    def test_send_async_ReturnsValidationResult_WhenMessageIsInvalid(self):
+        # Arrange
+        client = self.random_helper.random_client()
+
+        # Act
+        future = client.send_async(BasicMessage())
+
+        # Assert
+        self.assertEqual(SendResult.MessageValidationEmptySubject, future.result(timeout=10).result)
+        client.close()
+
+    def test_send_async_RaisesSendQueueFullException_WhenQueueIsFullAndPolicyIsRaise(self):
+        # Arrange
+        client = self.random_helper.random_client()
+        client.send_executor = SendExecutor(1, 1, BackpressurePolicy.Raise)
+        client.send_executor.reserve()
+        metrics = client.metrics
+
+        # Act / Assert
+        with self.assertRaises(SendQueueFullException):
+            client.send_async(self.random_helper.random_basic_message(2))
+        self.assertEqual(0, metrics.get("socketlabs_sends_in_flight").get())
+        self.assertEqual(1, metrics.get("socketlabs_sends_total").get({"result": "Exception"}))
+        client.send_executor.release()
+        client.close()
+
+    def test_send_async_FailsFutureAndCallsOnError_WhenQueueIsFullAndPolicyIsDrop(self):
+        # Arrange
+        client = self.random_helper.random_client()
+        client.send_executor = SendExecutor(1, 1, BackpressurePolicy.Drop)
+        client.send_executor.reserve()
+        errors = []
+
+        # Act
+        future = client.send_async(self.random_helper.random_basic_message(2), self.fail, errors.append)
+
+        # Assert
+        self.assertIsInstance(future.exception(timeout=10), SendQueueFullException)
+        self.assertEqual(1, len(errors))
+        client.send_executor.release()
+        client.close()
@@ -0,0 +1,126 @@
+import json
+import unittest
+
+from socketlabs.injectionapi import SocketLabsClient
+from socketlabs.injectionapi.core.injectionresponseparser import InjectionResponseParser
+from socketlabs.injectionapi.message.basicmessage import BasicMessage
+from socketlabs.injectionapi.sendresult import SendResult
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class TestSendMany(unittest.TestCase):
+    """
+    Testing SocketLabsClient.send_many and InjectionResponseParser.parse_many
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+
+    """ parse_many """
+
+    def test_parse_many_ReturnsResultForEveryMessage_WhenRequestSucceeded(self):
+        # Arrange
+        response = json.dumps({"ErrorCode": "Success", "MessageResults": [], "TransactionReceipt": None})
+
+        # Act
+        actual = InjectionResponseParser.parse_many(response, 200, 3)
+
+        # Assert
+        self.assertEqual([SendResult.Success] * 3, [r.result for r in actual])
+
+    def test_parse_many_MapsMessageResultsByIndex_WhenRequestHasWarnings(self):
+        # Arrange
+        response = json.dumps({
+            "ErrorCode": "Warning",
+            "TransactionReceipt": "receipt",
+            "MessageResults": [{
+                "Index": 1,
+                "ErrorCode": "NoValidRecipients",
+                "AddressResults": [{"EmailAddress": "bad@example", "Accepted": False, "ErrorCode": "InvalidAddress"}]
+            }]
+        })
+
+        # Act
+        actual = InjectionResponseParser.parse_many(response, 200, 3)
+
+        # Assert
+        self.assertEqual([SendResult.Success, SendResult.NoValidRecipients, SendResult.Success],
+                         [r.result for r in actual])
+        self.assertEqual(1, len(actual[1].address_results))
+        self.assertEqual("bad@example", actual[1].address_results[0].email_address)
+        self.assertEqual("receipt", actual[2].transaction_receipt)
+
+    def test_parse_many_AppliesRequestResultToEveryMessage_WhenRequestFailed(self):
+        # Arrange
+        response = json.dumps({"ErrorCode": "InvalidAuthentication", "MessageResults": None})
+
+        # Act
+        actual = InjectionResponseParser.parse_many(response, 200, 2)
+
+        # Assert
+        self.assertEqual([SendResult.InvalidAuthentication] * 2, [r.result for r in actual])
+
+    """ send_many """
+
+    def test_send_many_PacksMessagesIntoRequests_WithinMessageBudget(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            messages = [self.random_helper.random_basic_message() for _ in range(7)]
+
+            # Act
+            responses = client.send_many(messages, max_messages_per_request=3)
+            client.close()
+
+            # Assert
+            self.assertEqual([SendResult.Success] * 7, [r.result for r in responses])
+            sent = [json.loads(body.decode("utf-8"))["messages"] for _, body in server.requests]
+            self.assertEqual([3, 3, 1], sorted((len(m) for m in sent), reverse=True))
+
+    def test_send_many_ReturnsValidationResult_ForInvalidMessagesOnly(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            messages = [self.random_helper.random_basic_message(), BasicMessage(),
+                        self.random_helper.random_basic_message()]
+
+            # Act
+            responses = client.send_many(messages)
+            client.close()
+
+            # Assert
+            self.assertEqual([SendResult.Success, SendResult.MessageValidationEmptySubject, SendResult.Success],
+                             [r.result for r in responses])
+            self.assertEqual(1, len(server.requests))
+            self.assertEqual(2, len(json.loads(server.requests[0][1].decode("utf-8"))["messages"]))
+
+    def test_send_many_RaisesException_AndReleasesSlots_WhenClientIsClosed(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            metrics = client.metrics
+            client.close()
+
+            # Act / Assert
+            with self.assertRaises(RuntimeError):
+                messages = [self.random_helper.random_basic_message() for _ in range(3)]
+                client.send_many(messages, max_messages_per_request=1)
+            self.assertEqual(0, client.send_executor.pending_count)
+            self.assertEqual(0, metrics.get("socketlabs_sends_in_flight").get())
+            self.assertEqual(0, len(server.requests))
+
+    def test_send_many_ReturnsAndLogsUnknownError_WhenBatchRequestFails(self):
+        with MockInjectionServer(replies=[(None, {})]) as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            messages = [self.random_helper.random_basic_message() for _ in range(2)]
+
+            # Act
+            with self.assertLogs("socketlabs.injectionapi.socketlabsclient", level="ERROR") as logs:
+                responses = client.send_many(messages)
+            client.close()
+
+            # Assert
+            self.assertEqual([SendResult.UnknownError] * 2, [r.result for r in responses])
+            self.assertEqual(1, len(logs.records))
@@ -0,0 +1,157 @@
+import asyncio
+import unittest
+
+from socketlabs.injectionapi import AsyncSocketLabsClient
+from socketlabs.injectionapi.sendobserver import SendObserver
+from socketlabs.injectionapi.sendphase import SendPhase
+from socketlabs.injectionapi.sendresult import SendResult
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class RecordingObserver(SendObserver):
+
+    def __init__(self):
+        self.started = []
+        self.completed = []
+
+    def on_send_start(self, event):
+        self.started.append(event)
+
+    def on_send_complete(self, event):
+        self.completed.append(event)
+
+
+class FailingObserver(SendObserver):
+
+    def on_send_complete(self, event):
+        raise Exception("observer failed")
+
+
+class TestSendObserver(unittest.TestCase):
+    """
+    Testing the SendEvent given to the observers of the clients
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+
+    def test_send_RecordsPhasesSizesAndResult(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            observer = RecordingObserver()
+            client.add_observer(observer)
+            message = self.random_helper.random_basic_message(2)
+
+            # Act
+            response = client.send(message)
+            client.close()
+
+            # Assert
+            self.assertEqual(1, len(observer.started))
+            event = observer.completed[0]
+            self.assertIs(observer.started[0], event)
+            self.assertIs(message, event.message)
+            self.assertIs(response, event.response)
+            self.assertEqual(SendResult.Success, event.result)
+            self.assertEqual(2, event.recipient_count)
+            self.assertEqual(1, event.attempts)
+            self.assertEqual(200, event.status_code)
+            self.assertEqual(len(server.requests[0][1]), event.request_bytes)
+            self.assertGreater(event.response_bytes, 0)
+            for phase in [SendPhase.Validate, SendPhase.Serialize, SendPhase.Connect, SendPhase.Write,
+                          SendPhase.Wait, SendPhase.Read, SendPhase.Parse]:
+                self.assertIn(phase, event.timings)
+            self.assertNotIn(SendPhase.Backoff, event.timings)
+            self.assertGreaterEqual(event.duration, sum(event.timings.values()))
+
+    def test_send_CountsRetryAttempts(self):
+        with MockInjectionServer(replies=[(503, {"Retry-After": "0"})]) as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            client.number_of_retries = 2
+            observer = RecordingObserver()
+            client.add_observer(observer)
+
+            # Act
+            client.send(self.random_helper.random_basic_message(2))
+            client.close()
+
+            # Assert
+            event = observer.completed[0]
+            self.assertEqual(2, event.attempts)
+            self.assertIn(SendPhase.Backoff, event.timings)
+            self.assertEqual(SendResult.Success, event.result)
+
+    def test_send_CompletesEvent_WhenValidationFails(self):
+        # Arrange
+        client = self.random_helper.random_client()
+        observer = RecordingObserver()
+        client.add_observer(observer)
+        message = self.random_helper.random_basic_message(2)
+        message.subject = None
+
+        # Act
+        response = client.send(message)
+        client.close()
+
+        # Assert
+        event = observer.completed[0]
+        self.assertEqual(response.result, event.result)
+        self.assertEqual(0, event.attempts)
+        self.assertEqual([SendPhase.Validate], list(event.timings))
+
+    def test_send_IgnoresObserverExceptions(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            observer = RecordingObserver()
+            client.add_observer(FailingObserver())
+            client.add_observer(observer)
+
+            # Act
+            response = client.send(self.random_helper.random_basic_message(2))
+            client.remove_observer(observer)
+            client.send(self.random_helper.random_basic_message(2))
+            client.close()
+
+            # Assert
+            self.assertEqual(SendResult.Success, response.result)
+            self.assertEqual(1, len(observer.completed))
+
+    def test_send_async_CompletesEventBeforeFuture(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            observer = RecordingObserver()
+            client.add_observer(observer)
+
+            # Act
+            response = client.send_async(self.random_helper.random_basic_message(2)).result(timeout=10)
+            client.close()
+
+            # Assert
+            event = observer.completed[0]
+            self.assertIs(response, event.response)
+            self.assertEqual(1, event.attempts)
+            self.assertIn(SendPhase.Wait, event.timings)
+
+    def test_async_client_send_RecordsPhases(self):
+        with MockInjectionServer() as server:
+            # Arrange
+            client = self.random_helper.random_client(server, AsyncSocketLabsClient)
+            observer = RecordingObserver()
+            client.add_observer(observer)
+
+            # Act
+            response = asyncio.run(client.send(self.random_helper.random_basic_message(2)))
+            client.close()
+
+            # Assert
+            event = observer.completed[0]
+            self.assertIs(response, event.response)
+            self.assertEqual(1, event.attempts)
+            self.assertEqual(200, event.status_code)
+            for phase in [SendPhase.Connect, SendPhase.Write, SendPhase.Wait, SendPhase.Read, SendPhase.Parse]:
+                self.assertIn(phase, event.timings)
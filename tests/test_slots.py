@@ -0,0 +1,50 @@
+import unittest
+
+from socketlabs.injectionapi.addressresult import AddressResult
+from socketlabs.injectionapi.core.serialization.addressjson import AddressJson
+from socketlabs.injectionapi.core.serialization.attachmentjson import AttachmentJson
+from socketlabs.injectionapi.core.serialization.customheaderjson import CustomHeaderJson
+from socketlabs.injectionapi.core.serialization.mergedatajson import MergeDataJson
+from socketlabs.injectionapi.core.serialization.mergefieldjson import MergeFieldJson
+from socketlabs.injectionapi.core.serialization.messagejson import MessageJson
+from socketlabs.injectionapi.core.serialization.metadatajson import MetadataJson
+from socketlabs.injectionapi.message.bulkrecipient import BulkRecipient
+from socketlabs.injectionapi.message.customheader import CustomHeader
+from socketlabs.injectionapi.message.emailaddress import EmailAddress
+from socketlabs.injectionapi.message.metadata import Metadata
+from tests.random_helper import RandomHelper
+
+
+class TestSlots(unittest.TestCase):
+    """
+    Testing that the message model classes created in large numbers do not carry a per-instance __dict__
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+
+    def test_model_classes_HaveNoInstanceDict(self):
+        # Arrange
+        classes = [AddressResult, AddressJson, AttachmentJson, CustomHeaderJson, MergeDataJson, MergeFieldJson,
+                   MessageJson, MetadataJson, BulkRecipient, CustomHeader, EmailAddress, Metadata]
+
+        # Act
+        instances = [cls() for cls in classes]
+
+        # Assert
+        for instance in instances:
+            self.assertFalse(hasattr(instance, "__dict__"), type(instance).__name__)
+
+    def test_bulk_recipient_KeepsValues(self):
+        # Arrange
+        email = self.random_helper.random_email_string()
+        name = self.random_helper.random_string(10)
+
+        # Act
+        recipient = BulkRecipient(email, name)
+        recipient.add_merge_data("Name", name)
+
+        # Assert
+        self.assertEqual(email, recipient.email_address)
+        self.assertEqual(name, recipient.friendly_name)
+        self.assertEqual({"Name": name}, recipient.merge_data)
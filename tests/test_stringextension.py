@@ -0,0 +1,45 @@
+import unittest
+
+from socketlabs.injectionapi.core.stringextension import StringExtension
+from tests.random_helper import RandomHelper
+
+
+class TestStringExtension(unittest.TestCase):
+    """
+    Testing the email address validation of the StringExtension
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+
+    def test_is_valid_email_address_ReturnsTrue_WhenAddressIsValid(self):
+        # Arrange
+        addresses = [self.random_helper.random_email_string(), "a@b", "a\t@b", "\ta@\nb", "a@" + "b" * 318]
+
+        # Act
+        actual = [StringExtension.is_valid_email_address(address) for address in addresses]
+
+        # Assert
+        self.assertEqual([True] * len(addresses), actual)
+
+    def test_is_valid_email_address_ReturnsFalse_WhenAddressIsInvalid(self):
+        # Arrange
+        addresses = [None, "", "@", "a@", "@b", " @b", "a@\t", "\t\n@b", "ab", "a@@b", "a@b@c",
+                     "a,b@c", "a b@c", "a;b@c", "a@b;", "a@" + "b" * 319]
+
+        # Act
+        actual = [StringExtension.is_valid_email_address(address) for address in addresses]
+
+        # Assert
+        self.assertEqual([False] * len(addresses), actual)
+
+    def test_validate_addresses_MatchesIsValidEmailAddress(self):
+        # Arrange
+        addresses = [self.random_helper.random_email_string(), None, "a@b@c", "a b@c", "\ta@b", "@b",
+                     "a@" + "b" * 318, "a@" + "b" * 319]
+
+        # Act
+        actual = StringExtension.validate_addresses(iter(addresses))
+
+        # Assert
+        self.assertEqual([StringExtension.is_valid_email_address(address) for address in addresses], actual)
@@ -0,0 +1,76 @@
+import asyncio
+import socket
+import time
+import unittest
+
+from socketlabs.injectionapi import AsyncSocketLabsClient
+from socketlabs.injectionapi.sendresult import SendResult
+from tests.mock_server_helper import MockInjectionServer
+from tests.random_helper import RandomHelper
+
+
+class TestTimeouts(unittest.TestCase):
+    """
+    Testing the connect and read timeouts and the send deadline
+    """
+
+    def setUp(self):
+        self.random_helper = RandomHelper()
+
+    def test_send_RaisesTimeout_WhenResponseIsSlowerThanReadTimeout(self):
+        with MockInjectionServer(delay=1) as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            client.read_timeout = 0.2
+            started = time.monotonic()
+
+            # Act / Assert
+            with self.assertRaises(socket.timeout):
+                client.send(self.random_helper.random_basic_message())
+            self.assertLess(time.monotonic() - started, 0.9)
+            client.close()
+
+    def test_send_WaitsForResponse_WhenOnlyConnectTimeoutIsShort(self):
+        with MockInjectionServer(delay=0.3) as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            client.connect_timeout = 0.05
+
+            # Act
+            response = client.send(self.random_helper.random_basic_message())
+            client.close()
+
+            # Assert
+            self.assertEqual(SendResult.Success, response.result)
+
+    def test_send_StopsAtDeadline_WhenAttemptWouldRunPastIt(self):
+        with MockInjectionServer(delay=2) as server:
+            # Arrange
+            client = self.random_helper.random_client(server)
+            client.number_of_retries = 3
+            client.read_timeout = 10
+            client.send_deadline = 0.5
+            started = time.monotonic()
+
+            # Act / Assert
+            with self.assertRaises(socket.timeout):
+                client.send(self.random_helper.random_basic_message())
+            self.assertLess(time.monotonic() - started, 1.5)
+            self.assertEqual(1, len(server.requests))
+            client.close()
+
+    def test_async_send_RaisesTimeout_WhenResponseIsSlowerThanReadTimeout(self):
+        with MockInjectionServer(delay=1) as server:
+            # Arrange
+            client = self.random_helper.random_client(server, AsyncSocketLabsClient)
+            client.read_timeout = 0.2
+
+            async def send():
+                try:
+                    return await client.send(self.random_helper.random_basic_message())
+                finally:
+                    client.close()
+
+            # Act / Assert
+            with self.assertRaises(socket.timeout):
+                asyncio.run(send())